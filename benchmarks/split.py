@@ -0,0 +1,82 @@
+import time
+
+from benchmarks.common import generate_locations
+from traveltimepy.requests.common import Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+    TimeFilterFastRequest,
+)
+from traveltimepy.requests.transportation import DrivingFast
+
+
+def measure(search_count: int, location_count: int, destinations_per_search: int):
+    locations = generate_locations(
+        51.507609, -0.128315, 0.05, "Location", location_count
+    )
+    searches = [
+        TimeFilterFastOneToMany(
+            id=f"search {i}",
+            departure_location_id=locations[i % location_count].id,
+            arrival_location_ids=[
+                locations[(i * destinations_per_search + j) % location_count].id
+                for j in range(destinations_per_search)
+            ],
+            transportation=DrivingFast(),
+            travel_time=1800,
+            properties=[Property.TRAVEL_TIME],
+        )
+        for i in range(search_count)
+    ]
+    request = TimeFilterFastRequest(
+        locations=locations,
+        arrival_searches=TimeFilterFastArrivalSearches(
+            one_to_many=searches, many_to_one=[]
+        ),
+    )
+
+    start = time.perf_counter()
+    parts = request.split_searches(10)
+    split_time = time.perf_counter() - start
+
+    # Building the same parts through validating constructors, as splitting used to
+    start = time.perf_counter()
+    for part in parts:
+        assert isinstance(part, TimeFilterFastRequest)
+        TimeFilterFastRequest(
+            locations=part.locations,
+            arrival_searches=TimeFilterFastArrivalSearches(
+                one_to_many=part.arrival_searches.one_to_many,
+                many_to_one=part.arrival_searches.many_to_one,
+            ),
+        )
+    validated_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for part in parts:
+        assert isinstance(part, TimeFilterFastRequest)
+        TimeFilterFastRequest.model_construct(
+            locations=part.locations,
+            arrival_searches=TimeFilterFastArrivalSearches.model_construct(
+                one_to_many=part.arrival_searches.one_to_many,
+                many_to_one=part.arrival_searches.many_to_one,
+            ),
+        )
+    constructed_time = time.perf_counter() - start
+
+    print(
+        "{0} searches x {1} locations: split in {2:.3f}s, building {3} parts "
+        "{4:.4f}s validated, {5:.4f}s constructed".format(
+            search_count,
+            location_count,
+            split_time,
+            len(parts),
+            validated_time,
+            constructed_time,
+        )
+    )
+
+
+if __name__ == "__main__":
+    measure(1_000, 10_000, 100)
+    measure(1_000, 10_000, 1_000)
@@ -0,0 +1,80 @@
+import time
+
+from benchmarks.common import generate_locations
+from traveltimepy.requests.common import Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+    TimeFilterFastRequest,
+)
+from traveltimepy.requests.transportation import DrivingFast
+
+
+def measure(location_count: int, search_count: int, destinations_per_search: int):
+    locations = generate_locations(
+        51.507609, -0.128315, 0.05, "Location", location_count
+    )
+    searches = [
+        TimeFilterFastOneToMany(
+            id=f"search {i}",
+            departure_location_id=locations[i].id,
+            arrival_location_ids=[
+                locations[(i * destinations_per_search + j) % location_count].id
+                for j in range(destinations_per_search)
+            ],
+            transportation=DrivingFast(),
+            travel_time=1800,
+            properties=[Property.TRAVEL_TIME],
+        )
+        for i in range(search_count)
+    ]
+    request = TimeFilterFastRequest(
+        locations=locations,
+        arrival_searches=TimeFilterFastArrivalSearches(
+            one_to_many=searches, many_to_one=[]
+        ),
+    )
+
+    start = time.perf_counter()
+    parts = request.split_searches(10)
+    split_time = time.perf_counter() - start
+
+    # Before pruning every part carried the full location list
+    unpruned_bytes = sum(
+        len(part.model_copy(update={"locations": locations}).model_dump_json())
+        for part in parts
+    )
+    pruned_bytes = sum(len(part.model_dump_json()) for part in parts)
+
+    start = time.perf_counter()
+    for part in parts:
+        part.model_dump_json()
+    pydantic_time = time.perf_counter() - start
+
+    # Locations shared by parts are serialized once
+    start = time.perf_counter()
+    for part in parts:
+        part.to_json()
+    fragments_time = time.perf_counter() - start
+
+    print(
+        "{0} locations, {1} searches: {2} parts, {3:.1f} MB before, "
+        "{4:.1f} MB after, split in {5:.3f}s, serialized in {6:.3f}s "
+        "({7:.3f}s with model_dump_json)".format(
+            location_count,
+            search_count,
+            len(parts),
+            unpruned_bytes / 1e6,
+            pruned_bytes / 1e6,
+            split_time,
+            fragments_time,
+            pydantic_time,
+        )
+    )
+
+
+if __name__ == "__main__":
+    measure(10_000, 100, 100)
+    measure(10_000, 100, 1_000)
+    measure(100_000, 100, 1_000)
+    measure(300, 300, 299)
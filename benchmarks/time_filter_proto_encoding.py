@@ -0,0 +1,52 @@
+import math
+import time
+from typing import List
+
+import numpy as np
+
+from benchmarks.common import generate_coordinates
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.requests.time_filter_proto import encode_location_deltas
+
+
+def encode_location_deltas_loop(
+    origin: Coordinates, destinations: List[Coordinates]
+) -> List[int]:
+    # Per-destination encoding used before the vectorized encoder
+    mult = math.pow(10, 5)
+    deltas: List[int] = []
+    for destination in destinations:
+        lat_delta = round((destination.lat - origin.lat) * mult)
+        lng_delta = round((destination.lng - origin.lng) * mult)
+        deltas.extend([lat_delta, lng_delta])
+    return deltas
+
+
+def measure(size: int):
+    origin = Coordinates(lat=51.507609, lng=-0.128315)
+    destinations = generate_coordinates(origin.lat, origin.lng, 0.05, size)
+    destinations_array = np.array([[c.lat, c.lng] for c in destinations])
+
+    start = time.perf_counter()
+    encode_location_deltas_loop(origin, destinations)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encode_location_deltas(origin, destinations).tolist()
+    coordinates_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encode_location_deltas(origin, destinations_array).tolist()
+    array_time = time.perf_counter() - start
+
+    print(
+        "{0} destinations: loop {1:.3f}s, coordinates {2:.3f}s, array {3:.3f}s".format(
+            size, loop_time, coordinates_time, array_time
+        )
+    )
+
+
+if __name__ == "__main__":
+    measure(10_000)
+    measure(100_000)
+    measure(1_000_000)
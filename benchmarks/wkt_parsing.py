@@ -0,0 +1,67 @@
+import json
+import math
+import multiprocessing
+import resource
+import time
+
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
+
+
+def generate_response(vertex_count: int, search_count: int) -> bytes:
+    # Circles around central London, split between the searches
+    per_search = vertex_count // search_count
+    results = []
+    for search in range(search_count):
+        points = [
+            (
+                -0.128 + 0.1 * math.cos(2 * math.pi * i / per_search),
+                51.507 + 0.1 * math.sin(2 * math.pi * i / per_search),
+            )
+            for i in range(per_search)
+        ]
+        points.append(points[0])
+        shell = ", ".join(f"{lng} {lat}" for lng, lat in points)
+        results.append(
+            {"search_id": f"search {search}", "shape": f"POLYGON (({shell}))"}
+        )
+    return json.dumps({"results": results}).encode()
+
+
+def parse(mode: str, body: bytes, queue) -> None:
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "models":
+        TimeMapWKTResponse.model_validate_json(body)
+    elif mode == "lazy":
+        TimeMapWKTLazyResponse.model_validate_json(body)
+    else:
+        response = TimeMapWKTLazyResponse.model_validate_json(body)
+        for result in response.results:
+            result.geometry
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux
+    queue.put((elapsed, (rss_after - rss_before) / 1024))
+
+
+def measure(vertex_count: int, search_count: int = 10):
+    body = generate_response(vertex_count, search_count)
+    for mode in ["models", "lazy", "lazy + geometry"]:
+        queue: multiprocessing.Queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=parse, args=(mode, body, queue))
+        process.start()
+        elapsed, rss = queue.get()
+        process.join()
+        print(
+            "{0} vertices, {1}: parsed in {2:.3f}s, peak RSS +{3:.0f} MB".format(
+                vertex_count, mode, elapsed, rss
+            )
+        )
+
+
+if __name__ == "__main__":
+    measure(50_000)
+    measure(200_000)
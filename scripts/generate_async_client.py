@@ -56,12 +56,18 @@ def generate_async_client(content: str) -> str:
         content,
     )
 
-    # 3. Convert method definitions to async
-    content = re.sub(r"(\s+)def (\w+)\(", r"\1async def \2(", content)
+    # 3. Convert method definitions to async; streaming iter_* methods become
+    # aiter_* methods returning async iterators
+    content = re.sub(r"(\s+)def iter_(\w+)\(", r"\1def aiter_\2(", content)
+    content = re.sub(r"(\s+)def (?!aiter_)(\w+)\(", r"\1async def \2(", content)
+    content = re.sub(r"\bIterator\[", "AsyncIterator[", content)
+    content = re.sub(
+        r"(from typing import [^\n]*)\bIterator\b", r"\1AsyncIterator", content
+    )
 
     # 4. Add await to API calls
     content = re.sub(
-        r"(\s+)return (self\._api_call_(?:post|get|proto|geohash_proto)\()",
+        r"(\s+)return (self\._api_call_(?:post|get|proto|proto_matrix|geohash_proto)\()",
         r"\1return await \2",
         content,
     )
@@ -0,0 +1,42 @@
+import pytest
+
+from traveltimepy import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_connector_settings():
+    async with AsyncClient(
+        "test",
+        "test",
+        connection_limit=50,
+        connection_limit_per_host=20,
+        keepalive_timeout=30,
+    ) as client:
+        session = await client._get_session()
+
+        assert session.connector.limit == 50
+        assert session.connector.limit_per_host == 20
+        assert session.connector.force_close is False
+
+
+@pytest.mark.asyncio
+async def test_keep_alive_disabled():
+    async with AsyncClient("test", "test", keep_alive=False) as client:
+        session = await client._get_session()
+
+        assert session.connector.force_close is True
+
+
+@pytest.mark.asyncio
+async def test_json_and_proto_use_separate_pools():
+    async with AsyncClient("test", "test") as client:
+        session = await client._get_session()
+        proto_session = await client._get_session(proto=True)
+
+        assert proto_session is not session
+        assert proto_session.connector is not session.connector
+        assert await client._get_session() is session
+        assert await client._get_session(proto=True) is proto_session
+
+    assert session.closed
+    assert proto_session.closed
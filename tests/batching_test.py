@@ -0,0 +1,151 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from traveltimepy import AsyncClient
+from traveltimepy.batching import TimeFilterFastBatcher
+from traveltimepy.errors import TravelTimeServerError
+from traveltimepy.requests.common import Coordinates, Location, Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+)
+from traveltimepy.requests.transportation import DrivingFast
+
+
+def _call(name: str, destination_lng: float):
+    locations = [
+        Location(id=f"{name} origin", coords=Coordinates(lat=51.5, lng=-0.1)),
+        Location(
+            id=f"{name} destination", coords=Coordinates(lat=51.6, lng=destination_lng)
+        ),
+    ]
+    arrival_searches = TimeFilterFastArrivalSearches(
+        one_to_many=[
+            TimeFilterFastOneToMany(
+                id="search",
+                departure_location_id=f"{name} origin",
+                arrival_location_ids=[f"{name} destination"],
+                transportation=DrivingFast(),
+                travel_time=1800,
+                properties=[Property.TRAVEL_TIME],
+            )
+        ],
+        many_to_one=[],
+    )
+    return locations, arrival_searches
+
+
+def _session():
+    def request(**kwargs):
+        searches = json.loads(kwargs["data"])["arrival_searches"]["one_to_many"]
+        body = json.dumps(
+            {
+                "results": [
+                    {
+                        "search_id": search["id"],
+                        "locations": [
+                            {"id": location_id, "properties": {"travel_time": 600}}
+                            for location_id in search["arrival_location_ids"]
+                        ],
+                        "unreachable": [],
+                    }
+                    for search in searches
+                ]
+            }
+        )
+        response = Mock(status=200)
+        response.read = AsyncMock(return_value=body.encode())
+
+        context_manager = Mock()
+        context_manager.__aenter__ = AsyncMock(return_value=response)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+    session = Mock()
+    session.request.side_effect = request
+    return session
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_sent_as_one_request():
+    session = _session()
+    async with AsyncClient("test", "test") as client:
+        batcher = TimeFilterFastBatcher(client, max_wait=0.01)
+        with patch.object(client, "_get_session", return_value=session):
+            responses = await asyncio.gather(
+                *[
+                    batcher.time_filter_fast(*_call(name, lng))
+                    for name, lng in [("a", -0.2), ("b", -0.2), ("c", -0.3)]
+                ]
+            )
+
+    assert session.request.call_count == 1
+    sent = json.loads(session.request.call_args.kwargs["data"])
+    assert len(sent["locations"]) == 3  # one shared origin, two destinations
+    assert len(sent["arrival_searches"]["one_to_many"]) == 3
+
+    for name, response in zip("abc", responses):
+        assert [result.search_id for result in response.results] == ["search"]
+        assert [location.id for location in response.results[0].locations] == [
+            f"{name} destination"
+        ]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting():
+    session = _session()
+    async with AsyncClient("test", "test") as client:
+        batcher = TimeFilterFastBatcher(client, max_wait=10, max_searches=2)
+        with patch.object(client, "_get_session", return_value=session):
+            await asyncio.wait_for(
+                asyncio.gather(
+                    batcher.time_filter_fast(*_call("a", -0.2)),
+                    batcher.time_filter_fast(*_call("b", -0.3)),
+                ),
+                timeout=1,
+            )
+
+    assert session.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_call_with_unknown_location_is_sent_alone():
+    locations, arrival_searches = _call("a", -0.2)
+    async with AsyncClient("test", "test") as client:
+        batcher = TimeFilterFastBatcher(client, max_wait=0.01)
+        with patch.object(
+            client, "time_filter_fast", side_effect=client.time_filter_fast
+        ) as mock_call:
+            with patch.object(client, "_get_session", return_value=_session()):
+                await asyncio.gather(
+                    batcher.time_filter_fast(locations[:1], arrival_searches),
+                    batcher.time_filter_fast(*_call("b", -0.3)),
+                    batcher.time_filter_fast(*_call("c", -0.4)),
+                )
+
+    sent_alone = [
+        call for call in mock_call.call_args_list if call.args[0] == locations[:1]
+    ]
+    assert mock_call.call_count == 2
+    assert len(sent_alone) == 1
+
+
+@pytest.mark.asyncio
+async def test_error_fails_every_call_of_the_batch():
+    async with AsyncClient("test", "test") as client:
+        batcher = TimeFilterFastBatcher(client, max_wait=0.01)
+        with patch.object(
+            client,
+            "time_filter_fast",
+            side_effect=TravelTimeServerError("unavailable"),
+        ):
+            results = await asyncio.gather(
+                batcher.time_filter_fast(*_call("a", -0.2)),
+                batcher.time_filter_fast(*_call("b", -0.3)),
+                return_exceptions=True,
+            )
+
+    assert all(isinstance(result, TravelTimeServerError) for result in results)
@@ -0,0 +1,301 @@
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.accept_type import AcceptType
+from traveltimepy.cache import InMemoryCache, SqliteCache
+from traveltimepy.requests.common import Coordinates, Location, Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+)
+from traveltimepy.requests.transportation import DrivingFast
+
+locations = [
+    Location(id="origin", coords=Coordinates(lat=51.5, lng=-0.1)),
+    Location(id="destination", coords=Coordinates(lat=51.6, lng=-0.2)),
+]
+
+arrival_searches = TimeFilterFastArrivalSearches(
+    one_to_many=[
+        TimeFilterFastOneToMany(
+            id=f"search {i}",
+            departure_location_id="origin",
+            arrival_location_ids=["destination"],
+            transportation=DrivingFast(),
+            travel_time=1800,
+            properties=[Property.TRAVEL_TIME],
+        )
+        for i in range(15)
+    ],
+    many_to_one=[],
+)
+
+
+def _response_body(data: str) -> bytes:
+    searches = json.loads(data)["arrival_searches"]["one_to_many"]
+    return json.dumps(
+        {
+            "results": [
+                {
+                    "search_id": search["id"],
+                    "locations": [
+                        {"id": location_id, "properties": {"travel_time": 600}}
+                        for location_id in search["arrival_location_ids"]
+                    ],
+                    "unreachable": [],
+                }
+                for search in searches
+            ]
+        }
+    ).encode()
+
+
+def _sent_search_ids(mock_request):
+    return [
+        search["id"]
+        for call in mock_request.call_args_list
+        for search in json.loads(call.kwargs["data"])["arrival_searches"]["one_to_many"]
+    ]
+
+
+def _sync_response(**kwargs):
+    body = _response_body(kwargs["data"])
+    return Mock(status_code=200, content=body)
+
+
+def _async_session():
+    def request(**kwargs):
+        body = _response_body(kwargs["data"])
+        response = Mock(status=200)
+        response.read = AsyncMock(return_value=body)
+
+        context_manager = Mock()
+        context_manager.__aenter__ = AsyncMock(return_value=response)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+    session = Mock()
+    session.request.side_effect = request
+    return session
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+
+def test_in_memory_cache_byte_bound():
+    cache = InMemoryCache(max_entries=None, max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"123")
+    cache.set("too large", b"12345678901")
+
+    assert cache.get("a") is None
+    assert cache.get("too large") is None
+    assert cache.size == 8
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryCache(ttl=0.05)
+    cache.set("a", b"1")
+
+    assert cache.get("a") == b"1"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SqliteCache(path)
+    cache.set("a", b"1")
+    cache.close()
+
+    assert SqliteCache(path).get("a") == b"1"
+
+
+def test_sqlite_cache_ttl_and_byte_bound(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite"), max_bytes=10, ttl=0.05)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.get("a")
+    cache.set("c", b"123")
+
+    assert cache.get("a") == b"12345"
+    assert cache.get("b") is None
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 1  # expired "c" is only deleted on the next write or read
+
+
+def test_sync_client_serves_cached_parts():
+    with Client("test", "test", cache=InMemoryCache()) as client:
+        with patch.object(
+            client._session, "request", side_effect=_sync_response
+        ) as mock_request:
+            first = client.time_filter_fast(locations, arrival_searches)
+            second = client.time_filter_fast(locations, arrival_searches)
+
+    assert mock_request.call_count == 2  # two parts, sent once
+    assert first == second
+    assert len(second.results) == 15
+
+
+def test_cache_key_includes_endpoint_and_accept_type():
+    with Client("test", "test", cache=InMemoryCache()) as client:
+        keys = {
+            client._cache_key(endpoint, accept_type, "{}")
+            for endpoint, accept_type in [
+                ("time-map", AcceptType.JSON),
+                ("time-map", AcceptType.WKT),
+                ("time-map/fast", AcceptType.JSON),
+            ]
+        }
+
+    assert len(keys) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_cached_parts():
+    session = _async_session()
+    async with AsyncClient("test", "test", cache=InMemoryCache()) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            first = await client.time_filter_fast(locations, arrival_searches)
+            second = await client.time_filter_fast(locations, arrival_searches)
+
+    assert session.request.call_count == 2
+    assert first == second
+
+
+def test_search_cache_sends_only_uncached_searches():
+    new_search = arrival_searches.one_to_many[0].model_copy(
+        update={"id": "new search", "travel_time": 900}
+    )
+    searches = TimeFilterFastArrivalSearches(
+        one_to_many=[*arrival_searches.one_to_many, new_search], many_to_one=[]
+    )
+
+    with Client("test", "test", search_cache=InMemoryCache()) as client:
+        with patch.object(
+            client._session, "request", side_effect=_sync_response
+        ) as mock_request:
+            client.time_filter_fast(locations, arrival_searches)
+            mock_request.reset_mock()
+            response = client.time_filter_fast(locations, searches)
+
+    assert _sent_search_ids(mock_request) == ["new search"]
+    assert sorted(result.search_id for result in response.results) == sorted(
+        search.id for search in searches.one_to_many
+    )
+
+
+def test_search_cache_matches_locations_by_coordinates():
+    renamed_locations = [
+        Location(id="start", coords=locations[0].coords),
+        Location(id="end", coords=locations[1].coords),
+    ]
+    renamed_searches = TimeFilterFastArrivalSearches(
+        one_to_many=[
+            search.model_copy(
+                update={
+                    "id": f"renamed {search.id}",
+                    "departure_location_id": "start",
+                    "arrival_location_ids": ["end"],
+                }
+            )
+            for search in arrival_searches.one_to_many
+        ],
+        many_to_one=[],
+    )
+
+    with Client("test", "test", search_cache=InMemoryCache()) as client:
+        with patch.object(
+            client._session, "request", side_effect=_sync_response
+        ) as mock_request:
+            client.time_filter_fast(locations, arrival_searches)
+            mock_request.reset_mock()
+            response = client.time_filter_fast(renamed_locations, renamed_searches)
+
+    assert mock_request.call_count == 0
+    assert len(response.results) == 15
+    assert all(result.search_id.startswith("renamed") for result in response.results)
+    for result in response.results:
+        assert [location.id for location in result.locations] == ["end"]
+        assert result.locations[0].properties.travel_time == 600
+
+
+@pytest.mark.asyncio
+async def test_async_search_cache():
+    session = _async_session()
+    async with AsyncClient("test", "test", search_cache=InMemoryCache()) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            await client.time_filter_fast(locations, arrival_searches)
+            response = await client.time_filter_fast(locations, arrival_searches)
+
+    assert session.request.call_count == 2
+    assert len(response.results) == 15
+
+
+@pytest.mark.asyncio
+async def test_async_client_runs_sqlite_cache_in_thread(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite"))
+    threads = []
+    get, set = cache.get, cache.set
+
+    def recording_get(key):
+        threads.append(threading.get_ident())
+        return get(key)
+
+    def recording_set(key, value):
+        threads.append(threading.get_ident())
+        set(key, value)
+
+    session = _async_session()
+    async with AsyncClient("test", "test", cache=cache) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            with patch.object(cache, "get", side_effect=recording_get):
+                with patch.object(cache, "set", side_effect=recording_set):
+                    first = await client.time_filter_fast(locations, arrival_searches)
+                    second = await client.time_filter_fast(locations, arrival_searches)
+
+    assert session.request.call_count == 2
+    assert first == second
+    assert threads and threading.get_ident() not in threads
+
+
+def test_search_cache_keeps_search_order():
+    new_search = arrival_searches.one_to_many[0].model_copy(
+        update={"id": "new search", "travel_time": 900}
+    )
+    searches = TimeFilterFastArrivalSearches(
+        one_to_many=[
+            *arrival_searches.one_to_many[:7],
+            new_search,
+            *arrival_searches.one_to_many[7:],
+        ],
+        many_to_one=[],
+    )
+
+    with Client("test", "test", search_cache=InMemoryCache()) as client:
+        with patch.object(client._session, "request", side_effect=_sync_response):
+            uncached = client.time_filter_fast(locations, searches)
+            client.search_cache.clear()
+            client.time_filter_fast(locations, arrival_searches)
+            partially_cached = client.time_filter_fast(locations, searches)
+
+    expected = [search.id for search in searches.one_to_many]
+    assert [result.search_id for result in uncached.results] == expected
+    assert [result.search_id for result in partially_cached.results] == expected
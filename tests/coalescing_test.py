@@ -0,0 +1,131 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from traveltimepy import AsyncClient
+from traveltimepy.coalescing import CoalescingStats, SingleFlight
+from traveltimepy.responses.time_map import TimeMapResponse
+
+
+def _slow_session(body: bytes = b'{"results": []}'):
+    async def enter(*args):
+        await asyncio.sleep(0.05)
+        response = Mock(status=200)
+        response.read = AsyncMock(return_value=body)
+        return response
+
+    def request(**kwargs):
+        context_manager = Mock()
+        context_manager.__aenter__ = enter
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+    session = Mock()
+    session.request.side_effect = request
+    return session
+
+
+async def _get(client: AsyncClient, data: str):
+    return await client._make_request(
+        "POST", "https://test.com/v4/time-map/fast", {}, TimeMapResponse, data=data
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_are_sent_once():
+    session = _slow_session()
+    async with AsyncClient("test", "test", coalesce_requests=True) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            responses = await asyncio.gather(
+                *[_get(client, json.dumps({"search": 1})) for _ in range(5)],
+                _get(client, json.dumps({"search": 2})),
+            )
+
+        assert session.request.call_count == 2
+        assert all(response is responses[0] for response in responses[:5])
+        assert client.coalescing_stats.requests == 2
+        assert client.coalescing_stats.coalesced == 4
+        assert len(client._single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_completed_requests_are_sent_again():
+    session = _slow_session()
+    async with AsyncClient("test", "test", coalesce_requests=True) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            await _get(client, "{}")
+            await _get(client, "{}")
+
+    assert session.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_disabled_by_default():
+    session = _slow_session()
+    async with AsyncClient("test", "test") as client:
+        with patch.object(client, "_get_session", return_value=session):
+            await asyncio.gather(*[_get(client, "{}") for _ in range(3)])
+
+    assert session.request.call_count == 3
+    assert client.coalescing_stats.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    single_flight = SingleFlight(CoalescingStats())
+
+    async def call():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.ensure_future(single_flight.run("key", call))
+    second = asyncio.ensure_future(single_flight.run("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_every_caller_cancels_shared_call():
+    single_flight = SingleFlight(CoalescingStats())
+    started = asyncio.Event()
+    finished = False
+
+    async def call():
+        nonlocal finished
+        started.set()
+        await asyncio.sleep(0.05)
+        finished = True
+
+    callers = [asyncio.ensure_future(single_flight.run("key", call)) for _ in range(2)]
+    await started.wait()
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0.1)
+
+    assert not finished
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared():
+    stats = CoalescingStats()
+    single_flight = SingleFlight(stats)
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        single_flight.run("key", call),
+        single_flight.run("key", call),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert (stats.requests, stats.coalesced) == (1, 1)
@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from traveltimepy import Client
+
+
+class _InFlightCounter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __call__(self, item: int) -> int:
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(0.01)
+        with self.lock:
+            self.current -= 1
+        return item * 2
+
+
+def test_results_keep_item_order():
+    with Client("test", "test", max_concurrency=4) as client:
+        results = client._run_concurrently(_InFlightCounter(), list(range(20)))
+
+    assert results == [item * 2 for item in range(20)]
+
+
+def test_in_flight_bounded_by_client_concurrency():
+    counter = _InFlightCounter()
+    with Client("test", "test", max_concurrency=3) as client:
+        client._run_concurrently(counter, list(range(20)))
+
+    assert counter.peak <= 3
+
+
+def test_in_flight_bounded_per_call():
+    counter = _InFlightCounter()
+    with Client("test", "test", max_concurrency=8) as client:
+        client._run_concurrently(counter, list(range(20)), max_in_flight=2)
+
+    assert counter.peak <= 2
+
+
+def test_executor_reused_across_calls():
+    thread_names = set()
+
+    def record_thread(item: int) -> int:
+        thread_names.add(threading.current_thread().name)
+        return item
+
+    with Client("test", "test", max_concurrency=2) as client:
+        for _ in range(5):
+            client._run_concurrently(record_thread, list(range(4)))
+
+    assert len(thread_names) <= 2
+
+
+def test_error_is_raised():
+    def fail_on_three(item: int) -> int:
+        if item == 3:
+            raise ValueError("failed")
+        return item
+
+    with Client("test", "test", max_concurrency=2) as client:
+        with pytest.raises(ValueError):
+            client._run_concurrently(fail_on_three, list(range(10)))
+
+
+def test_executor_shut_down_on_close():
+    with Client("test", "test") as client:
+        pass
+
+    with pytest.raises(RuntimeError):
+        client._executor.submit(print)
+
+
+def test_close_cancels_queued_calls():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    cancelled = []
+
+    def block(item: int) -> int:
+        calls.append(item)
+        started.set()
+        release.wait()
+        return item
+
+    client = Client("test", "test", max_concurrency=1)
+
+    def run(item: int) -> None:
+        try:
+            list(client._iter_concurrently(block, [item]))
+        except CancelledError:
+            cancelled.append(item)
+
+    callers = [threading.Thread(target=run, args=(item,)) for item in (1, 2)]
+    callers[0].start()
+    started.wait()
+    callers[1].start()
+    while len(client._futures) < 2:
+        time.sleep(0.001)
+
+    threading.Timer(0.05, release.set).start()
+    client.close()
+    for caller in callers:
+        caller.join()
+
+    assert calls == [1]
+    assert cancelled == [2]
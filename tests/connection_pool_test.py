@@ -0,0 +1,67 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from traveltimepy import Client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.01)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_sized_to_concurrency():
+    with Client("test", "test", max_concurrency=32) as client:
+        assert client.pool_maxsize == 32
+        adapter = client._session.get_adapter("https://")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+def test_sequential_requests_reuse_connection(server_url):
+    with Client("test", "test", max_rpm=6000) as client:
+        for _ in range(5):
+            client._session.get(server_url)
+
+    assert client.connection_stats.requests == 5
+    assert client.connection_stats.new_connections == 1
+    assert client.connection_stats.reused_connections == 4
+
+
+def test_keep_alive_disabled_opens_new_connections(server_url):
+    with Client("test", "test", max_rpm=6000, keep_alive=False) as client:
+        for _ in range(5):
+            client._session.get(server_url)
+
+    assert client.connection_stats.new_connections == 5
+
+
+def test_concurrent_requests_reuse_connections(server_url):
+    with Client("test", "test", max_rpm=6000, max_concurrency=8) as client:
+        for _ in range(5):
+            client._run_concurrently(
+                lambda _: client._session.get(server_url), list(range(8))
+            )
+
+    assert client.connection_stats.requests == 40
+    assert client.connection_stats.new_connections <= 8
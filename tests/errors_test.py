@@ -67,7 +67,7 @@ def test_invalid_request_sync(client: Client):
 def test_unexpected_error_response_sync():
     mock_response = Mock()
     mock_response.status_code = 400
-    mock_response.json.return_value = {"unexpected": "format"}
+    mock_response.content = b'{"unexpected": "format"}'
 
     with Client("test", "test") as client:
         with pytest.raises(TravelTimeError, match="unexpected response"):
@@ -78,7 +78,7 @@ def test_unexpected_error_response_sync():
 async def test_unexpected_error_response_async():
     mock_response = AsyncMock()
     mock_response.status = 400
-    mock_response.text.return_value = '{"unexpected": "format"}'
+    mock_response.read.return_value = b'{"unexpected": "format"}'
 
     async with AsyncClient("test", "test") as client:
         with pytest.raises(TravelTimeError, match="unexpected response"):
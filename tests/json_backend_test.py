@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import ValidationError
+
+from traveltimepy import AsyncClient, Client, json_backend
+from traveltimepy.responses.time_map import TimeMapResponse
+
+BODY = (
+    b'{"results": [{"search_id": "search", "shapes": [{"shell": '
+    b'[{"lat": 51.5, "lng": -0.1}, {"lat": 51.6, "lng": -0.2}], "holes": []}]}]}'
+)
+
+
+def test_round_trip():
+    value = {"locations": [[51.5, -0.1, {"travel_time": 600}]], "unreachable": []}
+
+    assert json_backend.loads(json_backend.dumps(value)) == value
+
+
+def test_invalid_json_raises_decode_error():
+    with pytest.raises(json_backend.DecodeError):
+        json_backend.loads(b"{invalid")
+
+
+def test_sync_response_validated_from_bytes():
+    response = Mock(status_code=200, content=BODY)
+
+    with Client("test", "test") as client:
+        result = client._handle_response(response, TimeMapResponse)
+
+    assert result.results[0].shapes[0].shell[1].lng == -0.2
+    response.json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_response_validated_from_bytes():
+    response = Mock(status=200)
+    response.read = AsyncMock(return_value=BODY)
+
+    async with AsyncClient("test", "test") as client:
+        result = await client._handle_response(response, TimeMapResponse)
+
+    assert result.results[0].search_id == "search"
+    response.text.assert_not_called()
+
+
+def test_invalid_success_body_fails_validation():
+    with Client("test", "test") as client:
+        with pytest.raises(ValidationError):
+            client._handle_response(
+                Mock(status_code=200, content=b"not json"), TimeMapResponse
+            )
@@ -0,0 +1,137 @@
+import json
+import math
+
+import pytest
+from shapely.geometry import MultiPolygon, Polygon
+
+from traveltimepy.postprocessing import IsochroneProcessing, process_isochrones
+from traveltimepy.responses.time_map import TimeMapCompactResponse, TimeMapResponse
+from traveltimepy.responses.time_map_wkt import TimeMapWKTLazyResponse
+
+
+def _square(min_lng: float, min_lat: float, max_lng: float, max_lat: float):
+    return [
+        {"lat": min_lat, "lng": min_lng},
+        {"lat": min_lat, "lng": max_lng},
+        {"lat": max_lat, "lng": max_lng},
+        {"lat": max_lat, "lng": min_lng},
+        {"lat": min_lat, "lng": min_lng},
+    ]
+
+
+def _spherical_area(min_lng: float, min_lat: float, max_lng: float, max_lat: float):
+    width = math.radians(max_lng - min_lng)
+    height = math.sin(math.radians(max_lat)) - math.sin(math.radians(min_lat))
+    return 6_371_008.8**2 * width * height
+
+
+bow_tie = [
+    {"lat": 0, "lng": 0},
+    {"lat": 1, "lng": 1},
+    {"lat": 0, "lng": 1},
+    {"lat": 1, "lng": 0},
+    {"lat": 0, "lng": 0},
+]
+
+body = json.dumps(
+    {
+        "results": [
+            {
+                "search_id": "overlapping",
+                "shapes": [
+                    {"shell": _square(0, 51, 0.1, 51.1), "holes": []},
+                    {"shell": _square(0.05, 51, 0.15, 51.1), "holes": []},
+                ],
+            },
+            {"search_id": "invalid", "shapes": [{"shell": bow_tie, "holes": []}]},
+            {"search_id": "empty", "shapes": []},
+        ]
+    }
+)
+
+
+@pytest.mark.parametrize("response_class", [TimeMapResponse, TimeMapCompactResponse])
+def test_dissolve_and_make_valid(response_class):
+    isochrones = process_isochrones(response_class.model_validate_json(body))
+
+    assert [isochrone.search_id for isochrone in isochrones] == [
+        "overlapping",
+        "invalid",
+        "empty",
+    ]
+    overlapping, invalid, empty = [isochrone.geometry for isochrone in isochrones]
+    assert isinstance(overlapping, Polygon)
+    assert overlapping.area == pytest.approx(0.15 * 0.1)
+    assert invalid.is_valid and invalid.area == pytest.approx(0.5)
+    assert empty.is_empty
+    assert all(isochrone.area is None for isochrone in isochrones)
+
+
+def test_without_dissolve_shapes_are_collected():
+    isochrones = process_isochrones(
+        TimeMapCompactResponse.model_validate_json(body),
+        IsochroneProcessing(dissolve=False),
+    )
+
+    assert isinstance(isochrones[0].geometry, MultiPolygon)
+    assert len(isochrones[0].geometry.geoms) == 2
+
+
+def test_simplify_and_area():
+    isochrones = process_isochrones(
+        TimeMapCompactResponse.model_validate_json(body),
+        IsochroneProcessing(simplify_tolerance=0.001, area=True),
+    )
+
+    # The union keeps the corners of the second square on its edges
+    assert len(isochrones[0].geometry.exterior.coords) == 5
+    assert isochrones[0].area == pytest.approx(_spherical_area(0, 51, 0.15, 51.1))
+    assert isochrones[2].area == 0
+
+
+def test_area_of_large_shapes():
+    response = TimeMapCompactResponse.model_validate_json(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "search_id": "a",
+                        "shapes": [{"shell": _square(0, 40, 10, 70), "holes": []}],
+                    }
+                ]
+            }
+        )
+    )
+
+    isochrones = process_isochrones(response, IsochroneProcessing(area=True))
+
+    assert isochrones[0].area == pytest.approx(_spherical_area(0, 40, 10, 70))
+
+
+def test_wkt_lazy_response():
+    response = TimeMapWKTLazyResponse.model_validate_json(
+        json.dumps(
+            {
+                "results": [
+                    {"search_id": "a", "shape": "POLYGON((0 0, 0 2, 2 2, 2 0, 0 0))"}
+                ]
+            }
+        )
+    )
+
+    assert process_isochrones(response)[0].geometry.area == 4
+
+
+def test_process_pool_matches_in_process():
+    response = TimeMapCompactResponse.model_validate_json(body)
+    processing = IsochroneProcessing(area=True)
+
+    in_process = process_isochrones(response, processing)
+    pooled = process_isochrones(response, processing, processes=2)
+
+    assert [isochrone.search_id for isochrone in pooled] == [
+        isochrone.search_id for isochrone in in_process
+    ]
+    for pooled_isochrone, isochrone in zip(pooled, in_process):
+        assert pooled_isochrone.geometry.equals(isochrone.geometry)
+        assert pooled_isochrone.area == isochrone.area
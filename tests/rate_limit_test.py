@@ -0,0 +1,170 @@
+import multiprocessing
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.rate_limit import (
+    FileBucket,
+    InMemoryBucket,
+    RateLimiter,
+    RedisBucket,
+)
+
+
+def test_burst_then_sustained_rate():
+    limiter = RateLimiter(per_minute=600, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    burst_elapsed = time.monotonic() - start
+    for _ in range(2):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert burst_elapsed < 0.05
+    assert elapsed >= 0.19  # 2 more tokens at 10 per second
+
+
+def test_bucket_refills_up_to_burst():
+    bucket = InMemoryBucket()
+
+    assert bucket.take(rate=100, burst=2, tokens=1) == 0
+    assert bucket.take(rate=100, burst=2, tokens=1) == 0
+    assert bucket.take(rate=100, burst=2, tokens=1) > 0
+    time.sleep(0.1)
+    assert bucket.take(rate=100, burst=2, tokens=1) == 0
+    assert bucket.take(rate=100, burst=2, tokens=1) == 0
+    assert bucket.take(rate=100, burst=2, tokens=1) > 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_async():
+    limiter = RateLimiter(per_minute=600, burst=1)
+
+    start = time.monotonic()
+    await limiter.acquire_async()
+    await limiter.acquire_async()
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_runs_blocking_backend_in_thread():
+    threads = []
+
+    class RecordingBucket(InMemoryBucket):
+        blocking = True
+
+        def take(self, rate, burst, tokens):
+            threads.append(threading.get_ident())
+            return super().take(rate, burst, tokens)
+
+    limiter = RateLimiter(per_minute=600, backend=RecordingBucket())
+    await limiter.acquire_async()
+
+    assert threads and threading.get_ident() not in threads
+
+
+def _acquire_from_file(path: str, count: int) -> None:
+    limiter = RateLimiter(per_minute=600, burst=2, backend=FileBucket(path))
+    for _ in range(count):
+        limiter.acquire()
+
+
+def test_file_bucket_shared_across_processes(tmp_path):
+    path = str(tmp_path / "bucket")
+    processes = [
+        multiprocessing.Process(target=_acquire_from_file, args=(path, 3))
+        for _ in range(2)
+    ]
+
+    start = time.monotonic()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    # 6 tokens with a burst of 2 need 4 refills at 10 per second
+    assert time.monotonic() - start >= 0.39
+    assert all(process.exitcode == 0 for process in processes)
+
+
+def test_redis_bucket_runs_script_on_server():
+    redis = Mock()
+    redis.eval.return_value = b"0.25"
+    bucket = RedisBucket(redis, key="limits:account")
+
+    assert bucket.take(rate=10, burst=5, tokens=1) == 0.25
+    _, numkeys, key, *args = redis.eval.call_args.args
+    assert (numkeys, key, args) == (1, "limits:account", [10, 5, 1])
+
+
+def test_clients_share_limiter():
+    limiter = RateLimiter(per_minute=120, burst=10)
+
+    with Client("test", "test", rate_limiter=limiter) as client:
+        assert client.rate_limiter is limiter
+    assert AsyncClient("test", "test", rate_limiter=limiter).rate_limiter is limiter
+
+
+def test_default_limiter_uses_max_rpm():
+    with Client("test", "test", max_rpm=30) as client:
+        assert client.rate_limiter.per_minute == 30
+        assert client.rate_limiter.burst == 30
+
+
+def test_request_takes_token():
+    limiter = RateLimiter(per_minute=60)
+
+    with Client("test", "test", rate_limiter=limiter) as client:
+        with patch.object(client._session, "request", return_value=Mock()):
+            with patch.object(client, "_handle_response", return_value="response"):
+                with patch.object(limiter, "acquire") as mock_acquire:
+                    client._make_request("GET", "https://test.com", {}, Mock)
+
+    assert mock_acquire.call_count == 1
+
+
+def test_proto_endpoints_have_own_budget_by_default():
+    with Client("test", "test", max_rpm=30) as client:
+        assert client.proto_rate_limiter is not client.rate_limiter
+        assert client.proto_rate_limiter.per_minute == 30
+        assert client.geohash_proto_rate_limiter is client.proto_rate_limiter
+
+
+def test_proto_endpoints_share_given_rate_limiter():
+    limiter = RateLimiter(per_minute=60)
+
+    with Client("test", "test", rate_limiter=limiter) as client:
+        assert client.proto_rate_limiter is limiter
+        assert client.geohash_proto_rate_limiter is limiter
+
+
+def test_separate_endpoint_family_budgets():
+    geohash_limiter = RateLimiter(per_minute=30)
+
+    with Client(
+        "test",
+        "test",
+        max_rpm=60,
+        proto_max_rpm=6000,
+        geohash_proto_rate_limiter=geohash_limiter,
+    ) as client:
+        assert client.rate_limiter.per_minute == 60
+        assert client.proto_rate_limiter.per_minute == 6000
+        assert client.geohash_proto_rate_limiter is geohash_limiter
+
+
+@pytest.mark.asyncio
+async def test_json_calls_do_not_consume_proto_budget():
+    async with AsyncClient("test", "test", max_rpm=1, proto_max_rpm=1) as client:
+        await client.rate_limiter.acquire_async()
+
+        start = time.monotonic()
+        await client.proto_rate_limiter.acquire_async()
+
+        assert time.monotonic() - start < 0.05
@@ -1,9 +1,12 @@
+import time
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from tenacity import RetryError
 
 from traveltimepy import Client, AsyncClient
 from traveltimepy.errors import TravelTimeJsonError, TravelTimeServerError
+from traveltimepy.retry import RetryPolicy, parse_retry_after
 
 
 class TestRetryLogic:
@@ -104,3 +107,127 @@ class TestRetryLogic:
                     assert (
                         mock_handle.call_count == 1
                     )  # only initial attempt, no retries
+
+
+class TestRetryPolicy:
+    @staticmethod
+    def _rate_limited(retry_after=None):
+        return TravelTimeJsonError(
+            429, "RATE_LIMITED", "Too many requests", "", {}, retry_after=retry_after
+        )
+
+    def test_backoff_grows_exponentially_up_to_max_wait(self):
+        policy = RetryPolicy(initial_wait=1, multiplier=2, max_wait=5, jitter=False)
+
+        assert [policy.backoff(retry) for retry in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(initial_wait=1, multiplier=2, max_wait=5)
+
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+    def test_retries_server_and_rate_limited_errors_only(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry(TravelTimeServerError("Server error"))
+        assert policy.should_retry(self._rate_limited())
+        assert not policy.should_retry(
+            TravelTimeJsonError(400, "CLIENT_ERROR", "Bad request", "", {})
+        )
+        assert not RetryPolicy(retry_rate_limited=False).should_retry(
+            self._rate_limited()
+        )
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after({"Retry-After": "7"}) == 7
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+    def test_sync_rate_limited_retried_after_retry_after(self):
+        with Client("test", "test", retry_attempts=2) as client:
+            with patch.object(client._session, "request", return_value=Mock()):
+                with patch.object(
+                    client,
+                    "_handle_response",
+                    side_effect=[self._rate_limited(retry_after=0.2), "response"],
+                ):
+                    start = time.monotonic()
+                    response = client._make_request(
+                        "POST", "https://test.com/v4/time-filter/fast", {}, Mock
+                    )
+
+        assert response == "response"
+        assert time.monotonic() - start >= 0.2
+        assert client.retry_stats.retries == {"time-filter/fast": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limited_retried(self):
+        async with AsyncClient(
+            "test", "test", retry_policy=RetryPolicy(initial_wait=0)
+        ) as client:
+            with patch.object(
+                client,
+                "_get_session",
+                return_value=TestRetryLogic()._mock_async_session(),
+            ):
+                with patch.object(
+                    client,
+                    "_handle_response",
+                    side_effect=[
+                        self._rate_limited(),
+                        self._rate_limited(),
+                        "response",
+                    ],
+                ):
+                    response = await client._make_request(
+                        "POST", "https://test.com/v4/time-map", {}, Mock
+                    )
+
+        assert response == "response"
+        assert client.retry_stats.retries == {"time-map": 2}
+
+    def test_max_elapsed_stops_retrying(self):
+        policy = RetryPolicy(initial_wait=0.1, jitter=False, max_elapsed=0.15)
+        with Client("test", "test", retry_attempts=10, retry_policy=policy) as client:
+            with patch.object(client._session, "request", return_value=Mock()):
+                with patch.object(
+                    client,
+                    "_handle_response",
+                    side_effect=TravelTimeServerError("Server error"),
+                ) as mock_handle:
+                    with pytest.raises(RetryError):
+                        client._make_request("GET", "https://test.com", {}, Mock)
+
+        assert mock_handle.call_count < 11
+
+    def test_retry_after_is_capped_at_max_wait(self):
+        policy = RetryPolicy(max_wait=5)
+        retry_state = Mock(
+            outcome=Mock(exception=Mock(return_value=self._rate_limited(3600))),
+            attempt_number=1,
+        )
+
+        assert policy.wait(retry_state) == 5
+
+    def test_retry_after_beyond_max_elapsed_stops_without_sleeping(self):
+        policy = RetryPolicy(max_wait=3600, max_elapsed=1)
+        with Client("test", "test", retry_policy=policy) as client:
+            with patch.object(client._session, "request", return_value=Mock()):
+                with patch.object(
+                    client,
+                    "_handle_response",
+                    side_effect=self._rate_limited(retry_after=3600),
+                ) as mock_handle:
+                    start = time.monotonic()
+                    with pytest.raises(RetryError):
+                        client._make_request("GET", "https://test.com", {}, Mock)
+
+        assert mock_handle.call_count == 1
+        assert time.monotonic() - start < 1
+
+    def test_backoff_is_shortened_to_max_elapsed(self):
+        policy = RetryPolicy(initial_wait=10, jitter=False, max_elapsed=2)
+        retry_state = Mock(outcome=None, attempt_number=1, seconds_since_start=1.5)
+
+        assert policy.wait(retry_state) == pytest.approx(0.5)
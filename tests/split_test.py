@@ -0,0 +1,141 @@
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.itertools import split_weighted
+from traveltimepy.requests.common import Coordinates, Location, Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+    TimeFilterFastRequest,
+)
+from traveltimepy.requests.transportation import DrivingFast
+
+
+def _request(destination_counts):
+    locations = [
+        Location(id=str(i), coords=Coordinates(lat=51.5, lng=-0.1))
+        for i in range(max(destination_counts) + 1)
+    ]
+    return TimeFilterFastRequest(
+        locations=locations,
+        arrival_searches=TimeFilterFastArrivalSearches(
+            one_to_many=[
+                TimeFilterFastOneToMany(
+                    id=f"search {i}",
+                    departure_location_id="0",
+                    arrival_location_ids=[str(j) for j in range(1, count + 1)],
+                    transportation=DrivingFast(),
+                    travel_time=1800,
+                    properties=[Property.TRAVEL_TIME],
+                )
+                for i, count in enumerate(destination_counts)
+            ],
+            many_to_one=[],
+        ),
+    )
+
+
+def test_split_weighted_respects_window_size():
+    left = list(range(23))
+    right = list(range(7))
+
+    parts = split_weighted(left, right, 10, 10**6, lambda _: 1)
+
+    assert [value for lefts, _ in parts for value in lefts] == left
+    assert [value for _, rights in parts for value in rights] == right
+    assert all(len(lefts) <= 10 and len(rights) <= 10 for lefts, rights in parts)
+
+
+def test_split_weighted_keeps_order_and_weight_limit():
+    values = [5, 1, 4, 6, 2, 2, 9, 1]
+
+    parts = split_weighted(values, [], 10, 10, lambda value: value)
+
+    assert [value for lefts, _ in parts for value in lefts] == values
+    assert all(sum(lefts) <= 10 for lefts, _ in parts)
+
+
+def test_split_weighted_heavy_item_gets_own_part():
+    parts = split_weighted([1, 50, 1], [], 10, 10, lambda value: value)
+
+    assert ([50], []) in parts
+
+
+def test_split_searches_by_locations_balances_parts():
+    request = _request([100, 100, 100, 10, 10, 10, 10])
+
+    parts = request.split_searches_by_locations(10, 150)
+
+    part_searches = [part.arrival_searches.one_to_many for part in parts]
+    assert len(parts) > 1
+    assert all(
+        sum(len(search.arrival_location_ids) + 1 for search in searches) <= 150
+        for searches in part_searches
+    )
+    assert [search.id for searches in part_searches for search in searches] == [
+        f"search {i}" for i in range(7)
+    ]
+
+
+def test_split_searches_window_size():
+    request = _request([1] * 25)
+
+    parts = request.split_searches(4)
+
+    assert [len(part.arrival_searches.one_to_many) for part in parts] == [
+        4,
+        4,
+        4,
+        4,
+        4,
+        4,
+        1,
+    ]
+
+
+def test_parts_only_carry_referenced_locations():
+    parts = _request([1, 2, 3, 30]).split_searches(2)
+
+    assert [[location.id for location in part.locations] for part in parts] == [
+        ["0", "1", "2"],
+        ["0", "1", "2", "3"] + [str(i) for i in range(4, 31)],
+    ]
+
+
+def test_parts_sharing_locations_serialize_like_pydantic():
+    parts = _request([5] * 10).split_searches(2)
+
+    assert all(part._fragments is not None for part in parts)
+    assert [part.to_json() for part in parts] == [
+        part.model_dump_json() for part in parts
+    ]
+
+
+def test_location_fragments_skipped_without_sharing():
+    parts = _request([1, 2, 3, 30]).split_searches(2)
+
+    assert all(part._fragments is None for part in parts)
+
+
+def test_constructed_parts_equal_validated_parts():
+    parts = _request([1, 2, 3, 30]).split_searches(2)
+
+    for part in parts:
+        validated = TimeFilterFastRequest.model_validate(part.model_dump())
+        assert validated == part
+        assert validated.model_dump_json() == part.to_json()
+
+
+@pytest.mark.parametrize("client_class", [Client, AsyncClient])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"split_size": 0},
+        {"split_size": -1},
+        {"max_locations_per_part": 0},
+        {"max_locations_per_part": -1},
+    ],
+)
+def test_invalid_split_limits_raise(client_class, kwargs):
+    with pytest.raises(ValueError, match=f"{next(iter(kwargs))} must be at least 1"):
+        client_class("test", "test", **kwargs)
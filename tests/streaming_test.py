@@ -0,0 +1,114 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.requests.common import Coordinates, Location, Property
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastOneToMany,
+)
+from traveltimepy.requests.transportation import DrivingFast
+from traveltimepy.responses.time_filter_fast import (
+    TimeFilterFastResponse,
+    TimeFilterFastResult,
+)
+
+SEARCHES = 25
+SLOW_SEARCH = "search 0"
+
+locations = [
+    Location(id="origin", coords=Coordinates(lat=51.5, lng=-0.1)),
+    Location(id="destination", coords=Coordinates(lat=51.6, lng=-0.2)),
+]
+
+arrival_searches = TimeFilterFastArrivalSearches(
+    one_to_many=[
+        TimeFilterFastOneToMany(
+            id=f"search {i}",
+            departure_location_id="origin",
+            arrival_location_ids=["destination"],
+            transportation=DrivingFast(),
+            travel_time=1800,
+            properties=[Property.TRAVEL_TIME],
+        )
+        for i in range(SEARCHES)
+    ],
+    many_to_one=[],
+)
+
+
+def _search_ids(data: str):
+    return [
+        search["id"] for search in json.loads(data)["arrival_searches"]["one_to_many"]
+    ]
+
+
+def _response(data: str) -> TimeFilterFastResponse:
+    return TimeFilterFastResponse(
+        results=[
+            TimeFilterFastResult(search_id=search_id, locations=[], unreachable=[])
+            for search_id in _search_ids(data)
+        ]
+    )
+
+
+def test_iter_yields_parts_in_completion_order():
+    def make_request(method, url, headers, response_class, data=None, **kwargs):
+        if SLOW_SEARCH in _search_ids(data):
+            time.sleep(0.2)
+        return _response(data)
+
+    with Client("test", "test", split_size=10) as client:
+        with patch.object(client, "_make_request", side_effect=make_request):
+            responses = list(client.iter_time_filter_fast(locations, arrival_searches))
+
+    assert len(responses) == 3
+    assert SLOW_SEARCH in [result.search_id for result in responses[-1].results]
+    assert sorted(
+        result.search_id for response in responses for result in response.results
+    ) == sorted(search.id for search in arrival_searches.one_to_many)
+
+
+def test_iter_stops_remaining_parts_when_closed():
+    calls = []
+
+    def make_request(method, url, headers, response_class, data=None, **kwargs):
+        calls.append(data)
+        time.sleep(0.05)
+        return _response(data)
+
+    with Client("test", "test", split_size=1, max_concurrency=2) as client:
+        with patch.object(client, "_make_request", side_effect=make_request):
+            responses = client.iter_time_filter_fast(locations, arrival_searches)
+            next(responses)
+            responses.close()
+            time.sleep(0.1)
+
+    assert len(calls) < SEARCHES
+
+
+@pytest.mark.asyncio
+async def test_aiter_yields_parts_in_completion_order():
+    async def make_request(method, url, headers, response_class, data=None, **kwargs):
+        if SLOW_SEARCH in _search_ids(data):
+            await asyncio.sleep(0.2)
+        return _response(data)
+
+    async with AsyncClient("test", "test", split_size=10) as client:
+        with patch.object(client, "_make_request", side_effect=make_request):
+            responses = [
+                response
+                async for response in client.aiter_time_filter_fast(
+                    locations, arrival_searches
+                )
+            ]
+
+    assert len(responses) == 3
+    assert SLOW_SEARCH in [result.search_id for result in responses[-1].results]
+    assert sorted(
+        result.search_id for response in responses for result in response.results
+    ) == sorted(search.id for search in arrival_searches.one_to_many)
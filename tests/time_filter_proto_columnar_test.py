@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoResponse,
+)
+
+TimeFilterFastResponse_pb2 = pytest.importorskip(
+    "traveltimepy.proto.TimeFilterFastResponse_pb2"
+)
+
+DESTINATIONS = [
+    Coordinates(lat=51.348605, lng=-0.314783),
+    Coordinates(lat=51.337205, lng=-0.315793),
+    Coordinates(lat=51.425709, lng=-0.122061),
+]
+
+
+def _properties(travel_times, distances):
+    response = TimeFilterFastResponse_pb2.TimeFilterFastResponse()
+    response.properties.travelTimes.extend(travel_times)
+    response.properties.distances.extend(distances)
+    return response.properties
+
+
+def test_columnar_matches_list_response():
+    properties = _properties([120, -1, 300], [1000, -1, 2500])
+
+    columnar = TimeFilterProtoColumnarResponse.from_proto(properties)
+    response = TimeFilterProtoResponse.from_proto(properties)
+
+    assert columnar.travel_times.dtype == np.int32
+    assert columnar.travel_times.tolist() == response.travel_times
+    assert columnar.distances.tolist() == response.distances
+
+
+def test_reachable_indices():
+    columnar = TimeFilterProtoColumnarResponse.from_proto(
+        _properties([120, -1, 300], [])
+    )
+
+    assert columnar.reachable_indices().tolist() == [0, 2]
+
+
+def test_join_with_destinations():
+    columnar = TimeFilterProtoColumnarResponse.from_proto(
+        _properties([120, -1, 300], [1000, -1, 2500])
+    )
+
+    joined = columnar.join(DESTINATIONS)
+
+    assert joined["travel_time"].tolist() == [120, -1, 300]
+    assert joined["distance"].tolist() == [1000, -1, 2500]
+    assert joined["lat"][1] == DESTINATIONS[1].lat
+
+
+def test_join_without_distances():
+    columnar = TimeFilterProtoColumnarResponse.from_proto(
+        _properties([120, -1, 300], [])
+    )
+
+    joined = columnar.join(DESTINATIONS)
+
+    assert joined.dtype.names == ("lat", "lng", "travel_time")
+
+
+def test_join_length_mismatch():
+    columnar = TimeFilterProtoColumnarResponse.from_proto(_properties([120], []))
+
+    with pytest.raises(ValueError):
+        columnar.join(DESTINATIONS)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.requests.time_filter_proto import (
+    encode_location_deltas,
+    destinations_to_array,
+)
+
+ORIGIN = Coordinates(lat=51.425709, lng=-0.122061)
+DESTINATIONS = [
+    Coordinates(lat=51.348605, lng=-0.314783),
+    Coordinates(lat=51.337205, lng=-0.315793),
+    Coordinates(lat=51.425709, lng=-0.122061),
+]
+
+
+def test_deltas_match_per_destination_encoding():
+    expected = []
+    for destination in DESTINATIONS:
+        expected.append(round((destination.lat - ORIGIN.lat) * 10**5))
+        expected.append(round((destination.lng - ORIGIN.lng) * 10**5))
+
+    deltas = encode_location_deltas(ORIGIN, DESTINATIONS)
+
+    assert deltas.dtype == np.int32
+    assert deltas.tolist() == expected
+
+
+def test_array_and_coordinates_inputs_are_equivalent():
+    array = np.array([[c.lat, c.lng] for c in DESTINATIONS])
+
+    from_array = encode_location_deltas(ORIGIN, array)
+    from_coordinates = encode_location_deltas(ORIGIN, DESTINATIONS)
+
+    assert from_array.tolist() == from_coordinates.tolist()
+
+
+def test_empty_destinations():
+    assert destinations_to_array([]).shape == (0, 2)
+    assert len(encode_location_deltas(ORIGIN, [])) == 0
+
+
+def test_invalid_array_shape():
+    with pytest.raises(ValueError):
+        destinations_to_array(np.zeros((3, 3)))
+
+
+def test_invalid_array_latitude():
+    with pytest.raises(ValueError):
+        destinations_to_array(np.array([[91.0, 0.0]]))
@@ -0,0 +1,148 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.requests.time_filter_proto import (
+    ProtoCountry,
+    ProtoTransportation,
+    RequestType,
+)
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
+)
+from traveltimepy.responses.time_filter_proto import UNREACHABLE
+
+TimeFilterFastRequest_pb2 = pytest.importorskip(
+    "traveltimepy.proto.TimeFilterFastRequest_pb2"
+)
+TimeFilterFastResponse_pb2 = pytest.importorskip(
+    "traveltimepy.proto.TimeFilterFastResponse_pb2"
+)
+
+ORIGINS = np.array([[51.0, 0.0], [51.001, 0.0]])
+DESTINATIONS = np.array([[51.002, 0.0], [51.003, 0.0], [51.004, 0.0]])
+
+
+def _response(data: bytes) -> bytes:
+    """Mock proto response with each destination's latitude delta as travel time and
+    distance, and deltas above 250 unreachable."""
+    request = TimeFilterFastRequest_pb2.TimeFilterFastRequest()
+    request.ParseFromString(data)
+    deltas = [
+        delta if delta <= 250 else -1
+        for delta in request.oneToManyRequest.locationDeltas[::2]
+    ]
+    response = TimeFilterFastResponse_pb2.TimeFilterFastResponse()
+    response.properties.travelTimes.extend(deltas)
+    response.properties.distances.extend(deltas)
+    return response.SerializeToString()
+
+
+EXPECTED = [[200, UNREACHABLE, UNREACHABLE], [100, 200, UNREACHABLE]]
+
+
+def test_sync_matrix():
+    def post(**kwargs):
+        return Mock(status_code=200, content=_response(kwargs["data"]))
+
+    with Client("test", "test") as client:
+        with patch.object(client._session, "post", side_effect=post) as mock_post:
+            response = client.time_filter_fast_proto_matrix(
+                origin_coordinates=ORIGINS,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=True,
+                max_concurrency=2,
+            )
+
+    assert mock_post.call_count == 2
+    assert response.travel_times.shape == (2, 3)
+    assert response.travel_times.tolist() == EXPECTED
+    assert response.distances is not None
+    assert response.distances.tolist() == EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_async_matrix_without_distances():
+    def post(**kwargs):
+        mock_response = Mock(status=200)
+        mock_response.read = AsyncMock(return_value=_response(kwargs["data"]))
+        context_manager = Mock()
+        context_manager.__aenter__ = AsyncMock(return_value=mock_response)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+    session = Mock()
+    session.post.side_effect = post
+
+    async with AsyncClient("test", "test") as client:
+        with patch.object(client, "_get_session", return_value=session):
+            response = await client.time_filter_fast_proto_matrix(
+                origin_coordinates=ORIGINS,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                max_concurrency=1,
+            )
+
+    assert session.post.call_count == 2
+    assert response.travel_times.tolist() == EXPECTED
+    assert response.distances is None
+
+
+def _matrix_kwargs(**kwargs):
+    return dict(
+        origin_coordinates=ORIGINS,
+        destination_coordinates=DESTINATIONS,
+        transportation=ProtoTransportation.DRIVING,
+        travel_time=3600,
+        request_type=RequestType.ONE_TO_MANY,
+        country=ProtoCountry.UNITED_KINGDOM,
+        with_distance=False,
+        **kwargs,
+    )
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        Client("test", "test", max_concurrency=0)
+    with pytest.raises(ValueError):
+        AsyncClient("test", "test", max_concurrency=0)
+
+    with Client("test", "test") as client:
+        with pytest.raises(ValueError):
+            client.time_filter_fast_proto_matrix(**_matrix_kwargs(max_concurrency=0))
+
+
+@pytest.mark.asyncio
+async def test_async_invalid_max_concurrency():
+    async with AsyncClient("test", "test") as client:
+        with pytest.raises(ValueError):
+            await client.time_filter_fast_proto_matrix(
+                **_matrix_kwargs(max_concurrency=0)
+            )
+
+
+def test_many_to_one_rows_use_arrival_locations():
+    request = TimeFilterFastProtoMatrixRequest(
+        ORIGINS,
+        DESTINATIONS,
+        ProtoTransportation.DRIVING,
+        3600,
+        RequestType.MANY_TO_ONE,
+        ProtoCountry.UNITED_KINGDOM,
+        False,
+    )
+
+    row = request.split_origins()[1].get_request()
+    assert row.HasField("manyToOneRequest")
+    assert not row.HasField("oneToManyRequest")
+    assert row.manyToOneRequest.arrivalLocation.lat == pytest.approx(51.001)
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from traveltimepy import AsyncClient, Client
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.requests.time_filter_proto import (
+    ProtoCountry,
+    ProtoTransportation,
+    RequestType,
+    TimeFilterFastProtoRequest,
+)
+
+TimeFilterFastRequest_pb2 = pytest.importorskip(
+    "traveltimepy.proto.TimeFilterFastRequest_pb2"
+)
+TimeFilterFastResponse_pb2 = pytest.importorskip(
+    "traveltimepy.proto.TimeFilterFastResponse_pb2"
+)
+
+ORIGIN = Coordinates(lat=51.0, lng=0.0)
+# Latitude deltas of 1..25 identify each destination in the mocked responses
+DESTINATIONS = np.array([[51.0 + i / 10**5, 0.0] for i in range(1, 26)])
+
+
+def _latitude_deltas(data: bytes):
+    request = TimeFilterFastRequest_pb2.TimeFilterFastRequest()
+    request.ParseFromString(data)
+    return request.oneToManyRequest.locationDeltas[::2]
+
+
+def _echo_response(data: bytes):
+    """Mock proto response with each destination's latitude delta as travel time."""
+    response = TimeFilterFastResponse_pb2.TimeFilterFastResponse()
+    response.properties.travelTimes.extend(_latitude_deltas(data))
+    return response.SerializeToString()
+
+
+def _request(shard_size: int = 10):
+    return TimeFilterFastProtoRequest(
+        ORIGIN,
+        DESTINATIONS,
+        ProtoTransportation.DRIVING,
+        3600,
+        RequestType.ONE_TO_MANY,
+        ProtoCountry.UNITED_KINGDOM,
+        False,
+    ).split_destinations(shard_size)
+
+
+def test_split_destinations_keeps_order():
+    parts = _request(10)
+
+    assert [len(part.destinationCoordinates) for part in parts] == [10, 10, 5]
+    assert np.array_equal(
+        np.concatenate([part.destinationCoordinates for part in parts]), DESTINATIONS
+    )
+
+
+def test_split_destinations_small_request():
+    assert len(_request(100)) == 1
+
+
+def test_sync_shards_are_merged_in_order():
+    def post(**kwargs):
+        return Mock(status_code=200, content=_echo_response(kwargs["data"]))
+
+    with Client("test", "test") as client:
+        with patch.object(client._session, "post", side_effect=post) as mock_post:
+            response = client.time_filter_fast_proto(
+                origin_coordinate=ORIGIN,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                shard_size=10,
+                columnar=True,
+            )
+
+    assert mock_post.call_count == 3
+    assert response.travel_times.tolist() == list(range(1, 26))
+
+
+def test_sync_failed_shard_is_retried_alone():
+    lock = threading.Lock()
+    failed = []
+
+    def post(**kwargs):
+        with lock:
+            # The last shard fails once with a server error
+            if _latitude_deltas(kwargs["data"])[0] == 21 and not failed:
+                failed.append(True)
+                return Mock(status_code=500, headers={})
+        return Mock(status_code=200, content=_echo_response(kwargs["data"]))
+
+    with Client("test", "test") as client:
+        with patch.object(client._session, "post", side_effect=post) as mock_post:
+            response = client.time_filter_fast_proto(
+                origin_coordinate=ORIGIN,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                shard_size=10,
+            )
+
+    assert mock_post.call_count == 4
+    assert response.travel_times == list(range(1, 26))
+
+
+@pytest.mark.asyncio
+async def test_async_shards_are_merged_in_order():
+    def post(**kwargs):
+        mock_response = Mock(status=200)
+        mock_response.read = AsyncMock(return_value=_echo_response(kwargs["data"]))
+        context_manager = Mock()
+        context_manager.__aenter__ = AsyncMock(return_value=mock_response)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+    session = Mock()
+    session.post.side_effect = post
+
+    async with AsyncClient("test", "test") as client:
+        with patch.object(client, "_get_session", return_value=session):
+            response = await client.time_filter_fast_proto(
+                origin_coordinate=ORIGIN,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                shard_size=10,
+                columnar=True,
+            )
+
+    assert session.post.call_count == 3
+    assert response.travel_times.tolist() == list(range(1, 26))
+
+
+def test_invalid_shard_size_raises():
+    with Client("test", "test") as client:
+        with pytest.raises(ValueError):
+            client.time_filter_fast_proto(
+                origin_coordinate=ORIGIN,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                shard_size=0,
+            )
+
+
+@pytest.mark.asyncio
+async def test_async_shards_in_flight_are_bounded():
+    in_flight = []
+    peak = []
+
+    def post(**kwargs):
+        mock_response = Mock(status=200)
+        mock_response.read = AsyncMock(return_value=_echo_response(kwargs["data"]))
+
+        async def enter(*args):
+            in_flight.append(True)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        async def exit(*args):
+            in_flight.pop()
+
+        context_manager = Mock()
+        context_manager.__aenter__ = enter
+        context_manager.__aexit__ = exit
+        return context_manager
+
+    session = Mock()
+    session.post.side_effect = post
+
+    async with AsyncClient("test", "test", max_concurrency=2) as client:
+        with patch.object(client, "_get_session", return_value=session):
+            response = await client.time_filter_fast_proto(
+                origin_coordinate=ORIGIN,
+                destination_coordinates=DESTINATIONS,
+                transportation=ProtoTransportation.DRIVING,
+                travel_time=3600,
+                request_type=RequestType.ONE_TO_MANY,
+                country=ProtoCountry.UNITED_KINGDOM,
+                with_distance=False,
+                shard_size=5,
+                columnar=True,
+            )
+
+    assert session.post.call_count == 5
+    assert max(peak) == 2
+    assert response.travel_times.tolist() == list(range(1, 26))
@@ -0,0 +1,142 @@
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from traveltimepy import Client
+from traveltimepy.requests.time_map import TimeMapRequest
+from traveltimepy.requests.time_map_fast import TimeMapFastArrivalSearches
+from traveltimepy.responses.time_map import (
+    CompactShape,
+    TimeMapCompactResponse,
+    TimeMapResponse,
+)
+
+shell = [
+    {"lat": 51.0, "lng": -0.1},
+    {"lat": 51.0, "lng": 0.1},
+    {"lat": 51.2, "lng": 0.1},
+    {"lat": 51.2, "lng": -0.1},
+    {"lat": 51.0, "lng": -0.1},
+]
+hole = [
+    {"lat": 51.05, "lng": -0.05},
+    {"lat": 51.05, "lng": 0.05},
+    {"lat": 51.1, "lng": 0.05},
+    {"lat": 51.05, "lng": -0.05},
+]
+
+
+def _body(*search_ids: str) -> str:
+    return json.dumps(
+        {
+            "results": [
+                {
+                    "search_id": id,
+                    "shapes": [
+                        {"shell": shell, "holes": [hole]},
+                        {"shell": shell, "holes": []},
+                    ],
+                }
+                for id in search_ids
+            ]
+        }
+    )
+
+
+def test_shapes_are_coordinate_arrays():
+    response = TimeMapCompactResponse.model_validate_json(_body("search"))
+
+    shape = response.results[0].shapes[0]
+    assert shape.shell.dtype == np.float64
+    assert shape.shell.shape == (5, 2)
+    np.testing.assert_array_equal(shape.holes[0][1], [51.05, 0.05])
+
+
+def test_to_shape_equals_model_response():
+    compact = TimeMapCompactResponse.model_validate_json(_body("search"))
+    models = TimeMapResponse.model_validate_json(_body("search"))
+
+    assert [shape.to_shape() for shape in compact.results[0].shapes] == (
+        models.results[0].shapes
+    )
+
+
+def test_to_shapely():
+    result = TimeMapCompactResponse.model_validate_json(_body("search")).results[0]
+
+    polygon = result.shapes[0].to_polygon()
+    assert polygon.exterior.coords[1] == (0.1, 51.0)
+    assert len(polygon.interiors) == 1
+    assert polygon.area == pytest.approx(0.2 * 0.2 - 0.1 * 0.05 / 2)
+
+    multipolygon = result.to_multipolygon()
+    assert len(multipolygon.geoms) == 2
+
+
+def test_empty_shell():
+    shape = CompactShape.model_validate({"shell": [], "holes": []})
+
+    assert shape.shell.shape == (0, 2)
+
+
+@pytest.mark.parametrize(
+    "shell",
+    [[{"lat": 51.0}], [{"lat": 51.0, "lng": "east"}], [None], None],
+)
+@pytest.mark.parametrize("response_class", [TimeMapResponse, TimeMapCompactResponse])
+def test_malformed_shell_raises_validation_error(response_class, shell):
+    body = {"results": [{"search_id": "a", "shapes": [{"shell": shell, "holes": []}]}]}
+
+    with pytest.raises(ValidationError):
+        response_class.model_validate_json(json.dumps(body))
+
+
+def test_merge_keeps_response_class():
+    request = TimeMapRequest(
+        departure_searches=[], arrival_searches=[], unions=None, intersections=None
+    )
+
+    merged = request.merge_as(
+        TimeMapCompactResponse,
+        [
+            TimeMapCompactResponse.model_validate_json(_body("b")),
+            TimeMapCompactResponse.model_validate_json(_body("a")),
+        ],
+    )
+
+    assert isinstance(merged, TimeMapCompactResponse)
+    assert [result.search_id for result in merged.results] == ["a", "b"]
+
+
+@pytest.mark.parametrize("response_class", [TimeMapResponse, TimeMapCompactResponse])
+def test_merge_without_responses_is_empty(response_class):
+    request = TimeMapRequest(
+        departure_searches=[], arrival_searches=[], unions=None, intersections=None
+    )
+
+    merged = request.merge_as(response_class, [])
+
+    assert isinstance(merged, response_class)
+    assert merged.results == []
+
+
+def test_empty_searches_return_empty_response():
+    searches = TimeMapFastArrivalSearches(one_to_many=[], many_to_one=[])
+
+    with Client("test", "test") as client:
+        responses = [
+            client.time_map(arrival_searches=[], departure_searches=[]),
+            client.time_map_fast(arrival_searches=searches),
+        ]
+        compact_responses = [
+            client.time_map_compact(arrival_searches=[], departure_searches=[]),
+            client.time_map_fast_compact(arrival_searches=searches),
+        ]
+
+    assert all(isinstance(response, TimeMapResponse) for response in responses)
+    assert all(
+        isinstance(response, TimeMapCompactResponse) for response in compact_responses
+    )
+    assert all(response.results == [] for response in responses + compact_responses)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from traveltimepy.wkt import (
+    LineStringArray,
+    MultiLineStringArray,
+    MultiPointArray,
+    MultiPolygonArray,
+    PointModel,
+    PolygonArray,
+    parse_wkt,
+    parse_wkt_arrays,
+)
+from traveltimepy.wkt.error import InvalidWKTStringError
+
+poly_with_hole_wkt = "POLYGON((0 0, 0 10, 10 10, 10 0, 0 0), (2 2, 2 3, 3 3, 3 2, 2 2))"
+mpoly_wkt = (
+    "MULTIPOLYGON(((0 0, 0 10, 10 10, 10 0, 0 0), (2 2, 2 3, 3 3, 3 2, 2 2)), "
+    "((20 20, 20 21, 21 21, 20 20)), "
+    "((30 30, 30 31, 31 31, 30 30), (30.1 30.5, 30.2 30.5, 30.1 30.6, 30.1 30.5), "
+    "(30.5 30.8, 30.6 30.8, 30.5 30.9, 30.5 30.8)))"
+)
+
+
+@pytest.mark.parametrize(
+    "wkt, array_class",
+    [
+        ("LINESTRING(0 0, 1 1, 2 2)", LineStringArray),
+        (poly_with_hole_wkt, PolygonArray),
+        ("MULTIPOINT(0 1, 2 3)", MultiPointArray),
+        ("MULTILINESTRING((0 0, 1 1), (2 2, 3 3, 4 4))", MultiLineStringArray),
+        (mpoly_wkt, MultiPolygonArray),
+    ],
+)
+def test_model_view_equals_parsed_model(wkt, array_class):
+    parsed = parse_wkt_arrays(wkt)
+
+    assert isinstance(parsed, array_class)
+    assert parsed.type == parse_wkt(wkt).type
+    assert parsed.model == parse_wkt(wkt)
+    assert parsed.model is parsed.model
+
+
+def test_point_is_parsed_to_model():
+    assert parse_wkt_arrays("POINT (1 2)") == parse_wkt("POINT (1 2)")
+    assert isinstance(parse_wkt_arrays("POINT (1 2)"), PointModel)
+
+
+def test_rings_are_coordinate_arrays():
+    parsed = parse_wkt_arrays(mpoly_wkt)
+
+    assert isinstance(parsed, MultiPolygonArray)
+    assert [len(polygon.interiors) for polygon in parsed.coordinates] == [1, 0, 2]
+    rings = [
+        ring
+        for polygon in parsed.coordinates
+        for ring in [polygon.exterior, *polygon.interiors]
+    ]
+    for ring in rings:
+        assert ring.dtype == np.float64
+        assert ring.ndim == 2 and ring.shape[1] == 2
+    np.testing.assert_array_equal(
+        parsed.coordinates[0].interiors[0],
+        [[2, 2], [2, 3], [3, 3], [3, 2], [2, 2]],
+    )
+
+
+def test_invalid_wkt():
+    with pytest.raises(InvalidWKTStringError):
+        parse_wkt_arrays("POLYGON((0 0, 0 2")
@@ -0,0 +1,130 @@
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from traveltimepy import Client
+from traveltimepy.requests.time_map_fast import TimeMapFastArrivalSearches
+from traveltimepy.requests.time_map_wkt import TimeMapWktRequest
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
+from traveltimepy.wkt import PolygonArray, PolygonModel, parse_wkt, parse_wkt_many
+from traveltimepy.wkt.error import InvalidWKTStringError
+
+poly_wkt = "POLYGON((0 0, 0 2, 2 2, 2 0, 0 0))"
+
+
+def _body(*search_ids: str, shape: str = poly_wkt) -> str:
+    return json.dumps(
+        {"results": [{"search_id": id, "shape": shape} for id in search_ids]}
+    )
+
+
+def test_lazy_result_keeps_wkt_string():
+    response = TimeMapWKTLazyResponse.model_validate_json(_body("search"))
+
+    result = response.results[0]
+    assert result.shape == poly_wkt
+    assert result._geometry is None
+    assert isinstance(result.geometry, Polygon)
+    assert result.geometry is result.geometry
+    assert result.geometry.area == 4
+
+
+def test_invalid_wkt_raises_on_access():
+    response = TimeMapWKTLazyResponse.model_validate_json(
+        _body("search", shape="POLYGON((0 0, 0 2")
+    )
+
+    with pytest.raises(InvalidWKTStringError):
+        response.results[0].geometry
+
+
+@pytest.mark.parametrize("response_class", [TimeMapWKTResponse, TimeMapWKTLazyResponse])
+def test_merge_keeps_response_class(response_class):
+    request = TimeMapWktRequest(departure_searches=[], arrival_searches=[])
+
+    merged = request.merge_as(
+        response_class,
+        [
+            response_class.model_validate_json(_body("b")),
+            response_class.model_validate_json(_body("a")),
+        ],
+    )
+
+    assert isinstance(merged, response_class)
+    assert [result.search_id for result in merged.results] == ["a", "b"]
+
+
+@pytest.mark.parametrize("response_class", [TimeMapWKTResponse, TimeMapWKTLazyResponse])
+def test_merge_without_responses_is_empty(response_class):
+    request = TimeMapWktRequest(departure_searches=[], arrival_searches=[])
+
+    merged = request.merge_as(response_class, [])
+
+    assert isinstance(merged, response_class)
+    assert merged.results == []
+
+
+def test_empty_searches_return_empty_response():
+    searches = TimeMapFastArrivalSearches(one_to_many=[], many_to_one=[])
+
+    with Client("test", "test") as client:
+        responses = [
+            client.time_map_wkt(arrival_searches=[], departure_searches=[]),
+            client.time_map_fast_wkt(arrival_searches=searches),
+        ]
+        lazy_responses = [
+            client.time_map_wkt_lazy(arrival_searches=[], departure_searches=[]),
+            client.time_map_fast_wkt_lazy(arrival_searches=searches),
+        ]
+
+    assert all(isinstance(response, TimeMapWKTResponse) for response in responses)
+    assert all(
+        isinstance(response, TimeMapWKTLazyResponse) for response in lazy_responses
+    )
+    assert all(response.results == [] for response in responses + lazy_responses)
+
+
+def test_lazy_result_arrays():
+    response = TimeMapWKTLazyResponse.model_validate_json(_body("search"))
+    response.load_geometries()
+
+    arrays = response.results[0].arrays
+    assert isinstance(arrays, PolygonArray)
+    assert arrays is response.results[0].arrays
+    np.testing.assert_array_equal(
+        arrays.exterior, [[0, 0], [0, 2], [2, 2], [2, 0], [0, 0]]
+    )
+    assert arrays.model == parse_wkt(poly_wkt)
+
+
+def test_parsed_response_is_unchanged():
+    response = TimeMapWKTResponse.model_validate_json(_body("search"))
+
+    assert isinstance(response.results[0].shape, PolygonModel)
+
+
+def test_load_geometries_parses_remaining_shapes_at_once():
+    response = TimeMapWKTLazyResponse.model_validate_json(_body("a", "b", "c"))
+    first = response.results[0].geometry
+
+    geometries = response.load_geometries(workers=2)
+
+    assert geometries[0] is first
+    assert [geometry.area for geometry in geometries] == [4, 4, 4]
+    assert all(result._geometry is not None for result in response.results)
+
+
+def test_parsed_response_decodes_shapes_at_once():
+    with patch(
+        "traveltimepy.responses.time_map_wkt.parse_wkt_many", wraps=parse_wkt_many
+    ) as mock_parse:
+        response = TimeMapWKTResponse.model_validate_json(_body("a", "b"))
+
+    mock_parse.assert_called_once_with([poly_wkt, poly_wkt])
+    assert response.results[0].shape == parse_wkt(poly_wkt)
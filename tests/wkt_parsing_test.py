@@ -3,6 +3,7 @@ import pytest  # noqa
 from traveltimepy.requests.common import Coordinates
 from traveltimepy.wkt import (
     parse_wkt,
+    parse_wkt_many,
     PointModel,
     LineStringModel,
     PolygonModel,
@@ -138,3 +139,15 @@ def test_unsupported_geometry_type():
     unsupported_wkt = "GEOMETRYCOLLECTION(POINT(2 3),LINESTRING(2 3, 3 4))"
     with pytest.raises(InvalidGeometryTypeError):
         parse_wkt(unsupported_wkt)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_wkt_many(workers):
+    wkts = [point_wkt, line_wkt, poly_wkt, mp_wkt, mls_wkt, mpoly_wkt]
+
+    assert parse_wkt_many(wkts, workers) == [parse_wkt(wkt) for wkt in wkts]
+
+
+def test_parse_wkt_many_reports_invalid_string():
+    with pytest.raises(InvalidWKTStringError, match="POLYGON\\(\\(0 0"):
+        parse_wkt_many([point_wkt, "POLYGON((0 0"])
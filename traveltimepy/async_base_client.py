@@ -1,17 +1,21 @@
 import asyncio
-import json
-from typing import Optional, Dict, TypeVar, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import aiohttp
 from aiohttp import ClientSession, ClientResponse, BasicAuth, TCPConnector
-from aiolimiter import AsyncLimiter
 from pydantic import BaseModel, ValidationError
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_none,
-    retry_if_exception_type,
-)
 
 try:
     from traveltimepy.proto import TimeFilterFastResponse_pb2  # type: ignore
@@ -22,25 +26,38 @@ except ImportError:
     PROTOBUF_AVAILABLE = False
     TimeFilterFastResponse_pb2 = None  # type: ignore
     GeohashFastResponse_pb2 = None  # type: ignore
+from traveltimepy import json_backend
 from traveltimepy.accept_type import AcceptType
-from traveltimepy.base_client import BaseClient, __version__
+from traveltimepy.base_client import BaseClient, P, __version__
+from traveltimepy.cache import ResponseCache
+from traveltimepy.coalescing import CoalescingStats, SingleFlight
 from traveltimepy.errors import (
     TravelTimeError,
     TravelTimeJsonError,
     TravelTimeServerError,
 )
+from traveltimepy.rate_limit import RateLimiter
 from traveltimepy.requests.request import TravelTimeRequest
+from traveltimepy.retry import RetryPolicy, parse_retry_after
 from traveltimepy.requests.time_filter_proto import (
     TimeFilterFastProtoRequest,
 )
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
+)
 from traveltimepy.requests.geohash_fast_proto import (
     GeohashFastProtoRequest,
 )
 from traveltimepy.responses.error import ResponseError
-from traveltimepy.responses.time_filter_proto import TimeFilterProtoResponse
 from traveltimepy.responses.geohash_fast_proto import GeohashFastProtoResponse
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
 
 T = TypeVar("T", bound=BaseModel)
+A = TypeVar("A")
+R = TypeVar("R")
 
 
 class AsyncBaseClient(BaseClient):
@@ -53,6 +70,40 @@ class AsyncBaseClient(BaseClient):
         max_rpm: Maximum requests per minute for rate limiting (default: 60)
         use_ssl: Whether to use SSL for connections (default: True)
         split_large_requests: Split large requests into smaller requests for performance (default: True)
+        split_size: Maximum number of searches of each kind per split request (default: 10)
+        max_locations_per_part: Also balance split requests by the number of location IDs
+            their searches reference, keeping each below this count (default: None)
+        retry_policy: Backoff between retries, see RetryPolicy (default: exponential
+            backoff with jitter starting at 0.5 seconds, honoring Retry-After)
+        rate_limiter: Token bucket limiting the request rate, which can be shared with
+            other clients and processes (default: RateLimiter(per_minute=max_rpm))
+        proto_max_rpm: Maximum requests per minute to the proto time-filter endpoint,
+            limited separately from JSON endpoints. None for max_rpm, or to share
+            rate_limiter when one is given (default: None)
+        proto_rate_limiter: Token bucket for the proto time-filter endpoint, takes
+            precedence over proto_max_rpm (default: None)
+        geohash_proto_max_rpm: Maximum requests per minute to the proto geohash
+            endpoint. None to share the budget of the proto time-filter endpoint, which
+            is on the same host (default: None)
+        geohash_proto_rate_limiter: Token bucket for the proto geohash endpoint, takes
+            precedence over geohash_proto_max_rpm (default: None)
+        cache: Cache of JSON responses, looked up for every part of a split request
+            before sending it, e.g. InMemoryCache or SqliteCache (default: None)
+        search_cache: Cache of individual search results, looked up for every search
+            of time_filter_fast so that only uncached searches are sent (default: None)
+        connection_limit: Maximum number of open connections per pool. JSON and proto
+            requests use separate pools, so one cannot starve the other (default: 100)
+        connection_limit_per_host: Maximum number of open connections per host and pool,
+            0 for no limit (default: 0)
+        dns_cache_ttl: Seconds to cache resolved host addresses, None to cache them for
+            the lifetime of the client (default: 300)
+        keepalive_timeout: Seconds to keep idle connections open for reuse (default: 15)
+        keep_alive: Keep connections open for reuse by later requests (default: True)
+        max_concurrency: Maximum number of requests a single call sends at once, such
+            as the shards of a proto request (default: 10)
+        coalesce_requests: Send identical requests made concurrently only once, sharing
+            the response between the callers. Shared responses are the same objects,
+            so they should not be modified (default: False)
         _host: API host (default: "api.traveltimeapp.com")
         _proto_host: Proto API host (default: "proto.api.traveltimeapp.com")
         _user_agent: User agent string for requests
@@ -67,6 +118,23 @@ class AsyncBaseClient(BaseClient):
         max_rpm: int = 60,
         use_ssl: bool = True,
         split_large_requests: bool = True,
+        split_size: int = 10,
+        max_locations_per_part: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        proto_max_rpm: Optional[int] = None,
+        proto_rate_limiter: Optional[RateLimiter] = None,
+        geohash_proto_max_rpm: Optional[int] = None,
+        geohash_proto_rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        search_cache: Optional[ResponseCache] = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        dns_cache_ttl: Optional[int] = 300,
+        keepalive_timeout: float = 15,
+        keep_alive: bool = True,
+        max_concurrency: int = 10,
+        coalesce_requests: bool = False,
         _host: str = "api.traveltimeapp.com",
         _proto_host: str = "proto.api.traveltimeapp.com",
         _user_agent: str = f"Travel Time Python SDK {__version__}",
@@ -79,17 +147,39 @@ class AsyncBaseClient(BaseClient):
             max_rpm=max_rpm,
             use_ssl=use_ssl,
             split_large_requests=split_large_requests,
+            split_size=split_size,
+            max_locations_per_part=max_locations_per_part,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            proto_max_rpm=proto_max_rpm,
+            proto_rate_limiter=proto_rate_limiter,
+            geohash_proto_max_rpm=geohash_proto_max_rpm,
+            geohash_proto_rate_limiter=geohash_proto_rate_limiter,
+            cache=cache,
+            search_cache=search_cache,
             _host=_host,
             _proto_host=_proto_host,
             _user_agent=_user_agent,
         )
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.keep_alive = keep_alive
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.coalesce_requests = coalesce_requests
+        self.coalescing_stats = CoalescingStats()
+        self._single_flight = SingleFlight(self.coalescing_stats)
         self._session: Optional[ClientSession] = None
-        self.async_limiter = AsyncLimiter(max_rate=self.max_rpm, time_period=60)
+        self._proto_session: Optional[ClientSession] = None
 
     async def close(self):
-        """Close the aiohttp session if it exists."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the aiohttp sessions if they exist."""
+        for session in (self._session, self._proto_session):
+            if session and not session.closed:
+                await session.close()
 
     async def __aenter__(self):
         return self
@@ -97,15 +187,54 @@ class AsyncBaseClient(BaseClient):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    async def _get_session(self) -> ClientSession:
-        if self._session is None:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                connector=TCPConnector(ssl=self.use_ssl),
-            )
-        elif self._session.closed:
+    def _create_connector(self) -> TCPConnector:
+        return TCPConnector(
+            ssl=self.use_ssl,
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            force_close=not self.keep_alive,
+            keepalive_timeout=self.keepalive_timeout if self.keep_alive else None,
+        )
+
+    def _create_session(self) -> ClientSession:
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=self._create_connector(),
+        )
+
+    async def _get_session(self, proto: bool = False) -> ClientSession:
+        # JSON and proto requests have separate connection pools
+        if proto:
+            if self._proto_session is None:
+                self._proto_session = self._create_session()
+            session = self._proto_session
+        else:
+            if self._session is None:
+                self._session = self._create_session()
+            session = self._session
+
+        if session.closed:
             raise RuntimeError("Session is closed")
-        return self._session
+        return session
+
+    async def _coalesced(self, key: Hashable, call: Callable[[], Awaitable[Any]]):
+        if not self.coalesce_requests:
+            return await call()
+        return await self._single_flight.run(key, call)
+
+    async def _off_loop(
+        self,
+        cache: Optional[ResponseCache],
+        function: Callable[..., R],
+        *args: Any,
+    ) -> R:
+        """Call `function`, which uses `cache`, in the default executor of the loop if
+        the cache blocks, such as `SqliteCache`."""
+        if cache is None or not cache.blocking:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
 
     async def _make_request(
         self,
@@ -115,23 +244,61 @@ class AsyncBaseClient(BaseClient):
         response_class: Type[T],
         data: Optional[str] = None,
         params: Optional[Dict[str, str]] = None,
+        cache_key: Optional[str] = None,
     ) -> T:
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
-        )
+        @self._retrying(self._endpoint_name(url))
         async def _make_request_with_retry():
             session = await self._get_session()
-            async with self.async_limiter:
-                async with session.request(
-                    method=method, url=url, headers=headers, data=data, params=params
-                ) as response:
-                    return await self._handle_response(response, response_class)
+            await self.rate_limiter.acquire_async()
+            async with session.request(
+                method=method, url=url, headers=headers, data=data, params=params
+            ) as response:
+                result = await self._handle_response(response, response_class)
+                if cache_key is not None:
+                    # The body was already read by `_handle_response`
+                    body = await response.read()
+                    await self._off_loop(
+                        self.cache, self._store_response, cache_key, body
+                    )
+                return result
+
+        key = (
+            method,
+            url,
+            tuple(sorted(headers.items())),
+            data,
+            tuple(sorted(params.items())) if params else None,
+            response_class,
+        )
+        return await self._coalesced(key, _make_request_with_retry)
 
-        return await _make_request_with_retry()
+    async def _post_part(
+        self,
+        response_class: Type[T],
+        endpoint: str,
+        accept_type: AcceptType,
+        part: TravelTimeRequest,
+    ) -> T:
+        data = part.to_json()
+        cache_key = self._cache_key(endpoint, accept_type, data)
+        cached = await self._off_loop(
+            self.cache, self._cached_response, response_class, cache_key
+        )
+        if cached is not None:
+            return cached
+
+        response = await self._make_request(
+            "POST",
+            self._build_url(endpoint),
+            self._get_json_headers(accept_type),
+            response_class,
+            data=data,
+            cache_key=cache_key,
+        )
+        await self._off_loop(
+            self.search_cache, self._cache_search_results, part, response
+        )
+        return response
 
     async def _api_call_post(
         self,
@@ -140,22 +307,50 @@ class AsyncBaseClient(BaseClient):
         accept_type: AcceptType,
         request: TravelTimeRequest,
     ) -> T:
-        url = self._build_url(endpoint)
+        # Only searches without cached results are sent
+        uncached, cached = await self._off_loop(
+            self.search_cache, self._split_cached_searches, request
+        )
+        if uncached is None:
+            return cast(T, cached)
 
-        split_size = 10 if self.split_large_requests else 1
+        tasks = [
+            self._post_part(response_class, endpoint, accept_type, part)
+            for part in self._split_request(uncached)
+        ]
+        responses = await asyncio.gather(*tasks)
+        return request.merge_as(
+            response_class, responses if cached is None else [cached, *responses]
+        )
+
+    async def _api_call_post_iter(
+        self,
+        response_class: Type[T],
+        endpoint: str,
+        accept_type: AcceptType,
+        request: TravelTimeRequest,
+    ) -> AsyncIterator[T]:
+        uncached, cached = await self._off_loop(
+            self.search_cache, self._split_cached_searches, request
+        )
+        if cached is not None:
+            yield cached
+        if uncached is None:
+            return
 
         tasks = [
-            self._make_request(
-                "POST",
-                url,
-                self._get_json_headers(accept_type),
-                response_class,
-                data=part.model_dump_json(),
+            asyncio.ensure_future(
+                self._post_part(response_class, endpoint, accept_type, part)
             )
-            for part in request.split_searches(split_size)
+            for part in self._split_request(uncached)
         ]
-        responses = await asyncio.gather(*tasks)
-        return request.merge(responses)
+        try:
+            # Each part is yielded as soon as it completes, without merging
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _api_call_get(
         self,
@@ -174,47 +369,97 @@ class AsyncBaseClient(BaseClient):
             params=params,
         )
 
+    async def _make_proto_request(
+        self, req: TimeFilterFastProtoRequest, response_class: Type[P]
+    ) -> P:
+        transportation_mode = self._get_transportation_mode(req.transportation)
+        url = f"https://{self._proto_host}/api/v3/{req.country.value}/time-filter/fast/{transportation_mode}"
+        data = req.get_request().SerializeToString()
+
+        @self._retrying("time-filter/fast/proto")
+        async def _make_proto_request_with_retry():
+            session = await self._get_session(proto=True)
+            await self.proto_rate_limiter.acquire_async()
+
+            async with session.post(
+                url=url,
+                headers=self._get_proto_headers(),
+                data=data,
+                auth=BasicAuth(self.app_id, self.api_key),
+            ) as response:
+                content = await response.read()
+                if response.status != 200:
+                    self._handle_proto_error(response.status, response.headers)
+                else:
+                    response_body = (
+                        TimeFilterFastResponse_pb2.TimeFilterFastResponse()  # type: ignore
+                    )
+                    response_body.ParseFromString(content)
+                    return response_class.from_proto(response_body.properties)
+
+        return await self._coalesced(
+            (url, data, response_class), _make_proto_request_with_retry
+        )
+
+    async def _gather_limited(
+        self,
+        function: Callable[[A], Awaitable[R]],
+        items: List[A],
+        limit: int,
+    ) -> List[R]:
+        """Await `function` for every item with at most `limit` of them in flight,
+        returning the results in the order of `items`."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _limited(item: A) -> R:
+            async with semaphore:
+                return await function(item)
+
+        return list(await asyncio.gather(*[_limited(item) for item in items]))
+
     async def _api_call_proto(
-        self, req: TimeFilterFastProtoRequest
-    ) -> TimeFilterProtoResponse:
+        self,
+        req: TimeFilterFastProtoRequest,
+        response_class: Type[P],
+        shard_size: Optional[int] = None,
+    ) -> P:
         if not PROTOBUF_AVAILABLE:
             raise ImportError(
                 "protobuf is required for proto API calls. "
                 "Install it with: pip install 'traveltimepy[proto]'"
             )
 
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
+        parts = req.split_destinations(shard_size) if shard_size is not None else [req]
+        if len(parts) == 1:
+            return await self._make_proto_request(parts[0], response_class)
+
+        # Shards are sent concurrently and retried independently of each other
+        responses = await self._gather_limited(
+            lambda part: self._make_proto_request(part, response_class),
+            parts,
+            self.max_concurrency,
         )
-        async def _make_proto_request():
-            session = await self._get_session()
-            async with self.async_limiter:
-                transportation_mode = self._get_transportation_mode(req.transportation)
-
-                async with session.post(
-                    url=f"https://{self._proto_host}/api/v3/{req.country.value}/time-filter/fast/{transportation_mode}",
-                    headers=self._get_proto_headers(),
-                    data=req.get_request().SerializeToString(),
-                    auth=BasicAuth(self.app_id, self.api_key),
-                ) as response:
-                    content = await response.read()
-                    if response.status != 200:
-                        self._handle_proto_error(response.status, response.headers)
-                    else:
-                        response_body = (
-                            TimeFilterFastResponse_pb2.TimeFilterFastResponse()  # type: ignore
-                        )
-                        response_body.ParseFromString(content)
-                        return TimeFilterProtoResponse(
-                            travel_times=response_body.properties.travelTimes[:],
-                            distances=response_body.properties.distances[:],
-                        )
-
-        return await _make_proto_request()
+        return response_class.merge(responses)
+
+    async def _api_call_proto_matrix(
+        self, req: TimeFilterFastProtoMatrixRequest, max_concurrency: int
+    ) -> TimeFilterProtoMatrixResponse:
+        if not PROTOBUF_AVAILABLE:
+            raise ImportError(
+                "protobuf is required for proto API calls. "
+                "Install it with: pip install 'traveltimepy[proto]'"
+            )
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # One request per origin, at most `max_concurrency` of them in flight
+        responses = await self._gather_limited(
+            lambda row: self._make_proto_request(row, TimeFilterProtoColumnarResponse),
+            req.split_origins(),
+            min(max_concurrency, self.max_concurrency),
+        )
+        return req.merge(responses)
 
     async def _api_call_geohash_proto(
         self, req: GeohashFastProtoRequest
@@ -225,56 +470,57 @@ class AsyncBaseClient(BaseClient):
                 "Install it with: pip install 'traveltimepy[proto]'"
             )
 
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
-        )
+        transportation_mode = self._get_transportation_mode(req.transportation)
+        url = f"https://{self._proto_host}/api/v3/{req.country.value}/geohash/fast/{transportation_mode}"
+        data = req.get_request().SerializeToString()
+
+        @self._retrying("geohash/fast/proto")
         async def _make_geohash_proto_request():
-            session = await self._get_session()
-            async with self.async_limiter:
-                transportation_mode = self._get_transportation_mode(req.transportation)
-
-                async with session.post(
-                    url=f"https://{self._proto_host}/api/v3/{req.country.value}/geohash/fast/{transportation_mode}",
-                    headers=self._get_proto_headers(),
-                    data=req.get_request().SerializeToString(),
-                    auth=BasicAuth(self.app_id, self.api_key),
-                ) as response:
-                    content = await response.read()
-                    if response.status != 200:
-                        self._handle_proto_error(response.status, response.headers)
-                    else:
-                        response_body = (
-                            GeohashFastResponse_pb2.GeohashFastResponse()  # type: ignore
-                        )
-                        response_body.ParseFromString(content)
-                        return GeohashFastProtoResponse(
-                            ids=response_body.cells.ids[:],
-                            min_travel_times=response_body.cells.minTravelTimes[:],
-                            max_travel_times=response_body.cells.maxTravelTimes[:],
-                            mean_travel_times=response_body.cells.meanTravelTimes[:],
-                        )
-
-        return await _make_geohash_proto_request()
+            session = await self._get_session(proto=True)
+            await self.geohash_proto_rate_limiter.acquire_async()
+
+            async with session.post(
+                url=url,
+                headers=self._get_proto_headers(),
+                data=data,
+                auth=BasicAuth(self.app_id, self.api_key),
+            ) as response:
+                content = await response.read()
+                if response.status != 200:
+                    self._handle_proto_error(response.status, response.headers)
+                else:
+                    response_body = (
+                        GeohashFastResponse_pb2.GeohashFastResponse()  # type: ignore
+                    )
+                    response_body.ParseFromString(content)
+                    return GeohashFastProtoResponse(
+                        ids=response_body.cells.ids[:],
+                        min_travel_times=response_body.cells.minTravelTimes[:],
+                        max_travel_times=response_body.cells.maxTravelTimes[:],
+                        mean_travel_times=response_body.cells.meanTravelTimes[:],
+                    )
+
+        return await self._coalesced((url, data), _make_geohash_proto_request)
 
     async def _handle_response(
         self, response: ClientResponse, response_class: Type[T]
     ) -> T:
-        text = await response.text()
-        json_data = json.loads(text)
+        body = await response.read()
         if response.status != 200:
             try:
-                error = ResponseError.model_validate_json(json.dumps(json_data))
+                json_data = json_backend.loads(body)
+            except json_backend.DecodeError:
+                json_data = {"error": "Invalid JSON response"}
+            try:
+                error = ResponseError.model_validate(json_data)
             except ValidationError:
                 raise TravelTimeError(
                     f"Server returned status code {response.status} "
                     f"with unexpected response: {json_data}"
                 )
+            retry_after = parse_retry_after(response.headers)
             if response.status >= 500:
-                raise TravelTimeServerError(error.description)
+                raise TravelTimeServerError(error.description, retry_after=retry_after)
             else:
                 raise TravelTimeJsonError(
                     status_code=response.status,
@@ -282,6 +528,8 @@ class AsyncBaseClient(BaseClient):
                     description=error.description,
                     documentation_link=error.documentation_link,
                     additional_info=error.additional_info,
+                    retry_after=retry_after,
                 )
         else:
-            return response_class.model_validate(json_data)
+            # Validated straight from the body, without an intermediate dict tree
+            return response_class.model_validate_json(body)
@@ -2,7 +2,7 @@
 # This file is automatically generated from client.py
 # Do not edit this file directly. Run scripts/generate_async_client.py instead.
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Union
 
 from geojson_pydantic import FeatureCollection
 
@@ -81,6 +81,10 @@ from traveltimepy.requests.time_filter_proto import (
     TimeFilterFastProtoTransportation,
     RequestType,
     ProtoCountry,
+    ProtoDestinations,
+)
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
 )
 from traveltimepy.requests.geohash_fast_proto import (
     GeohashFastProtoRequest,
@@ -114,10 +118,17 @@ from traveltimepy.responses.time_filter import TimeFilterResponse
 from traveltimepy.responses.time_filter_fast import (
     TimeFilterFastResponse,
 )
-from traveltimepy.responses.time_filter_proto import TimeFilterProtoResponse
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoResponse,
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
 from traveltimepy.responses.geohash_fast_proto import GeohashFastProtoResponse
-from traveltimepy.responses.time_map import TimeMapResponse
-from traveltimepy.responses.time_map_wkt import TimeMapWKTResponse
+from traveltimepy.responses.time_map import TimeMapCompactResponse, TimeMapResponse
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
 from traveltimepy.responses.zones import (
     PostcodesDistrictsResponse,
     PostcodesSectorsResponse,
@@ -187,16 +198,75 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    def aiter_time_filter(
+        self,
+        locations: List[Location],
+        departure_searches: List[TimeFilterDepartureSearch],
+        arrival_searches: List[TimeFilterArrivalSearch],
+    ) -> AsyncIterator[TimeFilterResponse]:
+        """Stream time_filter results part by part as the split request completes.
+
+        Same request as time_filter, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            departure_searches: Departure-based searches with specific departure times.
+            arrival_searches: Arrival-based searches with specific arrival times.
+
+        Returns:
+            AsyncIterator[TimeFilterResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeFilterResponse,
+            "time-filter",
+            AcceptType.JSON,
+            TimeFilterRequest(
+                locations=locations,
+                departure_searches=departure_searches,
+                arrival_searches=arrival_searches,
+            ),
+        )
+
+    def aiter_time_filter_fast(
+        self, locations: List[Location], arrival_searches: TimeFilterFastArrivalSearches
+    ) -> AsyncIterator[TimeFilterFastResponse]:
+        """Stream time_filter_fast results part by part as the split request completes.
+
+        Same request as time_filter_fast, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            arrival_searches: High-performance search configurations with one_to_many
+                             and many_to_one patterns.
+
+        Returns:
+            AsyncIterator[TimeFilterFastResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeFilterFastResponse,
+            "time-filter/fast",
+            AcceptType.JSON,
+            TimeFilterFastRequest(
+                locations=locations, arrival_searches=arrival_searches
+            ),
+        )
+
     async def time_filter_fast_proto(
         self,
         origin_coordinate: Coordinates,
-        destination_coordinates: List[Coordinates],
+        destination_coordinates: ProtoDestinations,
         transportation: TimeFilterFastProtoTransportation,
         travel_time: int,
         request_type: RequestType,
         country: ProtoCountry,
         with_distance: bool,
-    ) -> TimeFilterProtoResponse:
+        shard_size: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[TimeFilterProtoResponse, TimeFilterProtoColumnarResponse]:
         """Calculate ultra-high-performance distance matrix using Protocol Buffers.
 
         Maximum performance endpoint using protobuf format for extremely large datasets.
@@ -205,26 +275,85 @@ class AsyncClient(AsyncBaseClient):
 
         Args:
             origin_coordinate: Single origin coordinate (lat/lng)
-            destination_coordinates: List of destination coordinates
+            destination_coordinates: List of destination coordinates, or an (N, 2)
+                                     array of (lat, lng) rows for large matrices
             transportation: Transportation mode
             travel_time: Maximum journey time in seconds
             request_type: Type of request calculation
             country: Specific country for the calculation
             with_distance: Whether to include distance data in response
+            shard_size: Split destinations into requests of at most this many
+                        destinations, sent concurrently and retried independently.
+                        By default all destinations are sent in a single request.
+            columnar: Return travel times and distances as int32 NumPy arrays,
+                      without per-element validation. Recommended for hundreds of
+                      thousands of destinations or more (default: False)
 
         Returns:
             TimeFilterProtoResponse: Response with travel times and optionally distances for reachable destinations.
+                                     TimeFilterProtoColumnarResponse with columnar=True.
         """
-        return await self._api_call_proto(
-            TimeFilterFastProtoRequest(
-                origin_coordinate,
+        request = TimeFilterFastProtoRequest(
+            origin_coordinate,
+            destination_coordinates,
+            transportation,
+            travel_time,
+            request_type,
+            country,
+            with_distance,
+        )
+        if columnar:
+            return await self._api_call_proto(
+                request, TimeFilterProtoColumnarResponse, shard_size
+            )
+        return await self._api_call_proto(request, TimeFilterProtoResponse, shard_size)
+
+    async def time_filter_fast_proto_matrix(
+        self,
+        origin_coordinates: ProtoDestinations,
+        destination_coordinates: ProtoDestinations,
+        transportation: TimeFilterFastProtoTransportation,
+        travel_time: int,
+        request_type: RequestType,
+        country: ProtoCountry,
+        with_distance: bool,
+        max_concurrency: int = 10,
+    ) -> TimeFilterProtoMatrixResponse:
+        """Calculate a dense many-origin distance matrix using Protocol Buffers.
+
+        Sends one proto request per origin, with at most max_concurrency of them in
+        flight, and assembles the results into N x M matrices. Destinations are
+        converted once and shared by every origin.
+
+        Args:
+            origin_coordinates: Origin coordinates, one matrix row each, or an (N, 2)
+                                array of (lat, lng) rows
+            destination_coordinates: Destination coordinates, one matrix column
+                                     each, or an (M, 2) array of (lat, lng) rows
+            transportation: Transportation mode
+            travel_time: Maximum journey time in seconds
+            request_type: Type of request calculation. With many_to_one, origins
+                          are used as arrival locations.
+            country: Specific country for the calculation
+            with_distance: Whether to include distance data in response
+            max_concurrency: Maximum number of origin requests sent at the same time
+
+        Returns:
+            TimeFilterProtoMatrixResponse: (N, M) int32 travel time matrix and
+                                          optionally distance matrix, with
+                                          unreachable cells set to -1.
+        """
+        return await self._api_call_proto_matrix(
+            TimeFilterFastProtoMatrixRequest(
+                origin_coordinates,
                 destination_coordinates,
                 transportation,
                 travel_time,
                 request_type,
                 country,
                 with_distance,
-            )
+            ),
+            max_concurrency,
         )
 
     async def geohash_fast_proto(
@@ -401,6 +530,36 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    def aiter_time_map(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> AsyncIterator[TimeMapResponse]:
+        """Stream time_map results part by part as the split request completes.
+
+        Same request as time_map, but instead of waiting for every part and merging
+        them, each part's response is yielded as soon as it arrives, in completion
+        order. Results carry their search_id to match them to searches.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+
+        Returns:
+            AsyncIterator[TimeMapResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeMapResponse,
+            "time-map",
+            AcceptType.JSON,
+            TimeMapRequest(
+                arrival_searches=arrival_searches,
+                departure_searches=departure_searches,
+                unions=None,
+                intersections=None,
+            ),
+        )
+
     async def time_map_geojson(
         self,
         arrival_searches: List[TimeMapArrivalSearch],
@@ -430,6 +589,45 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    async def time_map_compact(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+        unions: Optional[List[TimeMapUnion]] = None,
+        intersections: Optional[List[TimeMapIntersection]] = None,
+    ) -> TimeMapCompactResponse:
+        """Creates travel time catchment area polygons with shapes decoded into
+        coordinate arrays.
+
+        Same request as time_map, but each shell and hole is a single `(N, 2)` numpy
+        array of `(lat, lng)` rows instead of a validated model per vertex, which is
+        much faster for detailed shapes. Shapes convert to shapely polygons with
+        `to_polygon()`.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+            unions: Union operations combining multiple isochrone results
+            intersections: Intersection operations finding overlapping areas
+
+        Returns:
+            TimeMapCompactResponse: Polygon data with coordinate arrays, including
+                                   individual isochrones, unions, and intersections.
+        """
+        return await self._api_call_post(
+            TimeMapCompactResponse,
+            "time-map",
+            AcceptType.JSON,
+            TimeMapRequest(
+                arrival_searches=arrival_searches,
+                departure_searches=departure_searches,
+                unions=unions,
+                intersections=intersections,
+            ),
+        )
+
     async def time_map_wkt(
         self,
         arrival_searches: List[TimeMapArrivalSearch],
@@ -488,6 +686,67 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    async def time_map_wkt_lazy(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> TimeMapWKTLazyResponse:
+        """Generate comprehensive travel time isochrones in WKT format, keeping each
+        shape as its WKT string.
+
+        Same request as time_map_wkt, but shapes are not turned into a pydantic model
+        per vertex. Each result's geometry is parsed into a shapely geometry on first
+        access, which is much faster and lighter for large isochrones.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries, parsed into
+                                   shapely geometries on access.
+        """
+        return await self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map",
+            AcceptType.WKT,
+            TimeMapWktRequest(
+                arrival_searches=arrival_searches, departure_searches=departure_searches
+            ),
+        )
+
+    async def time_map_wkt_no_holes_lazy(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> TimeMapWKTLazyResponse:
+        """Generate comprehensive travel time isochrones in simplified WKT format,
+        keeping each shape as its WKT string.
+
+        Same request as time_map_wkt_no_holes, with shapes parsed into shapely
+        geometries on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries without holes,
+                                   parsed into shapely geometries on access.
+        """
+        return await self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map",
+            AcceptType.WKT_NO_HOLES,
+            TimeMapWktRequest(
+                arrival_searches=arrival_searches, departure_searches=departure_searches
+            ),
+        )
+
     async def time_map_fast(
         self,
         arrival_searches: TimeMapFastArrivalSearches,
@@ -519,6 +778,64 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    async def time_map_fast_compact(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+        unions: Optional[List[TimeMapFastUnion]] = None,
+        intersections: Optional[List[TimeMapFastIntersection]] = None,
+    ) -> TimeMapCompactResponse:
+        """Generate high-performance travel time isochrones with shapes decoded into
+        coordinate arrays.
+
+        Same request as time_map_fast, with shells and holes decoded into numpy
+        arrays as in time_map_compact.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and one_to_many patterns.
+                              Max 10 searches total.
+            unions: Union operations combining multiple isochrone results
+            intersections: Intersection operations finding overlapping areas
+
+        Returns:
+            TimeMapCompactResponse: Polygon coordinate arrays and metadata.
+        """
+        return await self._api_call_post(
+            TimeMapCompactResponse,
+            "time-map/fast",
+            AcceptType.JSON,
+            TimeMapFastRequest(
+                arrival_searches=arrival_searches,
+                unions=unions,
+                intersections=intersections,
+            ),
+        )
+
+    def aiter_time_map_fast(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> AsyncIterator[TimeMapResponse]:
+        """Stream time_map_fast results part by part as the split request completes.
+
+        Same request as time_map_fast, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns.
+
+        Returns:
+            AsyncIterator[TimeMapResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeMapResponse,
+            "time-map/fast",
+            AcceptType.JSON,
+            TimeMapFastRequest(
+                arrival_searches=arrival_searches, unions=None, intersections=None
+            ),
+        )
+
     async def time_map_fast_geojson(
         self,
         arrival_searches: TimeMapFastArrivalSearches,
@@ -591,6 +908,56 @@ class AsyncClient(AsyncBaseClient):
             TimeMapFastWKTRequest(arrival_searches=arrival_searches),
         )
 
+    async def time_map_fast_wkt_lazy(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> TimeMapWKTLazyResponse:
+        """Generate high-performance travel time isochrones in WKT format, keeping each
+        shape as its WKT string.
+
+        Same request as time_map_fast_wkt, with shapes parsed into shapely geometries
+        on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns. Max 10 searches total.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries, parsed into
+                                   shapely geometries on access.
+        """
+        return await self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map/fast",
+            AcceptType.WKT,
+            TimeMapFastWKTRequest(arrival_searches=arrival_searches),
+        )
+
+    async def time_map_fast_wkt_no_holes_lazy(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> TimeMapWKTLazyResponse:
+        """Generate high-performance travel time isochrones in simplified WKT format,
+        keeping each shape as its WKT string.
+
+        Same request as time_map_fast_wkt_no_holes, with shapes parsed into shapely
+        geometries on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns. Max 10 searches total.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries without holes,
+                                   parsed into shapely geometries on access.
+        """
+        return await self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map/fast",
+            AcceptType.WKT_NO_HOLES,
+            TimeMapFastWKTRequest(arrival_searches=arrival_searches),
+        )
+
     async def h3(
         self,
         arrival_searches: List[H3ArrivalSearch],
@@ -880,6 +1247,37 @@ class AsyncClient(AsyncBaseClient):
             ),
         )
 
+    def aiter_routes(
+        self,
+        locations: List[Location],
+        arrival_searches: List[RoutesArrivalSearch],
+        departure_searches: List[RoutesDepartureSearch],
+    ) -> AsyncIterator[RoutesResponse]:
+        """Stream routes results part by part as the split request completes.
+
+        Same request as routes, but instead of waiting for every part and merging
+        them, each part's response is yielded as soon as it arrives, in completion
+        order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            arrival_searches: Arrival-based searches from multiple origins to one destination.
+            departure_searches: Departure-based searches from one origin to multiple destinations.
+
+        Returns:
+            AsyncIterator[RoutesResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            RoutesResponse,
+            "routes",
+            AcceptType.JSON,
+            RoutesRequest(
+                locations=locations,
+                departure_searches=departure_searches,
+                arrival_searches=arrival_searches,
+            ),
+        )
+
     async def distance_map(
         self,
         arrival_searches: List[DistanceMapArrivalSearch],
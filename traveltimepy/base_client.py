@@ -1,23 +1,48 @@
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse
 from importlib.metadata import version, PackageNotFoundError
-from typing import Optional, Dict, Mapping, TypeVar, Type, Union, Coroutine, Any
+from typing import (
+    Optional,
+    Dict,
+    List,
+    Mapping,
+    TypeVar,
+    Type,
+    Union,
+    Coroutine,
+    Any,
+    Iterator,
+    AsyncIterator,
+    Tuple,
+)
 
 from pydantic import BaseModel
 
 from traveltimepy.accept_type import AcceptType
+from traveltimepy.cache import ResponseCache, cache_key
 from traveltimepy.errors import TravelTimeProtoError, TravelTimeServerError
+from traveltimepy.rate_limit import RateLimiter
 from traveltimepy.requests.request import TravelTimeRequest
+from traveltimepy.retry import RetryPolicy, RetryStats, parse_retry_after, retrying
 from traveltimepy.requests.time_filter_proto import (
     TimeFilterFastProtoRequest,
     ProtoTransportation,
 )
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
+)
 from traveltimepy.requests.geohash_fast_proto import (
     GeohashFastProtoRequest,
 )
-from traveltimepy.responses.time_filter_proto import TimeFilterProtoResponse
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoResponse,
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
 from traveltimepy.responses.geohash_fast_proto import GeohashFastProtoResponse
 
 T = TypeVar("T", bound=BaseModel)
+P = TypeVar("P", TimeFilterProtoResponse, TimeFilterProtoColumnarResponse)
 
 try:
     __version__ = version(__name__)
@@ -36,10 +61,24 @@ class BaseClient(ABC):
         max_rpm: int = 60,
         use_ssl: bool = True,
         split_large_requests: bool = True,
+        split_size: int = 10,
+        max_locations_per_part: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        proto_max_rpm: Optional[int] = None,
+        proto_rate_limiter: Optional[RateLimiter] = None,
+        geohash_proto_max_rpm: Optional[int] = None,
+        geohash_proto_rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        search_cache: Optional[ResponseCache] = None,
         _host: str = "api.traveltimeapp.com",
         _proto_host: str = "proto.api.traveltimeapp.com",
         _user_agent: str = f"Travel Time Python SDK {__version__}",
     ):
+        if split_size < 1:
+            raise ValueError("split_size must be at least 1")
+        if max_locations_per_part is not None and max_locations_per_part < 1:
+            raise ValueError("max_locations_per_part must be at least 1")
         self.app_id = app_id
         self.api_key = api_key
         self.timeout = timeout
@@ -47,10 +86,77 @@ class BaseClient(ABC):
         self.max_rpm = max_rpm
         self.use_ssl = use_ssl
         self.split_large_requests = split_large_requests
+        self.split_size = split_size
+        self.max_locations_per_part = max_locations_per_part
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter or RateLimiter(per_minute=max_rpm)
+        # The proto host has its own budget of max_rpm, shared by both proto endpoints,
+        # unless a shared rate limiter is given
+        self.proto_rate_limiter = self._family_rate_limiter(
+            proto_rate_limiter,
+            proto_max_rpm,
+            rate_limiter or RateLimiter(per_minute=max_rpm),
+        )
+        self.geohash_proto_rate_limiter = self._family_rate_limiter(
+            geohash_proto_rate_limiter, geohash_proto_max_rpm, self.proto_rate_limiter
+        )
+        self.cache = cache
+        self.search_cache = search_cache
         self._host = _host
         self._proto_host = _proto_host
         self._user_agent = _user_agent
 
+    def _family_rate_limiter(
+        self,
+        rate_limiter: Optional[RateLimiter],
+        max_rpm: Optional[int],
+        default: RateLimiter,
+    ) -> RateLimiter:
+        if rate_limiter is not None:
+            return rate_limiter
+        if max_rpm is not None:
+            return RateLimiter(per_minute=max_rpm)
+        return default
+
+    def _split_request(self, request: TravelTimeRequest) -> List[TravelTimeRequest]:
+        split_size = self.split_size if self.split_large_requests else 1
+        if self.max_locations_per_part is not None:
+            return request.split_searches_by_locations(
+                split_size, self.max_locations_per_part
+            )
+        return request.split_searches(split_size)
+
+    def _cache_key(
+        self, endpoint: str, accept_type: AcceptType, data: str
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return cache_key(endpoint, accept_type.value, data)
+
+    def _cached_response(
+        self, response_class: Type[T], key: Optional[str]
+    ) -> Optional[T]:
+        if self.cache is None or key is None:
+            return None
+        body = self.cache.get(key)
+        return None if body is None else response_class.model_validate_json(body)
+
+    def _store_response(self, key: Optional[str], body: bytes) -> None:
+        if self.cache is not None and key is not None:
+            self.cache.set(key, body)
+
+    def _split_cached_searches(
+        self, request: TravelTimeRequest
+    ) -> Tuple[Optional[TravelTimeRequest], Optional[Any]]:
+        if self.search_cache is None:
+            return request, None
+        return request.split_cached_searches(self.search_cache)
+
+    def _cache_search_results(self, part: TravelTimeRequest, response: Any) -> None:
+        if self.search_cache is not None:
+            part.cache_search_results(self.search_cache, response)
+
     def _build_url(self, endpoint: str) -> str:
         return f"https://{self._host}/v4/{endpoint}"
 
@@ -78,16 +184,29 @@ class BaseClient(ABC):
         else:
             return transportation.TYPE.value.name
 
+    def _retrying(self, endpoint: str):
+        return retrying(
+            self.retry_policy, self.retry_attempts, self.retry_stats, endpoint
+        )
+
+    @staticmethod
+    def _endpoint_name(url: str) -> str:
+        path = urlparse(url).path
+        return path[len("/v4/") :] if path.startswith("/v4/") else path
+
     @staticmethod
     def _handle_proto_error(status_code: int, headers: Mapping[str, str]) -> None:
         if status_code >= 500:
-            raise TravelTimeServerError("Internal server error")
+            raise TravelTimeServerError(
+                "Internal server error", retry_after=parse_retry_after(headers)
+            )
         else:
             raise TravelTimeProtoError(
                 status_code=status_code,
                 error_code=headers.get("X-ERROR-CODE", "Unknown"),
                 error_details=headers.get("X-ERROR-DETAILS", "No details provided"),
                 error_message=headers.get("X-ERROR-MESSAGE", "No message provided"),
+                retry_after=parse_retry_after(headers),
             )
 
     @abstractmethod
@@ -100,6 +219,16 @@ class BaseClient(ABC):
     ) -> Union[T, Coroutine[Any, Any, T]]:
         pass
 
+    @abstractmethod
+    def _api_call_post_iter(
+        self,
+        response_class: Type[T],
+        endpoint: str,
+        accept_type: AcceptType,
+        request: TravelTimeRequest,
+    ) -> Union[Iterator[T], AsyncIterator[T]]:
+        pass
+
     @abstractmethod
     def _api_call_get(
         self,
@@ -112,8 +241,20 @@ class BaseClient(ABC):
 
     @abstractmethod
     def _api_call_proto(
-        self, req: TimeFilterFastProtoRequest
-    ) -> Union[TimeFilterProtoResponse, Coroutine[Any, Any, TimeFilterProtoResponse]]:
+        self,
+        req: TimeFilterFastProtoRequest,
+        response_class: Type[P],
+        shard_size: Optional[int] = None,
+    ) -> Union[P, Coroutine[Any, Any, P]]:
+        pass
+
+    @abstractmethod
+    def _api_call_proto_matrix(
+        self, req: TimeFilterFastProtoMatrixRequest, max_concurrency: int
+    ) -> Union[
+        TimeFilterProtoMatrixResponse,
+        Coroutine[Any, Any, TimeFilterProtoMatrixResponse],
+    ]:
         pass
 
     @abstractmethod
@@ -0,0 +1,270 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from traveltimepy.async_client import AsyncClient
+from traveltimepy.requests.common import Coordinates, Location
+from traveltimepy.requests.time_filter_fast import (
+    TimeFilterFastArrivalSearches,
+    TimeFilterFastManyToOne,
+    TimeFilterFastOneToMany,
+    _search_locations,
+)
+from traveltimepy.responses.time_filter_fast import (
+    Location as ResultLocation,
+    TimeFilterFastResponse,
+    TimeFilterFastResult,
+)
+
+_Search = Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne]
+
+
+class _PendingCall:
+    def __init__(
+        self,
+        locations: List[Location],
+        arrival_searches: TimeFilterFastArrivalSearches,
+        future: "asyncio.Future[TimeFilterFastResponse]",
+    ):
+        self.locations = locations
+        self.arrival_searches = arrival_searches
+        self.future = future
+        self.results: List[TimeFilterFastResult] = []
+
+    @property
+    def search_count(self) -> int:
+        return len(self.arrival_searches.one_to_many) + len(
+            self.arrival_searches.many_to_one
+        )
+
+
+class _MergedSearch:
+    """Search of a call renamed into the batch, with the call's IDs for each batch
+    location it references."""
+
+    def __init__(self, call: _PendingCall, search: _Search):
+        self.call = call
+        self.search_id = search.id
+        self.ids_by_batch_id: Dict[str, List[str]] = defaultdict(list)
+
+
+class _Batch:
+    """Calls merged into one request.
+
+    Locations are shared by coordinates, so a location repeated by every call is sent
+    once, and searches are renamed by their position in the batch.
+    """
+
+    def __init__(self):
+        self.locations: List[Location] = []
+        self.one_to_many: List[TimeFilterFastOneToMany] = []
+        self.many_to_one: List[TimeFilterFastManyToOne] = []
+        self.searches: Dict[str, _MergedSearch] = {}
+        self._ids_by_coords: Dict[Tuple[float, float], str] = {}
+
+    def add(self, call: _PendingCall) -> None:
+        """Add the searches of `call`, raising KeyError, before changing the batch, if
+        they reference a location ID the call does not define."""
+        coords = {location.id: location.coords for location in call.locations}
+        searches: List[_Search] = [
+            *call.arrival_searches.one_to_many,
+            *call.arrival_searches.many_to_one,
+        ]
+        for search in searches:
+            location_id, other_ids = _search_locations(search)
+            for referenced_id in [location_id, *other_ids]:
+                if referenced_id not in coords:
+                    raise KeyError(referenced_id)
+
+        for one_to_many in call.arrival_searches.one_to_many:
+            merged = _MergedSearch(call, one_to_many)
+            self.one_to_many.append(
+                one_to_many.model_copy(
+                    update={
+                        "id": self._search_id(merged),
+                        "departure_location_id": self._location_id(
+                            coords[one_to_many.departure_location_id]
+                        ),
+                        "arrival_location_ids": self._other_location_ids(
+                            merged, coords, one_to_many.arrival_location_ids
+                        ),
+                    }
+                )
+            )
+        for many_to_one in call.arrival_searches.many_to_one:
+            merged = _MergedSearch(call, many_to_one)
+            self.many_to_one.append(
+                many_to_one.model_copy(
+                    update={
+                        "id": self._search_id(merged),
+                        "arrival_location_id": self._location_id(
+                            coords[many_to_one.arrival_location_id]
+                        ),
+                        "departure_location_ids": self._other_location_ids(
+                            merged, coords, many_to_one.departure_location_ids
+                        ),
+                    }
+                )
+            )
+
+    def arrival_searches(self) -> TimeFilterFastArrivalSearches:
+        return TimeFilterFastArrivalSearches(
+            one_to_many=self.one_to_many, many_to_one=self.many_to_one
+        )
+
+    def demultiplex(self, response: TimeFilterFastResponse) -> None:
+        """Rename the results of `response` back and hand them to their calls."""
+        for result in response.results:
+            merged = self.searches[result.search_id]
+            merged.call.results.append(
+                TimeFilterFastResult(
+                    search_id=merged.search_id,
+                    locations=[
+                        ResultLocation(id=location_id, properties=location.properties)
+                        for location in result.locations
+                        for location_id in merged.ids_by_batch_id[location.id]
+                    ],
+                    unreachable=[
+                        location_id
+                        for batch_id in result.unreachable
+                        for location_id in merged.ids_by_batch_id[batch_id]
+                    ],
+                )
+            )
+
+    def _search_id(self, merged: _MergedSearch) -> str:
+        search_id = str(len(self.searches))
+        self.searches[search_id] = merged
+        return search_id
+
+    def _location_id(self, coords: Coordinates) -> str:
+        point = (coords.lat, coords.lng)
+        location_id = self._ids_by_coords.get(point)
+        if location_id is None:
+            location_id = str(len(self.locations))
+            self._ids_by_coords[point] = location_id
+            self.locations.append(Location(id=location_id, coords=coords))
+        return location_id
+
+    def _other_location_ids(
+        self,
+        merged: _MergedSearch,
+        coords: Dict[str, Coordinates],
+        location_ids: List[str],
+    ) -> List[str]:
+        batch_ids = []
+        for location_id in location_ids:
+            batch_id = self._location_id(coords[location_id])
+            if batch_id not in merged.ids_by_batch_id:
+                batch_ids.append(batch_id)
+            merged.ids_by_batch_id[batch_id].append(location_id)
+        return batch_ids
+
+
+class TimeFilterFastBatcher:
+    """Merges `time_filter_fast` calls made close together into combined requests.
+
+    Calls are collected for up to `max_wait` seconds, or until they hold
+    `max_searches` searches, then sent as one request through `client`. Locations
+    are deduplicated by coordinates and searches renamed so that calls cannot collide;
+    each call receives the results of its own searches under its own IDs. A call
+    referencing an undefined location ID is sent on its own so that the error only
+    reaches its caller, while any other error fails every call of the batch.
+
+    Args:
+        client: Client sending the combined requests
+        max_wait: Seconds to wait for more calls before sending a batch
+            (default: 0.02)
+        max_searches: Number of searches that sends a batch without waiting
+            (default: 10)
+    """
+
+    def __init__(
+        self, client: AsyncClient, max_wait: float = 0.02, max_searches: int = 10
+    ):
+        self.client = client
+        self.max_wait = max_wait
+        self.max_searches = max_searches
+        self._pending: List[_PendingCall] = []
+        self._pending_searches = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: Set["asyncio.Task[None]"] = set()
+
+    async def time_filter_fast(
+        self, locations: List[Location], arrival_searches: TimeFilterFastArrivalSearches
+    ) -> TimeFilterFastResponse:
+        """Same as `AsyncClient.time_filter_fast`, sent as part of a batch."""
+        loop = asyncio.get_running_loop()
+        call = _PendingCall(locations, arrival_searches, loop.create_future())
+        self._pending.append(call)
+        self._pending_searches += call.search_count
+
+        if self._pending_searches >= self.max_searches:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+
+        return await call.future
+
+    def flush(self) -> None:
+        """Send the pending calls now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        calls = self._pending
+        self._pending = []
+        self._pending_searches = 0
+        task = asyncio.ensure_future(self._send(calls))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, calls: List[_PendingCall]) -> None:
+        batch = _Batch()
+        batched: List[_PendingCall] = []
+        alone: List[_PendingCall] = []
+        for call in calls:
+            try:
+                batch.add(call)
+                batched.append(call)
+            except KeyError:
+                alone.append(call)
+
+        await asyncio.gather(
+            self._send_batch(batch, batched),
+            *[self._send_alone(call) for call in alone],
+        )
+
+    async def _send_batch(self, batch: _Batch, calls: List[_PendingCall]) -> None:
+        if not calls:
+            return
+
+        try:
+            response = await self.client.time_filter_fast(
+                batch.locations, batch.arrival_searches()
+            )
+            batch.demultiplex(response)
+        except Exception as error:
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(error)
+            return
+
+        for call in calls:
+            if not call.future.done():
+                call.future.set_result(TimeFilterFastResponse(results=call.results))
+
+    async def _send_alone(self, call: _PendingCall) -> None:
+        try:
+            response = await self.client.time_filter_fast(
+                call.locations, call.arrival_searches
+            )
+        except Exception as error:
+            if not call.future.done():
+                call.future.set_exception(error)
+            return
+
+        if not call.future.done():
+            call.future.set_result(response)
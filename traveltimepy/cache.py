@@ -0,0 +1,214 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+def cache_key(endpoint: str, accept_type: str, body: str) -> str:
+    """Key identifying a request by its endpoint, accept type and JSON body."""
+    return hashlib.sha256(f"{endpoint}\n{accept_type}\n{body}".encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Storage of raw response bodies by request key.
+
+    Attributes:
+        blocking: Whether reads and writes wait on IO, such as disk writes, in which
+            case `AsyncClient` runs them in a thread.
+    """
+
+    blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the body stored for `key`, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryCache(ResponseCache):
+    """Least recently used cache kept in the memory of the process.
+
+    Args:
+        max_entries: Maximum number of responses kept, None for no limit (default: 1024)
+        max_bytes: Maximum total size of the responses kept, None for no limit
+            (default: None)
+        ttl: Seconds a response stays valid, None to keep it until evicted
+            (default: None)
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at)
+            self.size += len(value)
+
+            while (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ) or (self.max_bytes is not None and self.size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self.size -= len(value)
+
+
+class SqliteCache(ResponseCache):
+    """Least recently used cache stored in a SQLite database, surviving restarts and
+    shared by the processes using the same file.
+
+    Args:
+        path: Database file, created if missing
+        max_bytes: Maximum total size of the responses kept, None for no limit
+            (default: None)
+        ttl: Seconds a response stays valid, None to keep it until evicted
+            (default: None)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE expires_at <= ?", (now,)
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), expires_at, now),
+                )
+                if self.max_bytes is not None:
+                    self._evict(self.max_bytes)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _evict(self, max_bytes: int) -> None:
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= max_bytes:
+            return
+
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            evicted.append((key,))
+            total -= size
+            if total <= max_bytes:
+                break
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
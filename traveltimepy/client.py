@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 
 from geojson_pydantic import FeatureCollection
 
@@ -77,6 +77,10 @@ from traveltimepy.requests.time_filter_proto import (
     TimeFilterFastProtoTransportation,
     RequestType,
     ProtoCountry,
+    ProtoDestinations,
+)
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
 )
 from traveltimepy.requests.geohash_fast_proto import (
     GeohashFastProtoRequest,
@@ -110,10 +114,17 @@ from traveltimepy.responses.time_filter import TimeFilterResponse
 from traveltimepy.responses.time_filter_fast import (
     TimeFilterFastResponse,
 )
-from traveltimepy.responses.time_filter_proto import TimeFilterProtoResponse
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoResponse,
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
 from traveltimepy.responses.geohash_fast_proto import GeohashFastProtoResponse
-from traveltimepy.responses.time_map import TimeMapResponse
-from traveltimepy.responses.time_map_wkt import TimeMapWKTResponse
+from traveltimepy.responses.time_map import TimeMapCompactResponse, TimeMapResponse
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
 from traveltimepy.responses.zones import (
     PostcodesDistrictsResponse,
     PostcodesSectorsResponse,
@@ -183,16 +194,75 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def iter_time_filter(
+        self,
+        locations: List[Location],
+        departure_searches: List[TimeFilterDepartureSearch],
+        arrival_searches: List[TimeFilterArrivalSearch],
+    ) -> Iterator[TimeFilterResponse]:
+        """Stream time_filter results part by part as the split request completes.
+
+        Same request as time_filter, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            departure_searches: Departure-based searches with specific departure times.
+            arrival_searches: Arrival-based searches with specific arrival times.
+
+        Returns:
+            Iterator[TimeFilterResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeFilterResponse,
+            "time-filter",
+            AcceptType.JSON,
+            TimeFilterRequest(
+                locations=locations,
+                departure_searches=departure_searches,
+                arrival_searches=arrival_searches,
+            ),
+        )
+
+    def iter_time_filter_fast(
+        self, locations: List[Location], arrival_searches: TimeFilterFastArrivalSearches
+    ) -> Iterator[TimeFilterFastResponse]:
+        """Stream time_filter_fast results part by part as the split request completes.
+
+        Same request as time_filter_fast, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            arrival_searches: High-performance search configurations with one_to_many
+                             and many_to_one patterns.
+
+        Returns:
+            Iterator[TimeFilterFastResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeFilterFastResponse,
+            "time-filter/fast",
+            AcceptType.JSON,
+            TimeFilterFastRequest(
+                locations=locations, arrival_searches=arrival_searches
+            ),
+        )
+
     def time_filter_fast_proto(
         self,
         origin_coordinate: Coordinates,
-        destination_coordinates: List[Coordinates],
+        destination_coordinates: ProtoDestinations,
         transportation: TimeFilterFastProtoTransportation,
         travel_time: int,
         request_type: RequestType,
         country: ProtoCountry,
         with_distance: bool,
-    ) -> TimeFilterProtoResponse:
+        shard_size: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[TimeFilterProtoResponse, TimeFilterProtoColumnarResponse]:
         """Calculate ultra-high-performance distance matrix using Protocol Buffers.
 
         Maximum performance endpoint using protobuf format for extremely large datasets.
@@ -201,26 +271,85 @@ class Client(SyncBaseClient):
 
         Args:
             origin_coordinate: Single origin coordinate (lat/lng)
-            destination_coordinates: List of destination coordinates
+            destination_coordinates: List of destination coordinates, or an (N, 2)
+                                     array of (lat, lng) rows for large matrices
             transportation: Transportation mode
             travel_time: Maximum journey time in seconds
             request_type: Type of request calculation
             country: Specific country for the calculation
             with_distance: Whether to include distance data in response
+            shard_size: Split destinations into requests of at most this many
+                        destinations, sent concurrently and retried independently.
+                        By default all destinations are sent in a single request.
+            columnar: Return travel times and distances as int32 NumPy arrays,
+                      without per-element validation. Recommended for hundreds of
+                      thousands of destinations or more (default: False)
 
         Returns:
             TimeFilterProtoResponse: Response with travel times and optionally distances for reachable destinations.
+                                     TimeFilterProtoColumnarResponse with columnar=True.
         """
-        return self._api_call_proto(
-            TimeFilterFastProtoRequest(
-                origin_coordinate,
+        request = TimeFilterFastProtoRequest(
+            origin_coordinate,
+            destination_coordinates,
+            transportation,
+            travel_time,
+            request_type,
+            country,
+            with_distance,
+        )
+        if columnar:
+            return self._api_call_proto(
+                request, TimeFilterProtoColumnarResponse, shard_size
+            )
+        return self._api_call_proto(request, TimeFilterProtoResponse, shard_size)
+
+    def time_filter_fast_proto_matrix(
+        self,
+        origin_coordinates: ProtoDestinations,
+        destination_coordinates: ProtoDestinations,
+        transportation: TimeFilterFastProtoTransportation,
+        travel_time: int,
+        request_type: RequestType,
+        country: ProtoCountry,
+        with_distance: bool,
+        max_concurrency: int = 10,
+    ) -> TimeFilterProtoMatrixResponse:
+        """Calculate a dense many-origin distance matrix using Protocol Buffers.
+
+        Sends one proto request per origin, with at most max_concurrency of them in
+        flight, and assembles the results into N x M matrices. Destinations are
+        converted once and shared by every origin.
+
+        Args:
+            origin_coordinates: Origin coordinates, one matrix row each, or an (N, 2)
+                                array of (lat, lng) rows
+            destination_coordinates: Destination coordinates, one matrix column
+                                     each, or an (M, 2) array of (lat, lng) rows
+            transportation: Transportation mode
+            travel_time: Maximum journey time in seconds
+            request_type: Type of request calculation. With many_to_one, origins
+                          are used as arrival locations.
+            country: Specific country for the calculation
+            with_distance: Whether to include distance data in response
+            max_concurrency: Maximum number of origin requests sent at the same time
+
+        Returns:
+            TimeFilterProtoMatrixResponse: (N, M) int32 travel time matrix and
+                                          optionally distance matrix, with
+                                          unreachable cells set to -1.
+        """
+        return self._api_call_proto_matrix(
+            TimeFilterFastProtoMatrixRequest(
+                origin_coordinates,
                 destination_coordinates,
                 transportation,
                 travel_time,
                 request_type,
                 country,
                 with_distance,
-            )
+            ),
+            max_concurrency,
         )
 
     def geohash_fast_proto(
@@ -397,6 +526,36 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def iter_time_map(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> Iterator[TimeMapResponse]:
+        """Stream time_map results part by part as the split request completes.
+
+        Same request as time_map, but instead of waiting for every part and merging
+        them, each part's response is yielded as soon as it arrives, in completion
+        order. Results carry their search_id to match them to searches.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+
+        Returns:
+            Iterator[TimeMapResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeMapResponse,
+            "time-map",
+            AcceptType.JSON,
+            TimeMapRequest(
+                arrival_searches=arrival_searches,
+                departure_searches=departure_searches,
+                unions=None,
+                intersections=None,
+            ),
+        )
+
     def time_map_geojson(
         self,
         arrival_searches: List[TimeMapArrivalSearch],
@@ -426,6 +585,45 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def time_map_compact(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+        unions: Optional[List[TimeMapUnion]] = None,
+        intersections: Optional[List[TimeMapIntersection]] = None,
+    ) -> TimeMapCompactResponse:
+        """Creates travel time catchment area polygons with shapes decoded into
+        coordinate arrays.
+
+        Same request as time_map, but each shell and hole is a single `(N, 2)` numpy
+        array of `(lat, lng)` rows instead of a validated model per vertex, which is
+        much faster for detailed shapes. Shapes convert to shapely polygons with
+        `to_polygon()`.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+            unions: Union operations combining multiple isochrone results
+            intersections: Intersection operations finding overlapping areas
+
+        Returns:
+            TimeMapCompactResponse: Polygon data with coordinate arrays, including
+                                   individual isochrones, unions, and intersections.
+        """
+        return self._api_call_post(
+            TimeMapCompactResponse,
+            "time-map",
+            AcceptType.JSON,
+            TimeMapRequest(
+                arrival_searches=arrival_searches,
+                departure_searches=departure_searches,
+                unions=unions,
+                intersections=intersections,
+            ),
+        )
+
     def time_map_wkt(
         self,
         arrival_searches: List[TimeMapArrivalSearch],
@@ -484,6 +682,67 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def time_map_wkt_lazy(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> TimeMapWKTLazyResponse:
+        """Generate comprehensive travel time isochrones in WKT format, keeping each
+        shape as its WKT string.
+
+        Same request as time_map_wkt, but shapes are not turned into a pydantic model
+        per vertex. Each result's geometry is parsed into a shapely geometry on first
+        access, which is much faster and lighter for large isochrones.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries, parsed into
+                                   shapely geometries on access.
+        """
+        return self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map",
+            AcceptType.WKT,
+            TimeMapWktRequest(
+                arrival_searches=arrival_searches, departure_searches=departure_searches
+            ),
+        )
+
+    def time_map_wkt_no_holes_lazy(
+        self,
+        arrival_searches: List[TimeMapArrivalSearch],
+        departure_searches: List[TimeMapDepartureSearch],
+    ) -> TimeMapWKTLazyResponse:
+        """Generate comprehensive travel time isochrones in simplified WKT format,
+        keeping each shape as its WKT string.
+
+        Same request as time_map_wkt_no_holes, with shapes parsed into shapely
+        geometries on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Arrival-based isochrone searches with specific arrival times.
+                             Max 10 searches.
+            departure_searches: Departure-based isochrone searches with specific departure times.
+                               Max 10 searches.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries without holes,
+                                   parsed into shapely geometries on access.
+        """
+        return self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map",
+            AcceptType.WKT_NO_HOLES,
+            TimeMapWktRequest(
+                arrival_searches=arrival_searches, departure_searches=departure_searches
+            ),
+        )
+
     def time_map_fast(
         self,
         arrival_searches: TimeMapFastArrivalSearches,
@@ -515,6 +774,64 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def time_map_fast_compact(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+        unions: Optional[List[TimeMapFastUnion]] = None,
+        intersections: Optional[List[TimeMapFastIntersection]] = None,
+    ) -> TimeMapCompactResponse:
+        """Generate high-performance travel time isochrones with shapes decoded into
+        coordinate arrays.
+
+        Same request as time_map_fast, with shells and holes decoded into numpy
+        arrays as in time_map_compact.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and one_to_many patterns.
+                              Max 10 searches total.
+            unions: Union operations combining multiple isochrone results
+            intersections: Intersection operations finding overlapping areas
+
+        Returns:
+            TimeMapCompactResponse: Polygon coordinate arrays and metadata.
+        """
+        return self._api_call_post(
+            TimeMapCompactResponse,
+            "time-map/fast",
+            AcceptType.JSON,
+            TimeMapFastRequest(
+                arrival_searches=arrival_searches,
+                unions=unions,
+                intersections=intersections,
+            ),
+        )
+
+    def iter_time_map_fast(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> Iterator[TimeMapResponse]:
+        """Stream time_map_fast results part by part as the split request completes.
+
+        Same request as time_map_fast, but instead of waiting for every part and
+        merging them, each part's response is yielded as soon as it arrives, in
+        completion order. Results carry their search_id to match them to searches.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns.
+
+        Returns:
+            Iterator[TimeMapResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            TimeMapResponse,
+            "time-map/fast",
+            AcceptType.JSON,
+            TimeMapFastRequest(
+                arrival_searches=arrival_searches, unions=None, intersections=None
+            ),
+        )
+
     def time_map_fast_geojson(
         self,
         arrival_searches: TimeMapFastArrivalSearches,
@@ -587,6 +904,56 @@ class Client(SyncBaseClient):
             TimeMapFastWKTRequest(arrival_searches=arrival_searches),
         )
 
+    def time_map_fast_wkt_lazy(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> TimeMapWKTLazyResponse:
+        """Generate high-performance travel time isochrones in WKT format, keeping each
+        shape as its WKT string.
+
+        Same request as time_map_fast_wkt, with shapes parsed into shapely geometries
+        on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns. Max 10 searches total.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries, parsed into
+                                   shapely geometries on access.
+        """
+        return self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map/fast",
+            AcceptType.WKT,
+            TimeMapFastWKTRequest(arrival_searches=arrival_searches),
+        )
+
+    def time_map_fast_wkt_no_holes_lazy(
+        self,
+        arrival_searches: TimeMapFastArrivalSearches,
+    ) -> TimeMapWKTLazyResponse:
+        """Generate high-performance travel time isochrones in simplified WKT format,
+        keeping each shape as its WKT string.
+
+        Same request as time_map_fast_wkt_no_holes, with shapes parsed into shapely
+        geometries on first access as in time_map_wkt_lazy.
+
+        Args:
+            arrival_searches: Isochrone search configurations with many_to_one and
+                             one_to_many patterns. Max 10 searches total.
+
+        Returns:
+            TimeMapWKTLazyResponse: WKT strings of the polygon geometries without holes,
+                                   parsed into shapely geometries on access.
+        """
+        return self._api_call_post(
+            TimeMapWKTLazyResponse,
+            "time-map/fast",
+            AcceptType.WKT_NO_HOLES,
+            TimeMapFastWKTRequest(arrival_searches=arrival_searches),
+        )
+
     def h3(
         self,
         arrival_searches: List[H3ArrivalSearch],
@@ -876,6 +1243,37 @@ class Client(SyncBaseClient):
             ),
         )
 
+    def iter_routes(
+        self,
+        locations: List[Location],
+        arrival_searches: List[RoutesArrivalSearch],
+        departure_searches: List[RoutesDepartureSearch],
+    ) -> Iterator[RoutesResponse]:
+        """Stream routes results part by part as the split request completes.
+
+        Same request as routes, but instead of waiting for every part and merging
+        them, each part's response is yielded as soon as it arrives, in completion
+        order. Results carry their search_id to match them to searches.
+
+        Args:
+            locations: List of all locations referenced by ID in searches
+            arrival_searches: Arrival-based searches from multiple origins to one destination.
+            departure_searches: Departure-based searches from one origin to multiple destinations.
+
+        Returns:
+            Iterator[RoutesResponse]: One response per completed request part.
+        """
+        return self._api_call_post_iter(
+            RoutesResponse,
+            "routes",
+            AcceptType.JSON,
+            RoutesRequest(
+                locations=locations,
+                departure_searches=departure_searches,
+                arrival_searches=arrival_searches,
+            ),
+        )
+
     def distance_map(
         self,
         arrival_searches: List[DistanceMapArrivalSearch],
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class CoalescingStats:
+    """Count of calls made through a `SingleFlight`.
+
+    Attributes:
+        requests: Number of calls that were sent.
+        coalesced: Number of calls that joined an identical call already in flight
+            instead of being sent.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.coalesced = 0
+
+    def __repr__(self) -> str:
+        return f"CoalescingStats(requests={self.requests}, coalesced={self.coalesced})"
+
+
+class _Flight:
+    def __init__(self, future: "asyncio.Future"):
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers using the same key.
+
+    The first caller for a key starts the call, later callers await the same result
+    (or exception) until it completes, after which the key is sent again. Callers are
+    shielded from each other: cancelling one does not cancel the shared call while
+    others still wait for it, but the call is cancelled once all of its callers are.
+    Belongs to the event loop it is first used in.
+    """
+
+    def __init__(self, stats: CoalescingStats):
+        self.stats = stats
+        self._in_flight: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[R]]) -> R:
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.requests += 1
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._in_flight[key] = flight
+            flight.future.add_done_callback(lambda done: self._finish(key, done))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.future.done():
+                # Every caller was cancelled, nobody is left to use the result
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                flight.future.cancel()
+
+    def _finish(self, key: Hashable, future: "asyncio.Future") -> None:
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.future is future:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
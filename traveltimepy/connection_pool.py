@@ -0,0 +1,87 @@
+import threading
+from typing import Type
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """Thread-safe counters of the connections opened by a client.
+
+    Attributes:
+        requests: Number of requests sent.
+        new_connections: Number of new connections opened, each one costing a TCP (and
+            TLS) handshake.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Number of requests sent on a connection kept alive from an earlier
+        request."""
+        return self.requests - self.new_connections
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionStats(requests={self.requests}, "
+            f"new_connections={self.new_connections}, "
+            f"reused_connections={self.reused_connections})"
+        )
+
+
+def _counting_pool_class(
+    pool_class: Type[HTTPConnectionPool], stats: ConnectionStats
+) -> Type[HTTPConnectionPool]:
+    # Counts socket connects rather than connection objects, since urllib3 reconnects
+    # dropped connections in place
+    class CountingConnection(pool_class.ConnectionCls):  # type: ignore[name-defined,misc]
+        def connect(self) -> None:
+            stats.record_new_connection()
+            super().connect()
+
+    class CountingConnectionPool(pool_class):  # type: ignore[valid-type,misc]
+        ConnectionCls = CountingConnection
+
+    return CountingConnectionPool
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter recording new and reused connections in `stats`.
+
+    Args:
+        stats: Counters shared with the client
+        keep_alive: Keep connections open between requests. When disabled every request
+            asks the server to close its connection.
+        **kwargs: Passed to HTTPAdapter, e.g. pool_connections and pool_maxsize
+    """
+
+    def __init__(self, stats: ConnectionStats, keep_alive: bool = True, **kwargs):
+        self.stats = stats
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request: PreparedRequest, *args, **kwargs) -> Response:
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+        self.stats.record_request()
+        return super().send(request, *args, **kwargs)
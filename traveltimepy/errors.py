@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class TravelTimeError(Exception):
@@ -6,7 +6,10 @@ class TravelTimeError(Exception):
 
 
 class TravelTimeServerError(TravelTimeError):
-    def __init__(self, error: str):
+    retry_after: Optional[float]
+
+    def __init__(self, error: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
         super(TravelTimeServerError, self).__init__(error)
 
 
@@ -14,13 +17,19 @@ class TravelTimeApiError(TravelTimeError):
     status_code: int
     error_code: str
     additional_info: Dict[str, List[str]]
+    retry_after: Optional[float] = None
 
     def __init__(
-        self, status_code: int, error_code: str, additional_info: Dict[str, List[str]]
+        self,
+        status_code: int,
+        error_code: str,
+        additional_info: Dict[str, List[str]],
+        retry_after: Optional[float] = None,
     ):
         self.status_code = status_code
         self.error_code = error_code
         self.additional_info = additional_info
+        self.retry_after = retry_after
 
         super(TravelTimeApiError, self).__init__(
             f"Travel Time API request failed with status code: {self.status_code}\n"
@@ -43,6 +52,7 @@ class TravelTimeJsonError(TravelTimeApiError):
         description: str,
         documentation_link: str,
         additional_info: Dict[str, List[str]],
+        retry_after: Optional[float] = None,
     ):
         self.status_code = status_code
         self.error_code = error_code
@@ -58,6 +68,7 @@ class TravelTimeJsonError(TravelTimeApiError):
                 self.description: [self.description],
                 self.documentation_link: [self.documentation_link],
             },
+            retry_after,
         )
 
 
@@ -68,7 +79,12 @@ class TravelTimeProtoError(TravelTimeApiError):
     error_message: str
 
     def __init__(
-        self, status_code: int, error_code: str, error_details: str, error_message: str
+        self,
+        status_code: int,
+        error_code: str,
+        error_details: str,
+        error_message: str,
+        retry_after: Optional[float] = None,
     ):
         self.status_code = status_code
         self.error_code = error_code
@@ -82,4 +98,5 @@ class TravelTimeProtoError(TravelTimeApiError):
                 "X-ERROR-DETAILS": [self.error_details],
                 "X-ERROR-MESSAGE": [self.error_message],
             },
+            retry_after,
         )
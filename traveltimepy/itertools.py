@@ -1,8 +1,21 @@
 import itertools
-from typing import List, TypeVar, Tuple, Optional
+import math
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    TypeVar,
+    Tuple,
+    Optional,
+    Union,
+    cast,
+)
 
 T = TypeVar("T")
 R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
 
 
 def sliding(values: List[T], window_size: int) -> List[List[T]]:
@@ -19,9 +32,60 @@ def split(
     )
 
 
+def split_weighted(
+    left: List[T],
+    right: List[R],
+    window_size: int,
+    max_weight: int,
+    weight: Callable[[Union[T, R]], int],
+) -> List[Tuple[List[T], List[R]]]:
+    """Split into parts of at most `window_size` items from each side, also keeping the
+    total weight of every part under `max_weight`.
+
+    Parts are filled in order towards the average weight needed to stay under
+    `max_weight`, so the weight is spread evenly instead of leaving a heavy part
+    behind. An item heavier than `max_weight` gets a part of its own.
+    """
+    items: List[Tuple[Union[T, R], bool]] = [(value, True) for value in left]
+    items.extend((value, False) for value in right)
+    weights = [weight(value) for value, _ in items]
+
+    total = sum(weights)
+    if total == 0:
+        return split(left, right, window_size)
+    target = math.ceil(total / math.ceil(total / max_weight))
+
+    parts: List[Tuple[List[T], List[R]]] = []
+    lefts: List[T] = []
+    rights: List[R] = []
+    part_weight = 0
+    for (value, is_left), value_weight in zip(items, weights):
+        side_count = len(lefts) if is_left else len(rights)
+        if (lefts or rights) and (
+            part_weight + value_weight > target or side_count == window_size
+        ):
+            parts.append((lefts, rights))
+            lefts, rights, part_weight = [], [], 0
+        if is_left:
+            lefts.append(cast(T, value))
+        else:
+            rights.append(cast(R, value))
+        part_weight += value_weight
+
+    if lefts or rights:
+        parts.append((lefts, rights))
+    return parts
+
+
 def join_opt(values: Optional[List[str]], sep: str) -> Optional[str]:
     return sep.join(values) if values is not None and len(values) != 0 else None
 
 
 def flatten(list_of_lists: List[List[T]]) -> List[T]:
     return list(itertools.chain.from_iterable(list_of_lists))
+
+
+def select(index: Dict[K, T], keys: Iterable[K]) -> List[T]:
+    """Values of `index` for the distinct `keys` found in it, in order of first
+    occurrence, looking up each key once."""
+    return [index[key] for key in dict.fromkeys(keys) if key in index]
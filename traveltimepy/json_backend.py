@@ -0,0 +1,45 @@
+"""JSON encoding and decoding of plain Python values.
+
+Uses orjson or msgspec when installed (`pip install 'traveltimepy[fast-json]'`), falling
+back to the standard library. Responses are validated straight from their bytes by
+pydantic, which is faster than decoding them with any backend first; this module is used
+where plain Python values are needed, such as error bodies and cached search results.
+"""
+
+import json
+from typing import Any, Tuple, Type, Union
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+    DecodeError: Tuple[Type[Exception], ...] = (orjson.JSONDecodeError,)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+except ImportError:
+    try:
+        import msgspec  # type: ignore
+
+        BACKEND = "msgspec"
+        DecodeError = (msgspec.DecodeError,)
+
+        def loads(data: Union[bytes, str]) -> Any:
+            return msgspec.json.decode(data)
+
+        def dumps(value: Any) -> bytes:
+            return msgspec.json.encode(value)
+
+    except ImportError:
+        BACKEND = "json"
+        DecodeError = (ValueError,)
+
+        def loads(data: Union[bytes, str]) -> Any:
+            return json.loads(data)
+
+        def dumps(value: Any) -> bytes:
+            return json.dumps(value).encode()
@@ -0,0 +1,191 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from pydantic import BaseModel, ConfigDict, Field
+from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
+
+from traveltimepy.responses.time_map import (
+    Shape,
+    TimeMapCompactResponse,
+    TimeMapResponse,
+)
+from traveltimepy.responses.time_map_wkt import TimeMapWKTLazyResponse
+
+IsochroneResponse = Union[
+    TimeMapResponse, TimeMapCompactResponse, TimeMapWKTLazyResponse
+]
+
+# Mean Earth radius in metres
+_EARTH_RADIUS = 6_371_008.8
+
+_POLYGON_TYPE_ID = 3
+
+
+class IsochroneProcessing(BaseModel):
+    """Steps applied to the shapes of every isochrone search, in order.
+
+    Attributes:
+        make_valid: Repair invalid polygons, keeping only their polygonal parts
+            (default: True)
+        dissolve: Union the shapes of each search into one geometry instead of
+            collecting them into a multipolygon (default: True)
+        simplify_tolerance: Tolerance in degrees of the topology preserving
+            simplification, None to keep every vertex (default: None)
+        area: Compute the area of every geometry in square metres (default: False)
+    """
+
+    make_valid: bool = True
+    dissolve: bool = True
+    simplify_tolerance: Optional[float] = Field(default=None, ge=0)
+    area: bool = False
+
+
+class ProcessedIsochrone(BaseModel):
+    """Geometry of one isochrone search after processing.
+
+    Attributes:
+        search_id: Search identifier from the original request.
+        geometry: Polygon or multipolygon with longitude as x and latitude as y.
+        area: Approximate area in square metres, None unless requested.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    search_id: str
+    geometry: BaseGeometry
+    area: Optional[float] = None
+
+
+def _shape_polygon(shape: Shape) -> Polygon:
+    return Polygon(
+        [(point.lng, point.lat) for point in shape.shell],
+        [[(point.lng, point.lat) for point in hole] for hole in shape.holes],
+    )
+
+
+def _search_parts(response: IsochroneResponse) -> Tuple[List[str], List[BaseGeometry]]:
+    if isinstance(response, TimeMapWKTLazyResponse):
+        geometries = response.load_geometries()
+    elif isinstance(response, TimeMapCompactResponse):
+        geometries = [result.to_multipolygon() for result in response.results]
+    else:
+        geometries = [
+            MultiPolygon([_shape_polygon(shape) for shape in result.shapes])
+            for result in response.results
+        ]
+    return [result.search_id for result in response.results], geometries
+
+
+def _polygon_parts(
+    geometries: npt.NDArray[np.object_],
+) -> Tuple[npt.NDArray[np.object_], npt.NDArray[np.intp]]:
+    # Collections returned by make_valid may themselves hold multipolygons
+    parts, index = shapely.get_parts(geometries, return_index=True)
+    parts, part_index = shapely.get_parts(parts, return_index=True)
+    index = index[part_index]
+    polygonal = shapely.get_type_id(parts) == _POLYGON_TYPE_ID
+    return parts[polygonal], index[polygonal]
+
+
+def _equal_area(coordinates: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    # Lambert cylindrical equal-area projection of the sphere, in metres
+    radians = np.radians(coordinates)
+    return np.column_stack(
+        [_EARTH_RADIUS * radians[:, 0], _EARTH_RADIUS * np.sin(radians[:, 1])]
+    )
+
+
+def _process(
+    geometries: List[BaseGeometry], processing: IsochroneProcessing
+) -> Tuple[List[BaseGeometry], Optional[List[float]]]:
+    parts, index = _polygon_parts(np.array(geometries, dtype=object))
+    if processing.make_valid:
+        parts, valid_index = _polygon_parts(shapely.make_valid(parts))
+        index = index[valid_index]
+
+    if processing.dissolve:
+        counts = np.bincount(index, minlength=len(geometries))
+        groups = np.split(parts, np.cumsum(counts)[:-1])
+        processed = np.array(
+            [shapely.union_all(group) for group in groups], dtype=object
+        )
+    else:
+        processed = np.empty(len(geometries), dtype=object)
+        shapely.multipolygons(parts, indices=index, out=processed)
+    # Searches without any polygon are left empty
+    processed[shapely.is_missing(processed) | shapely.is_empty(processed)] = (
+        MultiPolygon()
+    )
+
+    if processing.simplify_tolerance is not None:
+        processed = shapely.simplify(
+            processed, processing.simplify_tolerance, preserve_topology=True
+        )
+
+    areas = None
+    if processing.area:
+        areas = shapely.area(shapely.transform(processed, _equal_area)).tolist()
+
+    return list(processed), areas
+
+
+def process_isochrones(
+    response: IsochroneResponse,
+    processing: Optional[IsochroneProcessing] = None,
+    processes: Optional[int] = None,
+) -> List[ProcessedIsochrone]:
+    """Apply `processing` to the shapes of every search of an isochrone response.
+
+    Works on the responses of `time_map`, `time_map_fast`, their `_compact` variants
+    and the `_wkt_lazy` methods. Each step runs on shapely arrays holding the shapes of
+    all searches at once. With more than one process, the searches are split into
+    chunks processed in a process pool, which is worth it for large batches of
+    detailed isochrones.
+
+    Areas are measured in square metres after reprojecting the geometries from
+    longitude and latitude to a Lambert cylindrical equal-area projection of a sphere of
+    the mean Earth radius.
+
+    Args:
+        response: Isochrones to process
+        processing: Steps to apply, None to make valid and dissolve (default: None)
+        processes: Processes sharing the work, None to process in the calling process
+            (default: None)
+    """
+    if processing is None:
+        processing = IsochroneProcessing()
+    search_ids, geometries = _search_parts(response)
+
+    if processes is not None and processes > 1 and len(geometries) > 1:
+        chunks = np.array_split(
+            np.arange(len(geometries)), min(processes, len(geometries))
+        )
+        with ProcessPoolExecutor(processes) as executor:
+            outputs = list(
+                executor.map(
+                    _process,
+                    [[geometries[i] for i in chunk] for chunk in chunks],
+                    [processing] * len(chunks),
+                )
+            )
+        processed = [geometry for output in outputs for geometry in output[0]]
+        areas = (
+            [area for output in outputs for area in output[1] or []]
+            if processing.area
+            else None
+        )
+    else:
+        processed, areas = _process(geometries, processing)
+
+    return [
+        ProcessedIsochrone(
+            search_id=search_id,
+            geometry=geometry,
+            area=areas[i] if areas is not None else None,
+        )
+        for i, (search_id, geometry) in enumerate(zip(search_ids, processed))
+    ]
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+
+def _take_tokens(
+    available: float,
+    updated_at: float,
+    now: float,
+    rate: float,
+    burst: float,
+    tokens: float,
+) -> Tuple[float, float]:
+    """Refill a bucket for the time elapsed since `updated_at`, then take `tokens` from
+    it if enough are available.
+
+    Returns the tokens left in the bucket and 0, or, when there are not enough tokens,
+    the unchanged bucket and the number of seconds until there will be.
+    """
+    available = min(burst, available + max(0.0, now - updated_at) * rate)
+    if available >= tokens:
+        return available - tokens, 0.0
+    return available, (tokens - available) / rate
+
+
+class BucketBackend(ABC):
+    """Storage of a token bucket's state, deciding where it is shared.
+
+    Attributes:
+        blocking: Whether `take` waits on IO, such as a file lock or a network call,
+            in which case async callers run it in a thread.
+    """
+
+    blocking = True
+
+    @abstractmethod
+    def take(self, rate: float, burst: float, tokens: float) -> float:
+        """Atomically take `tokens` from the bucket.
+
+        Returns 0 when they were taken, otherwise the number of seconds to wait before
+        trying again.
+        """
+        pass
+
+
+class InMemoryBucket(BucketBackend):
+    """Bucket shared by the threads and event loops of a single process."""
+
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._available: Optional[float] = None
+        self._updated_at = time.monotonic()
+
+    def take(self, rate: float, burst: float, tokens: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            available = burst if self._available is None else self._available
+            self._available, wait = _take_tokens(
+                available, self._updated_at, now, rate, burst, tokens
+            )
+            self._updated_at = now
+            return wait
+
+
+class FileBucket(BucketBackend):
+    """Bucket shared by every process on a machine using the same file.
+
+    The bucket state is stored in `path` and updated under an exclusive `flock`, so
+    worker processes started separately (e.g. by a process pool or a job scheduler)
+    share one budget. Only available on POSIX systems.
+
+    Args:
+        path: File holding the bucket state, created if missing
+    """
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise OSError("FileBucket requires fcntl, which is not available here")
+        self.path = path
+
+    def take(self, rate: float, burst: float, tokens: float) -> float:
+        with open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                state = file.read().split()
+                now = time.time()
+                if len(state) == 2:
+                    available, updated_at = float(state[0]), float(state[1])
+                else:
+                    available, updated_at = burst, now
+
+                available, wait = _take_tokens(
+                    available, updated_at, now, rate, burst, tokens
+                )
+
+                file.seek(0)
+                file.truncate()
+                file.write(f"{available} {now}")
+                file.flush()
+                return wait
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+# Same algorithm as `_take_tokens`, run atomically by the server. The wait is returned
+# as a string since Redis truncates Lua numbers to integers.
+_REDIS_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'available', 'updated_at')
+local available = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+available = math.min(burst, available + math.max(0, now - updated_at) * rate)
+local wait = 0
+if available >= tokens then
+    available = available - tokens
+else
+    wait = (tokens - available) / rate
+end
+redis.call('HSET', KEYS[1], 'available', tostring(available), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucket(BucketBackend):
+    """Bucket shared by every process, on any machine, using the same Redis key.
+
+    Works with any Redis-compatible server (Redis, Valkey, KeyDB, a local stand-in)
+    through a client exposing redis-py's `eval(script, numkeys, *keys_and_args)`.
+    The bucket is updated by a Lua script using the server clock, so clients do not
+    need synchronized clocks.
+
+    Args:
+        client: redis-py compatible client
+        key: Key holding the bucket state (default: "traveltimepy:rate-limit")
+    """
+
+    def __init__(self, client: Any, key: str = "traveltimepy:rate-limit"):
+        self.client = client
+        self.key = key
+
+    def take(self, rate: float, burst: float, tokens: float) -> float:
+        wait = self.client.eval(_REDIS_TAKE_SCRIPT, 1, self.key, rate, burst, tokens)
+        return float(wait.decode() if isinstance(wait, bytes) else wait)
+
+
+class RateLimiter:
+    """Token bucket rate limiter shared by sync and async clients.
+
+    The bucket holds up to `burst` tokens and refills at `per_minute` tokens per
+    minute; every request takes one token, waiting for it if the bucket is empty.
+    Where the bucket lives is decided by its backend: `InMemoryBucket` (default) to
+    share it within a process, `FileBucket` across processes on one machine, or
+    `RedisBucket` across machines.
+
+    Args:
+        per_minute: Sustained number of requests per minute
+        burst: Number of requests that can be sent at once after a quiet period
+            (default: per_minute)
+        backend: Where the bucket state is kept (default: InMemoryBucket())
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        burst: Optional[float] = None,
+        backend: Optional[BucketBackend] = None,
+    ):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.per_minute = per_minute
+        self.burst = burst if burst is not None else max(1.0, per_minute)
+        self.backend = backend or InMemoryBucket()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        wait = self.backend.take(self.per_minute / 60, self.burst, 1)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.backend.take(self.per_minute / 60, self.burst, 1)
+
+    async def acquire_async(self) -> None:
+        """Take a token, sleeping without blocking the event loop until one is
+        available.
+
+        Blocking backends, such as `FileBucket` and `RedisBucket`, are called in the
+        default executor of the loop.
+        """
+        wait = await self._take_async()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = await self._take_async()
+
+    async def _take_async(self) -> float:
+        rate = self.per_minute / 60
+        if not self.backend.blocking:
+            return self.backend.take(rate, self.burst, 1)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.backend.take, rate, self.burst, 1
+        )
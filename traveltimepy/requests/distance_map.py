@@ -194,7 +194,7 @@ class DistanceMapRequest(TravelTimeRequest[TimeMapResponse]):
             chunks = split(self.departure_searches, self.arrival_searches, window_size)
 
             return [
-                DistanceMapRequest(
+                DistanceMapRequest.model_construct(
                     departure_searches=departures,
                     arrival_searches=arrivals,
                     unions=self.unions,
@@ -147,7 +147,7 @@ class GeoHashRequest(TravelTimeRequest[GeoHashResponse]):
             chunks = split(self.departure_searches, self.arrival_searches, window_size)
 
             return [
-                GeoHashRequest(
+                GeoHashRequest.model_construct(
                     resolution=self.resolution,
                     properties=self.properties,
                     departure_searches=departures,
@@ -135,10 +135,10 @@ class GeoHashFastRequest(TravelTimeRequest[GeoHashResponse]):
             return [self]
         else:
             return [
-                GeoHashFastRequest(
+                GeoHashFastRequest.model_construct(
                     resolution=self.resolution,
                     properties=self.properties,
-                    arrival_searches=GeoHashFastArrivalSearches(
+                    arrival_searches=GeoHashFastArrivalSearches.model_construct(
                         one_to_many=one_to_many, many_to_one=many_to_one
                     ),
                     unions=self.unions,
@@ -153,7 +153,7 @@ class H3Request(TravelTimeRequest[H3Response]):
             chunks = split(self.departure_searches, self.arrival_searches, window_size)
 
             return [
-                H3Request(
+                H3Request.model_construct(
                     resolution=self.resolution,
                     properties=self.properties,
                     departure_searches=departures,
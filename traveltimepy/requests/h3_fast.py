@@ -129,10 +129,10 @@ class H3FastRequest(TravelTimeRequest[H3Response]):
             return [self]
         else:
             return [
-                H3FastRequest(
+                H3FastRequest.model_construct(
                     resolution=self.resolution,
                     properties=self.properties,
-                    arrival_searches=H3FastArrivalSearches(
+                    arrival_searches=H3FastArrivalSearches.model_construct(
                         one_to_many=one_to_many, many_to_one=many_to_one
                     ),
                     unions=self.unions,
@@ -95,7 +95,9 @@ class PostcodesRequest(TravelTimeRequest[PostcodesResponse]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            PostcodesRequest(departure_searches=departures, arrival_searches=arrivals)
+            PostcodesRequest.model_construct(
+                departure_searches=departures, arrival_searches=arrivals
+            )
             for departures, arrivals in split(
                 self.departure_searches, self.arrival_searches, window_size
             )
@@ -72,7 +72,7 @@ class PostcodesSectorsRequest(TravelTimeRequest[PostcodesSectorsResponse]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            PostcodesSectorsRequest(
+            PostcodesSectorsRequest.model_construct(
                 departure_searches=departures, arrival_searches=arrivals
             )
             for departures, arrivals in split(
@@ -97,7 +97,7 @@ class PostcodesDistrictsRequest(TravelTimeRequest[PostcodesDistrictsResponse]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            PostcodesDistrictsRequest(
+            PostcodesDistrictsRequest.model_construct(
                 departure_searches=departures, arrival_searches=arrivals
             )
             for departures, arrivals in split(
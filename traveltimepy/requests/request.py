@@ -1,18 +1,65 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Generic
+from typing import List, Optional, Tuple, Type, TypeVar, Generic
 
 from pydantic import BaseModel
 
+from traveltimepy.cache import ResponseCache
+
 T = TypeVar("T")
 
 
 class TravelTimeRequest(ABC, BaseModel, Generic[T]):
     @abstractmethod
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
+        """Split into parts of at most `window_size` searches of each kind.
+
+        Parts are built with `model_construct`, reusing this request's already validated
+        searches and locations without validating them again.
+        """
+        pass
+
+    def split_searches_by_locations(
+        self, window_size: int, max_locations: int
+    ) -> List[TravelTimeRequest]:
+        """Split into parts of at most `window_size` searches that also reference at
+        most `max_locations` location IDs in total, where the request's searches
+        reference locations.
+
+        Requests whose searches do not reference locations are split by
+        `window_size` only.
+        """
+        return self.split_searches(window_size)
+
+    def to_json(self) -> str:
+        """Request body, identical to `model_dump_json()` but possibly built from
+        fragments serialized once for every part of a split request."""
+        return self.model_dump_json()
+
+    def split_cached_searches(
+        self, cache: ResponseCache
+    ) -> Tuple[Optional[TravelTimeRequest], Optional[T]]:
+        """Split into a request for the searches whose results are not in `cache` and a
+        response holding the cached results.
+
+        Either is None when there is nothing to send or nothing cached. Requests that do
+        not support caching individual searches are sent whole.
+        """
+        return self, None
+
+    def cache_search_results(self, cache: ResponseCache, response: T) -> None:
+        """Store the result of every search of this request in `cache`."""
         pass
 
     @abstractmethod
     def merge(self, responses: List[T]) -> T:
         pass
+
+    def merge_as(self, response_class: Type[T], responses: List[T]) -> T:
+        """Merge `responses` into one response of `response_class`.
+
+        Requests answered with more than one response class override it, so that the
+        requested class is returned even when there are no responses to merge.
+        """
+        return self.merge(responses)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from pydantic.main import BaseModel
 
@@ -15,7 +15,7 @@ from traveltimepy.requests.transportation import (
 )
 from traveltimepy.requests.request import TravelTimeRequest
 from traveltimepy.responses.routes import RoutesResponse
-from traveltimepy.itertools import split, flatten
+from traveltimepy.itertools import split, split_weighted, flatten
 
 
 class RoutesArrivalSearch(BaseModel):
@@ -88,6 +88,14 @@ class RoutesDepartureSearch(BaseModel):
     snapping: Optional[Snapping] = None
 
 
+def _referenced_locations(
+    search: Union[RoutesDepartureSearch, RoutesArrivalSearch],
+) -> int:
+    if isinstance(search, RoutesDepartureSearch):
+        return len(search.arrival_location_ids) + 1
+    return len(search.departure_location_ids) + 1
+
+
 class RoutesRequest(TravelTimeRequest[RoutesResponse]):
     """Calculates A to B routes with turn-by-turn directions between specific locations.
     Best used for navigation and route visualization rather than catchment analysis.
@@ -103,15 +111,34 @@ class RoutesRequest(TravelTimeRequest[RoutesResponse]):
     arrival_searches: List[RoutesArrivalSearch]
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
+        return self._parts(
+            split(self.departure_searches, self.arrival_searches, window_size)
+        )
+
+    def split_searches_by_locations(
+        self, window_size: int, max_locations: int
+    ) -> List[TravelTimeRequest]:
+        return self._parts(
+            split_weighted(
+                self.departure_searches,
+                self.arrival_searches,
+                window_size,
+                max_locations,
+                _referenced_locations,
+            )
+        )
+
+    def _parts(
+        self,
+        chunks: List[Tuple[List[RoutesDepartureSearch], List[RoutesArrivalSearch]]],
+    ) -> List[TravelTimeRequest]:
         return [
-            RoutesRequest(
+            RoutesRequest.model_construct(
                 locations=self.locations,
                 departure_searches=departures,
                 arrival_searches=arrivals,
             )
-            for departures, arrivals in split(
-                self.departure_searches, self.arrival_searches, window_size
-            )
+            for departures, arrivals in chunks
         ]
 
     def merge(self, responses: List[RoutesResponse]) -> RoutesResponse:
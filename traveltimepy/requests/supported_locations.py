@@ -10,7 +10,7 @@ class SupportedLocationsRequest(TravelTimeRequest[SupportedLocationsResponse]):
     locations: List[Location]
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
-        return [SupportedLocationsRequest(locations=self.locations)]
+        return [SupportedLocationsRequest.model_construct(locations=self.locations)]
 
     def merge(
         self, responses: List[SupportedLocationsResponse]
@@ -1,12 +1,17 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
+from pydantic import PrivateAttr, TypeAdapter
 from pydantic.main import BaseModel
 
 from traveltimepy.requests.common import Location, FullRange, Property, Snapping
+from traveltimepy.requests.fragments import (
+    LocationFragments,
+    shared_location_fragments,
+)
 from traveltimepy.requests.request import TravelTimeRequest
 from traveltimepy.responses.time_filter import TimeFilterResponse
-from traveltimepy.itertools import split, flatten
+from traveltimepy.itertools import split, split_weighted, flatten, select
 from traveltimepy.requests.transportation import (
     PublicTransport,
     Driving,
@@ -88,6 +93,30 @@ class TimeFilterDepartureSearch(BaseModel):
     snapping: Optional[Snapping] = None
 
 
+def _referenced_locations(
+    search: Union[TimeFilterDepartureSearch, TimeFilterArrivalSearch],
+) -> int:
+    if isinstance(search, TimeFilterDepartureSearch):
+        return len(search.arrival_location_ids) + 1
+    return len(search.departure_location_ids) + 1
+
+
+_DEPARTURE_SEARCHES = TypeAdapter(List[TimeFilterDepartureSearch])
+_ARRIVAL_SEARCHES = TypeAdapter(List[TimeFilterArrivalSearch])
+
+
+def _location_ids(
+    searches: List[Union[TimeFilterDepartureSearch, TimeFilterArrivalSearch]],
+) -> Iterator[str]:
+    for search in searches:
+        if isinstance(search, TimeFilterDepartureSearch):
+            yield search.departure_location_id
+            yield from search.arrival_location_ids
+        else:
+            yield search.arrival_location_id
+            yield from search.departure_location_ids
+
+
 class TimeFilterRequest(TravelTimeRequest[TimeFilterResponse]):
     """Full-featured distance matrix endpoint with comprehensive configurability
     including specific departure/arrival times, range searches, and all transport modes.
@@ -101,18 +130,61 @@ class TimeFilterRequest(TravelTimeRequest[TimeFilterResponse]):
     locations: List[Location]
     departure_searches: List[TimeFilterDepartureSearch]
     arrival_searches: List[TimeFilterArrivalSearch]
+    _fragments: Optional[LocationFragments] = PrivateAttr(default=None)
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
-        return [
-            TimeFilterRequest(
-                locations=self.locations,
+        return self._parts(
+            split(self.departure_searches, self.arrival_searches, window_size)
+        )
+
+    def split_searches_by_locations(
+        self, window_size: int, max_locations: int
+    ) -> List[TravelTimeRequest]:
+        return self._parts(
+            split_weighted(
+                self.departure_searches,
+                self.arrival_searches,
+                window_size,
+                max_locations,
+                _referenced_locations,
+            )
+        )
+
+    def _parts(
+        self,
+        chunks: List[
+            Tuple[List[TimeFilterDepartureSearch], List[TimeFilterArrivalSearch]]
+        ],
+    ) -> List[TravelTimeRequest]:
+        # Every part only carries the locations its searches reference
+        locations_by_id = {location.id: location for location in self.locations}
+        parts_locations = [
+            select(locations_by_id, _location_ids([*departures, *arrivals]))
+            for departures, arrivals in chunks
+        ]
+        fragments = shared_location_fragments(parts_locations)
+
+        parts: List[TravelTimeRequest] = []
+        for (departures, arrivals), locations in zip(chunks, parts_locations):
+            part = TimeFilterRequest.model_construct(
+                locations=locations,
                 departure_searches=departures,
                 arrival_searches=arrivals,
             )
-            for departures, arrivals in split(
-                self.departure_searches, self.arrival_searches, window_size
-            )
-        ]
+            part._fragments = fragments
+            parts.append(part)
+        return parts
+
+    def to_json(self) -> str:
+        if self._fragments is None:
+            return self.model_dump_json()
+        departure_searches = _DEPARTURE_SEARCHES.dump_json(self.departure_searches)
+        arrival_searches = _ARRIVAL_SEARCHES.dump_json(self.arrival_searches)
+        return (
+            f'{{"locations":{self._fragments.dump_list(self.locations)},'
+            f'"departure_searches":{departure_searches.decode()},'
+            f'"arrival_searches":{arrival_searches.decode()}}}'
+        )
 
     def merge(self, responses: List[TimeFilterResponse]) -> TimeFilterResponse:
         return TimeFilterResponse(
@@ -1,6 +1,9 @@
-from typing import List, Optional, Union
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from traveltimepy.requests.transportation import (
     PublicTransportFast,
@@ -12,10 +15,27 @@ from traveltimepy.requests.transportation import (
     DrivingFerryFast,
     DrivingPublicTransportFast,
 )
-from traveltimepy.requests.common import Location, Property, Snapping, ArrivalTimePeriod
+from traveltimepy import json_backend
+from traveltimepy.cache import ResponseCache
+from traveltimepy.requests.common import (
+    Location,
+    Property,
+    Snapping,
+    ArrivalTimePeriod,
+    Coordinates,
+)
+from traveltimepy.requests.fragments import (
+    LocationFragments,
+    shared_location_fragments,
+)
 from traveltimepy.requests.request import TravelTimeRequest
-from traveltimepy.responses.time_filter_fast import TimeFilterFastResponse
-from traveltimepy.itertools import split, flatten
+from traveltimepy.responses.time_filter_fast import (
+    TimeFilterFastResponse,
+    TimeFilterFastResult,
+    Location as ResultLocation,
+    Properties,
+)
+from traveltimepy.itertools import split, split_weighted, flatten, select
 
 
 class TimeFilterFastOneToMany(BaseModel):
@@ -101,6 +121,104 @@ class TimeFilterFastArrivalSearches(BaseModel):
     one_to_many: List[TimeFilterFastOneToMany]
 
 
+def _referenced_locations(
+    search: Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne],
+) -> int:
+    if isinstance(search, TimeFilterFastOneToMany):
+        return len(search.arrival_location_ids) + 1
+    return len(search.departure_location_ids) + 1
+
+
+def _search_locations(
+    search: Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne],
+) -> Tuple[str, List[str]]:
+    if isinstance(search, TimeFilterFastOneToMany):
+        return search.departure_location_id, search.arrival_location_ids
+    return search.arrival_location_id, search.departure_location_ids
+
+
+def _location_ids(
+    searches: List[Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne]],
+) -> Iterator[str]:
+    for search in searches:
+        location_id, other_ids = _search_locations(search)
+        yield location_id
+        yield from other_ids
+
+
+def _point(coords: Coordinates) -> Tuple[float, float]:
+    return coords.lat, coords.lng
+
+
+class _SearchCacheEntry:
+    """Cache key of a search and its result, identifying locations by coordinates so
+    that the result can be reused by searches naming their locations differently."""
+
+    def __init__(
+        self,
+        search: Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne],
+        coords: Dict[str, Tuple[float, float]],
+    ):
+        self.search = search
+        location_id, other_ids = _search_locations(search)
+        self.ids_by_point: Dict[Tuple[float, float], List[str]] = defaultdict(list)
+        for other_id in other_ids:
+            self.ids_by_point[coords[other_id]].append(other_id)
+
+        key = {
+            "type": type(search).__name__,
+            "location": coords[location_id],
+            "other_locations": sorted(self.ids_by_point),
+            "transportation": search.transportation.model_dump(mode="json"),
+            "travel_time": search.travel_time,
+            "properties": sorted(prop.value for prop in search.properties),
+            "arrival_time_period": search.arrival_time_period.value,
+            "snapping": (
+                search.snapping.model_dump(mode="json") if search.snapping else None
+            ),
+        }
+        self.key = hashlib.sha256(
+            f"time-filter/fast/search\n{json.dumps(key, sort_keys=True)}".encode()
+        ).hexdigest()
+
+    def encode(self, result: TimeFilterFastResult) -> bytes:
+        points = {
+            other_id: point
+            for point, other_ids in self.ids_by_point.items()
+            for other_id in other_ids
+        }
+        return json_backend.dumps(
+            {
+                "locations": [
+                    [
+                        *points[location.id],
+                        location.properties.model_dump(mode="json", exclude_none=True),
+                    ]
+                    for location in result.locations
+                ],
+                "unreachable": [points[other_id] for other_id in result.unreachable],
+            }
+        )
+
+    def decode(self, value: bytes) -> TimeFilterFastResult:
+        cached: Dict[str, Any] = json_backend.loads(value)
+        return TimeFilterFastResult(
+            search_id=self.search.id,
+            locations=[
+                ResultLocation(
+                    id=other_id, properties=Properties.model_validate(properties)
+                )
+                for lat, lng, properties in cached["locations"]
+                for other_id in self.ids_by_point[(lat, lng)]
+            ],
+            unreachable=[
+                other_id
+                for lat, lng in cached["unreachable"]
+                for other_id in self.ids_by_point[(lat, lng)]
+            ],
+        )
+
+
 class TimeFilterFastRequest(TravelTimeRequest[TimeFilterFastResponse]):
     """High-performance distance matrix endpoint optimized for large datasets with fewer
     configurable parameters but extremely low response times. Can handle up to 100,000
@@ -113,23 +231,137 @@ class TimeFilterFastRequest(TravelTimeRequest[TimeFilterFastResponse]):
 
     locations: List[Location]
     arrival_searches: TimeFilterFastArrivalSearches
+    _fragments: Optional[LocationFragments] = PrivateAttr(default=None)
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
-        return [
-            TimeFilterFastRequest(
-                locations=self.locations,
-                arrival_searches=TimeFilterFastArrivalSearches(
-                    one_to_many=one_to_many, many_to_one=many_to_one
-                ),
+        return self._parts(
+            split(
+                self.arrival_searches.one_to_many,
+                self.arrival_searches.many_to_one,
+                window_size,
             )
-            for one_to_many, many_to_one in split(
+        )
+
+    def split_searches_by_locations(
+        self, window_size: int, max_locations: int
+    ) -> List[TravelTimeRequest]:
+        return self._parts(
+            split_weighted(
                 self.arrival_searches.one_to_many,
                 self.arrival_searches.many_to_one,
                 window_size,
+                max_locations,
+                _referenced_locations,
             )
+        )
+
+    def _parts(
+        self,
+        chunks: List[
+            Tuple[List[TimeFilterFastOneToMany], List[TimeFilterFastManyToOne]]
+        ],
+    ) -> List[TravelTimeRequest]:
+        # Every part only carries the locations its searches reference
+        locations_by_id = {location.id: location for location in self.locations}
+        parts_locations = [
+            select(locations_by_id, _location_ids([*one_to_many, *many_to_one]))
+            for one_to_many, many_to_one in chunks
         ]
+        fragments = shared_location_fragments(parts_locations)
+
+        parts: List[TravelTimeRequest] = []
+        for (one_to_many, many_to_one), locations in zip(chunks, parts_locations):
+            part = TimeFilterFastRequest.model_construct(
+                locations=locations,
+                arrival_searches=TimeFilterFastArrivalSearches.model_construct(
+                    one_to_many=one_to_many, many_to_one=many_to_one
+                ),
+            )
+            part._fragments = fragments
+            parts.append(part)
+        return parts
+
+    def to_json(self) -> str:
+        if self._fragments is None:
+            return self.model_dump_json()
+        return (
+            f'{{"locations":{self._fragments.dump_list(self.locations)},'
+            f'"arrival_searches":{self.arrival_searches.model_dump_json()}}}'
+        )
+
+    def _search_cache_entries(self) -> Dict[str, _SearchCacheEntry]:
+        coords = {location.id: _point(location.coords) for location in self.locations}
+        searches: List[Union[TimeFilterFastOneToMany, TimeFilterFastManyToOne]] = [
+            *self.arrival_searches.one_to_many,
+            *self.arrival_searches.many_to_one,
+        ]
+        entries = {}
+        for search in searches:
+            try:
+                entries[search.id] = _SearchCacheEntry(search, coords)
+            except KeyError:
+                # Unknown location IDs are left for the API to report
+                continue
+        return entries
+
+    def split_cached_searches(
+        self, cache: ResponseCache
+    ) -> Tuple[Optional[TravelTimeRequest], Optional[TimeFilterFastResponse]]:
+        cached_results: List[TimeFilterFastResult] = []
+        for entry in self._search_cache_entries().values():
+            value = cache.get(entry.key)
+            if value is not None:
+                cached_results.append(entry.decode(value))
+
+        if not cached_results:
+            return self, None
+
+        cached = TimeFilterFastResponse(results=cached_results)
+        cached_ids = {result.search_id for result in cached_results}
+        one_to_many = [
+            search
+            for search in self.arrival_searches.one_to_many
+            if search.id not in cached_ids
+        ]
+        many_to_one = [
+            search
+            for search in self.arrival_searches.many_to_one
+            if search.id not in cached_ids
+        ]
+        if not one_to_many and not many_to_one:
+            return None, cached
+
+        return (
+            TimeFilterFastRequest.model_construct(
+                locations=self.locations,
+                arrival_searches=TimeFilterFastArrivalSearches.model_construct(
+                    one_to_many=one_to_many, many_to_one=many_to_one
+                ),
+            ),
+            cached,
+        )
+
+    def cache_search_results(
+        self, cache: ResponseCache, response: TimeFilterFastResponse
+    ) -> None:
+        entries = self._search_cache_entries()
+        for result in response.results:
+            entry = entries.get(result.search_id)
+            if entry is not None:
+                cache.set(entry.key, entry.encode(result))
 
     def merge(self, responses: List[TimeFilterFastResponse]) -> TimeFilterFastResponse:
+        # Results follow the order of the searches, whichever part or cache they come
+        # from, so that the same request always returns them in the same order
+        search_ids = [search.id for search in self.arrival_searches.one_to_many] + [
+            search.id for search in self.arrival_searches.many_to_one
+        ]
+        positions = {
+            search_id: position for position, search_id in enumerate(search_ids)
+        }
         return TimeFilterFastResponse(
-            results=flatten([response.results for response in responses])
+            results=sorted(
+                flatten([response.results for response in responses]),
+                key=lambda result: positions.get(result.search_id, len(positions)),
+            )
         )
@@ -1,7 +1,9 @@
-import math
 from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar, Optional, List, Union
+from typing import ClassVar, List, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
 
 try:
     from traveltimepy.proto import RequestsCommon_pb2  # type: ignore
@@ -15,6 +17,51 @@ except ImportError:
 
 from traveltimepy.requests.common import Coordinates
 
+# Fixed-point precision used by the proto API for destination deltas
+COORDINATES_MULTIPLIER = 10**5
+
+# Destinations as Coordinates or as an (N, 2) array of (lat, lng) rows
+ProtoDestinations = Union[Sequence[Coordinates], npt.NDArray[np.float64]]
+
+
+def destinations_to_array(destinations: ProtoDestinations) -> npt.NDArray[np.float64]:
+    """Convert destinations into an ``(N, 2)`` float64 array of ``(lat, lng)`` rows.
+
+    Arrays are used as is (no copy when they are already float64) and have their
+    latitude/longitude ranges checked in bulk, sequences of ``Coordinates`` are
+    converted in a single pass.
+    """
+    if isinstance(destinations, np.ndarray):
+        coords = np.asarray(destinations, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError(
+                f"Destination array must have shape (N, 2), got {coords.shape}."
+            )
+        if not np.all(np.abs(coords[:, 0]) <= 90):
+            raise ValueError("Latitude must be between -90 and 90.")
+        if not np.all(np.abs(coords[:, 1]) <= 180):
+            raise ValueError("Longitude must be between -180 and 180.")
+        return coords
+
+    return np.fromiter(
+        (value for coords in destinations for value in (coords.lat, coords.lng)),
+        dtype=np.float64,
+        count=2 * len(destinations),
+    ).reshape(-1, 2)
+
+
+def encode_location_deltas(
+    origin: Coordinates, destinations: ProtoDestinations
+) -> npt.NDArray[np.int32]:
+    """Encode destinations as interleaved ``[lat0, lng0, lat1, lng1, ...]`` deltas.
+
+    Each delta is ``round((coord - origin) * 10^5)``, computed for all destinations
+    at once. Rounding is half-to-even, the same as Python's ``round``.
+    """
+    coords = destinations_to_array(destinations)
+    deltas = np.rint((coords - (origin.lat, origin.lng)) * COORDINATES_MULTIPLIER)
+    return deltas.astype(np.int32).ravel()
+
 
 class RequestType(Enum):
     # single departure location and multiple arrival locations
@@ -119,7 +166,7 @@ class ProtoCountry(str, Enum):
 
 class TimeFilterFastProtoRequest:
     originCoordinate: Coordinates
-    destinationCoordinates: List[Coordinates]
+    destinationCoordinates: ProtoDestinations
     transportation: TimeFilterFastProtoTransportation
     travelTime: int
     requestType: RequestType
@@ -129,7 +176,7 @@ class TimeFilterFastProtoRequest:
     def __init__(
         self,
         origin_coordinate: Coordinates,
-        destination_coordinates: List[Coordinates],
+        destination_coordinates: ProtoDestinations,
         transportation: TimeFilterFastProtoTransportation,
         travel_time: int,
         request_type: RequestType,
@@ -144,6 +191,29 @@ class TimeFilterFastProtoRequest:
         self.country = country
         self.withDistance = with_distance
 
+    def split_destinations(self, shard_size: int) -> List["TimeFilterFastProtoRequest"]:
+        """Split into requests of at most ``shard_size`` destinations each, keeping
+        destination order."""
+        if shard_size < 1:
+            raise ValueError("Shard size must be at least 1.")
+
+        destinations = self.destinationCoordinates
+        if len(destinations) <= shard_size:
+            return [self]
+
+        return [
+            TimeFilterFastProtoRequest(
+                self.originCoordinate,
+                destinations[i : i + shard_size],
+                self.transportation,
+                self.travelTime,
+                self.requestType,
+                self.country,
+                self.withDistance,
+            )
+            for i in range(0, len(destinations), shard_size)
+        ]
+
     def get_request(self) -> "TimeFilterFastRequest_pb2.TimeFilterFastRequest":  # type: ignore
         if not PROTOBUF_AVAILABLE:
             raise ImportError(
@@ -152,7 +222,7 @@ class TimeFilterFastProtoRequest:
             )
         request = TimeFilterFastRequest_pb2.TimeFilterFastRequest()  # type: ignore
 
-        if self.requestType.ONE_TO_MANY:
+        if self.requestType == RequestType.ONE_TO_MANY:
             req = request.oneToManyRequest
 
             req.departureLocation.lat = self.originCoordinate.lat
@@ -201,11 +271,11 @@ class TimeFilterFastProtoRequest:
                 [TimeFilterFastRequest_pb2.TimeFilterFastRequest.Property.DISTANCES]  # type: ignore
             )
 
-        # Calculate and add location deltas
-        mult = math.pow(10, 5)
-        for destination in self.destinationCoordinates:
-            lat_delta = round((destination.lat - self.originCoordinate.lat) * mult)
-            lng_delta = round((destination.lng - self.originCoordinate.lng) * mult)
-            req.locationDeltas.extend([lat_delta, lng_delta])
+        # Calculate and add location deltas in one bulk extend
+        req.locationDeltas.extend(
+            encode_location_deltas(
+                self.originCoordinate, self.destinationCoordinates
+            ).tolist()
+        )
 
         return request
@@ -0,0 +1,84 @@
+from typing import List
+
+import numpy as np
+
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.requests.time_filter_proto import (
+    ProtoCountry,
+    ProtoDestinations,
+    RequestType,
+    TimeFilterFastProtoRequest,
+    TimeFilterFastProtoTransportation,
+    destinations_to_array,
+)
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
+
+
+class TimeFilterFastProtoMatrixRequest:
+    """Many-origin proto distance matrix, sent as one proto request per origin.
+
+    Attributes:
+        origin_coordinates: Origins, one matrix row each. For many_to_one requests
+            these are the arrival locations.
+        destination_coordinates: Destinations, one matrix column each, as an
+            ``(M, 2)`` array of ``(lat, lng)`` rows.
+        transportation: Transportation mode
+        travel_time: Maximum journey time in seconds
+        request_type: Type of request calculation
+        country: Specific country for the calculation
+        with_distance: Whether to include distance data in response
+    """
+
+    origin_coordinates: List[Coordinates]
+    destination_coordinates: np.ndarray
+    transportation: TimeFilterFastProtoTransportation
+    travel_time: int
+    request_type: RequestType
+    country: ProtoCountry
+    with_distance: bool
+
+    def __init__(
+        self,
+        origin_coordinates: ProtoDestinations,
+        destination_coordinates: ProtoDestinations,
+        transportation: TimeFilterFastProtoTransportation,
+        travel_time: int,
+        request_type: RequestType,
+        country: ProtoCountry,
+        with_distance: bool,
+    ):
+        self.origin_coordinates = [
+            Coordinates(lat=float(lat), lng=float(lng))
+            for lat, lng in destinations_to_array(origin_coordinates)
+        ]
+        # Converted once and shared by every row request
+        self.destination_coordinates = destinations_to_array(destination_coordinates)
+        self.transportation = transportation
+        self.travel_time = travel_time
+        self.request_type = request_type
+        self.country = country
+        self.with_distance = with_distance
+
+    def split_origins(self) -> List[TimeFilterFastProtoRequest]:
+        return [
+            TimeFilterFastProtoRequest(
+                origin,
+                self.destination_coordinates,
+                self.transportation,
+                self.travel_time,
+                self.request_type,
+                self.country,
+                self.with_distance,
+            )
+            for origin in self.origin_coordinates
+        ]
+
+    def merge(
+        self, responses: List[TimeFilterProtoColumnarResponse]
+    ) -> TimeFilterProtoMatrixResponse:
+        return TimeFilterProtoMatrixResponse.from_rows(
+            responses, len(self.destination_coordinates), self.with_distance
+        )
@@ -1,7 +1,7 @@
 import typing
 from datetime import datetime
 
-from typing import List, Optional
+from typing import List, Optional, Type, TypeVar
 
 from pydantic.main import BaseModel
 
@@ -23,9 +23,11 @@ from traveltimepy.requests.common import (
     Range,
 )
 from traveltimepy.requests.request import TravelTimeRequest
-from traveltimepy.responses.time_map import TimeMapResponse
+from traveltimepy.responses.time_map import TimeMapCompactResponse, TimeMapResponse
 from traveltimepy.itertools import split, flatten
 
+R = TypeVar("R", TimeMapResponse, TimeMapCompactResponse)
+
 
 class TimeMapDepartureSearch(BaseModel):
     """Creates travel time catchment area polygons showing all locations reachable from
@@ -171,7 +173,7 @@ class TimeMapRequest(TravelTimeRequest[TimeMapResponse]):
             return [self]
 
         return [
-            TimeMapRequest(
+            TimeMapRequest.model_construct(
                 departure_searches=departures,
                 arrival_searches=arrivals,
                 unions=self.unions,
@@ -183,7 +185,11 @@ class TimeMapRequest(TravelTimeRequest[TimeMapResponse]):
         ]
 
     def merge(self, responses: List[TimeMapResponse]) -> TimeMapResponse:
-        return TimeMapResponse(
+        return self.merge_as(TimeMapResponse, responses)
+
+    def merge_as(self, response_class: Type[R], responses: List[R]) -> R:
+        # Merges model and compact responses alike
+        return response_class(
             results=sorted(
                 flatten([response.results for response in responses]),
                 key=lambda res: res.search_id,
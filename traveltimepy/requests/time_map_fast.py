@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -11,7 +11,7 @@ from traveltimepy.requests.common import (
 )
 from traveltimepy.requests.level_of_detail import LevelOfDetail
 from traveltimepy.requests.request import TravelTimeRequest
-from traveltimepy.responses.time_map import TimeMapResponse
+from traveltimepy.responses.time_map import TimeMapCompactResponse, TimeMapResponse
 from traveltimepy.itertools import split, flatten
 from traveltimepy.requests.transportation import (
     PublicTransportFast,
@@ -24,6 +24,8 @@ from traveltimepy.requests.transportation import (
     DrivingPublicTransportFast,
 )
 
+R = TypeVar("R", TimeMapResponse, TimeMapCompactResponse)
+
 
 class TimeMapFastSearch(BaseModel):
     """Creates travel time catchment areas (isochrones) showing all locations reachable
@@ -130,8 +132,8 @@ class TimeMapFastRequest(TravelTimeRequest[TimeMapResponse]):
             return [self]
         else:
             return [
-                TimeMapFastRequest(
-                    arrival_searches=TimeMapFastArrivalSearches(
+                TimeMapFastRequest.model_construct(
+                    arrival_searches=TimeMapFastArrivalSearches.model_construct(
                         one_to_many=one_to_many, many_to_one=many_to_one
                     ),
                     unions=self.unions,
@@ -145,7 +147,11 @@ class TimeMapFastRequest(TravelTimeRequest[TimeMapResponse]):
             ]
 
     def merge(self, responses: List[TimeMapResponse]) -> TimeMapResponse:
-        return TimeMapResponse(
+        return self.merge_as(TimeMapResponse, responses)
+
+    def merge_as(self, response_class: Type[R], responses: List[R]) -> R:
+        # Merges model and compact responses alike
+        return response_class(
             results=sorted(
                 flatten([response.results for response in responses]),
                 key=lambda res: res.search_id,
@@ -11,8 +11,8 @@ class TimeMapFastGeojsonRequest(TravelTimeRequest[FeatureCollection]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            TimeMapFastGeojsonRequest(
-                arrival_searches=TimeMapFastArrivalSearches(
+            TimeMapFastGeojsonRequest.model_construct(
+                arrival_searches=TimeMapFastArrivalSearches.model_construct(
                     one_to_many=one_to_many, many_to_one=many_to_one
                 ),
             )
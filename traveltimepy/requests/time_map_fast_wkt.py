@@ -1,17 +1,22 @@
-from typing import List
+from typing import List, Type, TypeVar
 from traveltimepy.requests.request import TravelTimeRequest
 from traveltimepy.requests.time_map_fast import TimeMapFastArrivalSearches
-from traveltimepy.responses.time_map_wkt import TimeMapWKTResponse
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
 from traveltimepy.itertools import split, flatten
 
+W = TypeVar("W", TimeMapWKTResponse, TimeMapWKTLazyResponse)
+
 
 class TimeMapFastWKTRequest(TravelTimeRequest[TimeMapWKTResponse]):
     arrival_searches: TimeMapFastArrivalSearches
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            TimeMapFastWKTRequest(
-                arrival_searches=TimeMapFastArrivalSearches(
+            TimeMapFastWKTRequest.model_construct(
+                arrival_searches=TimeMapFastArrivalSearches.model_construct(
                     one_to_many=one_to_many, many_to_one=many_to_one
                 ),
             )
@@ -23,7 +28,11 @@ class TimeMapFastWKTRequest(TravelTimeRequest[TimeMapWKTResponse]):
         ]
 
     def merge(self, responses: List[TimeMapWKTResponse]) -> TimeMapWKTResponse:
-        return TimeMapWKTResponse(
+        return self.merge_as(TimeMapWKTResponse, responses)
+
+    def merge_as(self, response_class: Type[W], responses: List[W]) -> W:
+        # Merges parsed and lazy WKT responses alike
+        return response_class(
             results=sorted(
                 flatten([response.results for response in responses]),
                 key=lambda res: res.search_id,
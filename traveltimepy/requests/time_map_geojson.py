@@ -15,7 +15,7 @@ class TimeMapGeojsonRequest(TravelTimeRequest[FeatureCollection]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            TimeMapGeojsonRequest(
+            TimeMapGeojsonRequest.model_construct(
                 departure_searches=departures,
                 arrival_searches=arrivals,
             )
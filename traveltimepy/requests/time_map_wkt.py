@@ -1,12 +1,17 @@
-from typing import List
+from typing import List, Type, TypeVar
 from traveltimepy.requests.request import TravelTimeRequest
 from traveltimepy.requests.time_map import (
     TimeMapDepartureSearch,
     TimeMapArrivalSearch,
 )
-from traveltimepy.responses.time_map_wkt import TimeMapWKTResponse
+from traveltimepy.responses.time_map_wkt import (
+    TimeMapWKTLazyResponse,
+    TimeMapWKTResponse,
+)
 from traveltimepy.itertools import split, flatten
 
+W = TypeVar("W", TimeMapWKTResponse, TimeMapWKTLazyResponse)
+
 
 class TimeMapWktRequest(TravelTimeRequest[TimeMapWKTResponse]):
     departure_searches: List[TimeMapDepartureSearch]
@@ -14,14 +19,20 @@ class TimeMapWktRequest(TravelTimeRequest[TimeMapWKTResponse]):
 
     def split_searches(self, window_size: int) -> List[TravelTimeRequest]:
         return [
-            TimeMapWktRequest(departure_searches=departures, arrival_searches=arrivals)
+            TimeMapWktRequest.model_construct(
+                departure_searches=departures, arrival_searches=arrivals
+            )
             for departures, arrivals in split(
                 self.departure_searches, self.arrival_searches, window_size
             )
         ]
 
     def merge(self, responses: List[TimeMapWKTResponse]) -> TimeMapWKTResponse:
-        return TimeMapWKTResponse(
+        return self.merge_as(TimeMapWKTResponse, responses)
+
+    def merge_as(self, response_class: Type[W], responses: List[W]) -> W:
+        # Merges parsed and lazy WKT responses alike
+        return response_class(
             results=sorted(
                 flatten([response.results for response in responses]),
                 key=lambda res: res.search_id,
@@ -1,7 +1,17 @@
-from typing import List
+from dataclasses import dataclass
+from typing import Any, List, Optional
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel
 
+from traveltimepy.itertools import flatten
+
+from traveltimepy.requests.time_filter_proto import (
+    ProtoDestinations,
+    destinations_to_array,
+)
+
 
 class TimeFilterProtoResponse(BaseModel):
     """
@@ -12,3 +22,148 @@ class TimeFilterProtoResponse(BaseModel):
 
     travel_times: List[int]
     distances: List[int]
+
+    @classmethod
+    def from_proto(cls, properties: Any) -> "TimeFilterProtoResponse":
+        return cls(
+            travel_times=properties.travelTimes[:],
+            distances=properties.distances[:],
+        )
+
+    @classmethod
+    def merge(
+        cls, responses: List["TimeFilterProtoResponse"]
+    ) -> "TimeFilterProtoResponse":
+        return cls(
+            travel_times=flatten([response.travel_times for response in responses]),
+            distances=flatten([response.distances for response in responses]),
+        )
+
+
+@dataclass
+class TimeFilterProtoColumnarResponse:
+    """Proto time-filter results stored as int32 NumPy columns.
+
+    Values are copied element by element out of the protobuf message by
+    `np.fromiter`, which is the fastest copy protobuf's repeated fields allow as they
+    expose no buffer, but skips building and validating a list of Python ints. They
+    are in the same order as the request's destinations.
+
+    Attributes:
+        travel_times: Travel times in seconds for each destination, -1 if unreachable.
+        distances: Distances in meters for each destination, empty if not requested.
+    """
+
+    travel_times: npt.NDArray[np.int32]
+    distances: npt.NDArray[np.int32]
+
+    @classmethod
+    def from_proto(cls, properties: Any) -> "TimeFilterProtoColumnarResponse":
+        return cls(
+            travel_times=np.fromiter(
+                properties.travelTimes,
+                dtype=np.int32,
+                count=len(properties.travelTimes),
+            ),
+            distances=np.fromiter(
+                properties.distances,
+                dtype=np.int32,
+                count=len(properties.distances),
+            ),
+        )
+
+    @classmethod
+    def merge(
+        cls, responses: List["TimeFilterProtoColumnarResponse"]
+    ) -> "TimeFilterProtoColumnarResponse":
+        return cls(
+            travel_times=np.concatenate(
+                [response.travel_times for response in responses]
+            ),
+            distances=np.concatenate([response.distances for response in responses]),
+        )
+
+    def reachable_indices(self) -> npt.NDArray[np.intp]:
+        """Positions of the reachable destinations in the request's destination
+        order."""
+        return np.flatnonzero(self.travel_times >= 0)
+
+    def join(self, destinations: ProtoDestinations) -> np.ndarray:
+        """Join results back to the destinations they were requested for.
+
+        Args:
+            destinations: The destinations sent with the request, in the same order.
+
+        Returns:
+            Structured array with ``lat``, ``lng`` and ``travel_time`` fields, plus
+            ``distance`` when distances were requested. One row per destination.
+        """
+        coords = destinations_to_array(destinations)
+        if len(coords) != len(self.travel_times):
+            raise ValueError(
+                f"Expected {len(self.travel_times)} destinations, got {len(coords)}."
+            )
+
+        fields = [
+            ("lat", np.float64),
+            ("lng", np.float64),
+            ("travel_time", np.int32),
+        ]
+        if len(self.distances) > 0:
+            fields.append(("distance", np.int32))
+
+        joined = np.empty(len(coords), dtype=fields)
+        joined["lat"] = coords[:, 0]
+        joined["lng"] = coords[:, 1]
+        joined["travel_time"] = self.travel_times
+        if len(self.distances) > 0:
+            joined["distance"] = self.distances
+        return joined
+
+
+# Travel time and distance value for cells that cannot be reached
+UNREACHABLE = -1
+
+
+@dataclass
+class TimeFilterProtoMatrixResponse:
+    """Dense many-origin proto distance matrix.
+
+    Attributes:
+        travel_times: ``(N, M)`` int32 matrix of travel times in seconds, row ``i``
+            for origin ``i`` and column ``j`` for destination ``j``. Unreachable
+            cells hold ``UNREACHABLE``.
+        distances: ``(N, M)`` int32 matrix of distances in meters laid out the same
+            way, or None if distances were not requested.
+    """
+
+    travel_times: npt.NDArray[np.int32]
+    distances: Optional[npt.NDArray[np.int32]]
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: List[TimeFilterProtoColumnarResponse],
+        destinations_count: int,
+        with_distance: bool,
+    ) -> "TimeFilterProtoMatrixResponse":
+        travel_times = np.full(
+            (len(rows), destinations_count), UNREACHABLE, dtype=np.int32
+        )
+        distances = (
+            np.full((len(rows), destinations_count), UNREACHABLE, dtype=np.int32)
+            if with_distance
+            else None
+        )
+
+        for i, row in enumerate(rows):
+            travel_times[i] = row.travel_times
+            if distances is not None and len(row.distances) > 0:
+                distances[i] = row.distances
+
+        unreachable = travel_times < 0
+        travel_times[unreachable] = UNREACHABLE
+        if distances is not None:
+            distances[unreachable] = UNREACHABLE
+
+        return cls(travel_times=travel_times, distances=distances)
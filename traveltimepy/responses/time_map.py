@@ -1,6 +1,11 @@
-from typing import List
+from typing import Any, List, Union
 
+import numpy as np
+import numpy.typing as npt
+import pydantic_core
+from pydantic import ConfigDict, field_validator
 from pydantic.main import BaseModel
+from shapely.geometry import MultiPolygon, Polygon
 
 from traveltimepy.requests.common import Coordinates
 
@@ -36,3 +41,96 @@ class TimeMapResponse(BaseModel):
     """
 
     results: List[TimeMapResult]
+
+
+def _coordinate_array(points: Any) -> npt.NDArray[np.float64]:
+    if isinstance(points, np.ndarray):
+        return points
+    try:
+        return np.fromiter(
+            (value for point in points for value in (point["lat"], point["lng"])),
+            np.float64,
+            count=2 * len(points),
+        ).reshape(-1, 2)
+    except (KeyError, TypeError, ValueError) as e:
+        # Raised as ValueError for pydantic to report a ValidationError, as it does
+        # for Shape
+        raise ValueError(
+            f"Expected a list of coordinates with lat and lng, got: {points!r:.100}"
+        ) from e
+
+
+class CompactShape(BaseModel):
+    """Polygon shape with each boundary decoded into one float64 array.
+
+    Boundaries are `(N, 2)` arrays of latitude and longitude rows, built without
+    validating every vertex.
+
+    Attributes:
+        shell: Outer boundary coordinates forming the main polygon perimeter.
+        holes: Inner boundaries representing unreachable areas within the main shape.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    shell: npt.NDArray[np.float64]
+    holes: List[npt.NDArray[np.float64]]
+
+    @field_validator("shell", mode="before")
+    @classmethod
+    def decode_shell(cls, shell: Any) -> npt.NDArray[np.float64]:
+        return _coordinate_array(shell)
+
+    @field_validator("holes", mode="before")
+    @classmethod
+    def decode_holes(cls, holes: Any) -> List[npt.NDArray[np.float64]]:
+        return [_coordinate_array(hole) for hole in holes]
+
+    def to_shape(self) -> Shape:
+        """The same shape with a validated `Coordinates` model per vertex."""
+        return Shape(
+            shell=[Coordinates(lat=lat, lng=lng) for lat, lng in self.shell.tolist()],
+            holes=[
+                [Coordinates(lat=lat, lng=lng) for lat, lng in hole.tolist()]
+                for hole in self.holes
+            ],
+        )
+
+    def to_polygon(self) -> Polygon:
+        """The shape as a shapely polygon, with longitude as x and latitude as y."""
+        return Polygon(self.shell[:, ::-1], [hole[:, ::-1] for hole in self.holes])
+
+
+class TimeMapCompactResult(BaseModel):
+    """Catchment area calculation result for a single search operation, with compact
+    shapes.
+
+    Attributes:
+        search_id: Search identifier from the original request.
+        shapes: Collection of polygon shapes defining the reachable area.
+    """
+
+    search_id: str
+    shapes: List[CompactShape]
+
+    def to_multipolygon(self) -> MultiPolygon:
+        """All shapes of the result as one shapely multipolygon."""
+        return MultiPolygon([shape.to_polygon() for shape in self.shapes])
+
+
+class TimeMapCompactResponse(BaseModel):
+    """
+    Attributes:
+        results: List of all catchment area calculation results.
+    """
+
+    results: List[TimeMapCompactResult]
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: Union[str, bytes, bytearray], **kwargs: Any
+    ) -> "TimeMapCompactResponse":
+        # Validating the shapes from JSON hands each vertex to the array decoder
+        # through pydantic's JSON validation, which is twice as slow as decoding the
+        # whole body into Python values first
+        return cls.model_validate(pydantic_core.from_json(json_data), **kwargs)
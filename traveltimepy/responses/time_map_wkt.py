@@ -1,7 +1,16 @@
 from typing import Generic, List, Union, Dict, Any, TypeVar, Optional
-from pydantic import field_validator, BaseModel, Field
+from pydantic import field_validator, model_validator, BaseModel, Field, PrivateAttr
+from shapely.geometry.base import BaseGeometry
 
-from traveltimepy.wkt import WKTObject, parse_wkt
+from traveltimepy.wkt import (
+    WKTArray,
+    WKTObject,
+    geometry_arrays,
+    load_wkt,
+    load_wkt_many,
+    parse_wkt,
+    parse_wkt_many,
+)
 from traveltimepy.wkt.helper import print_indented
 
 Props = TypeVar("Props", bound=Union[Dict[str, Any], BaseModel])
@@ -14,7 +23,9 @@ class TimeMapWKTResult(BaseModel, Generic[Props]):
 
     @field_validator("shape", mode="before")
     @classmethod
-    def transform_shape(cls, shape: str) -> WKTObject:
+    def transform_shape(cls, shape: Union[str, WKTObject]) -> WKTObject:
+        if isinstance(shape, WKTObject):
+            return shape
         return parse_wkt(shape)
 
     def pretty_print(self, indent_level=0):
@@ -26,6 +37,89 @@ class TimeMapWKTResult(BaseModel, Generic[Props]):
 class TimeMapWKTResponse(BaseModel):
     results: List[TimeMapWKTResult]
 
+    @model_validator(mode="before")
+    @classmethod
+    def parse_shapes(cls, data: Any) -> Any:
+        """Decode the WKT shapes of all results at once before building them."""
+        if not isinstance(data, dict) or not isinstance(data.get("results"), list):
+            return data
+
+        results = data["results"]
+        indexes = [
+            i
+            for i, result in enumerate(results)
+            if isinstance(result, dict) and isinstance(result.get("shape"), str)
+        ]
+        shapes = parse_wkt_many([results[i]["shape"] for i in indexes])
+
+        results = list(results)
+        for i, shape in zip(indexes, shapes):
+            results[i] = {**results[i], "shape": shape}
+        return {**data, "results": results}
+
+    def pretty_print(self, indent_level=0):
+        print_indented("TIME-MAP WKT RESPONSE:", indent_level)
+        for result in self.results:
+            result.pretty_print(indent_level + 1)
+            print()
+
+
+class TimeMapWKTLazyResult(BaseModel, Generic[Props]):
+    """Catchment area of a single search kept as the WKT string sent by the API.
+
+    The string is only parsed, into a shapely geometry, when `geometry` is first
+    accessed, instead of building a pydantic model for every vertex. `arrays` gives the
+    same shape with every ring as one coordinate array, see `parse_wkt_arrays`.
+
+    Attributes:
+        search_id: Search identifier from the original request.
+        shape: WKT representation of the catchment area.
+        properties: Properties of the catchment area.
+    """
+
+    search_id: str
+    shape: str
+    properties: Optional[Props] = Field(None)
+    _geometry: Optional[BaseGeometry] = PrivateAttr(None)
+    _arrays: Optional[WKTArray] = PrivateAttr(None)
+
+    @property
+    def geometry(self) -> BaseGeometry:
+        """Shape parsed into a shapely geometry, parsed once on first access."""
+        if self._geometry is None:
+            self._geometry = load_wkt(self.shape)
+        return self._geometry
+
+    @property
+    def arrays(self) -> WKTArray:
+        """Shape as array-backed geometries, built from `geometry` on first access."""
+        if self._arrays is None:
+            self._arrays = geometry_arrays(self.geometry)
+        return self._arrays
+
+    def pretty_print(self, indent_level=0):
+        print_indented(f"SEARCH ID: {self.search_id}", indent_level)
+        print_indented(f"SHAPE: {self.shape}", indent_level)
+        print_indented(f"PROPERTIES: {self.properties}", indent_level)
+
+
+class TimeMapWKTLazyResponse(BaseModel):
+    results: List[TimeMapWKTLazyResult]
+
+    def load_geometries(self, workers: Optional[int] = None) -> List[BaseGeometry]:
+        """Parse the shapes of all results not parsed yet in one go and return the
+        geometry of every result.
+
+        Args:
+            workers: Threads decoding the shapes, None to only use threads for very
+                large responses (default: None)
+        """
+        pending = [result for result in self.results if result._geometry is None]
+        geometries = load_wkt_many([result.shape for result in pending], workers)
+        for result, geometry in zip(pending, geometries):
+            result._geometry = geometry
+        return [result.geometry for result in self.results]
+
     def pretty_print(self, indent_level=0):
         print_indented("TIME-MAP WKT RESPONSE:", indent_level)
         for result in self.results:
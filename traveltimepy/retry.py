@@ -0,0 +1,166 @@
+import random
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    stop_any,
+)
+from tenacity.stop import stop_base
+
+from traveltimepy.errors import TravelTimeApiError, TravelTimeServerError
+
+RATE_LIMITED_STATUS = 429
+
+
+@dataclass
+class RetryPolicy:
+    """How failed requests are retried.
+
+    Server errors (5xx) and, optionally, rate limited requests (429) are retried after
+    an exponentially growing wait: `initial_wait * multiplier ** retry`, capped at
+    `max_wait`. With jitter the wait is drawn uniformly between 0 and that value, so
+    that clients failing together do not retry together. A `Retry-After` header sent
+    by the server takes precedence over the computed wait, capped at `max_wait`.
+    Waits never run past `max_elapsed`: computed waits are shortened to the time left,
+    and retrying stops when the server asks to wait longer than that.
+
+    Attributes:
+        initial_wait: Seconds to wait before the first retry.
+        multiplier: Factor the wait grows by after every retry.
+        max_wait: Maximum wait between two attempts, in seconds.
+        jitter: Randomize waits between 0 and the computed wait.
+        max_elapsed: Stop retrying once this many seconds have passed since the first
+            attempt. None for no time limit.
+        retry_rate_limited: Also retry requests rejected with status 429.
+        respect_retry_after: Wait as long as the server's `Retry-After` header asks.
+    """
+
+    initial_wait: float = 0.5
+    multiplier: float = 2
+    max_wait: float = 30
+    jitter: bool = True
+    max_elapsed: Optional[float] = None
+    retry_rate_limited: bool = True
+    respect_retry_after: bool = True
+
+    def should_retry(self, exception: BaseException) -> bool:
+        if isinstance(exception, TravelTimeServerError):
+            return True
+        if self.retry_rate_limited and isinstance(exception, TravelTimeApiError):
+            return exception.status_code == RATE_LIMITED_STATUS
+        return False
+
+    def backoff(self, retry_number: int) -> float:
+        """Computed wait before the given retry, counting from 1."""
+        wait = min(
+            self.max_wait, self.initial_wait * self.multiplier ** (retry_number - 1)
+        )
+        return random.uniform(0, wait) if self.jitter else wait
+
+    def retry_after(self, retry_state: RetryCallState) -> Optional[float]:
+        """Wait asked for by the server for the failed attempt, capped at `max_wait`."""
+        if not self.respect_retry_after or retry_state.outcome is None:
+            return None
+        retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_wait)
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        wait = self.retry_after(retry_state)
+        if wait is None:
+            wait = self.backoff(retry_state.attempt_number)
+        if self.max_elapsed is not None:
+            remaining = self.max_elapsed - (retry_state.seconds_since_start or 0)
+            wait = max(0.0, min(wait, remaining))
+        return wait
+
+    def stop(self, retry_attempts: int) -> stop_base:
+        # First attempt is not a retry, that's why `+1`
+        stop: stop_base = stop_after_attempt(retry_attempts + 1)
+        if self.max_elapsed is not None:
+            stop = stop_any(
+                stop,
+                stop_after_delay(self.max_elapsed),
+                _stop_retry_after_overrun(self, self.max_elapsed),
+            )
+        return stop
+
+
+class _stop_retry_after_overrun(stop_base):
+    """Stop when the server asks to wait past `max_elapsed`, since retrying sooner than
+    it asks is pointless."""
+
+    def __init__(self, policy: RetryPolicy, max_elapsed: float):
+        self.policy = policy
+        self.max_elapsed = max_elapsed
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        retry_after = self.policy.retry_after(retry_state)
+        elapsed = retry_state.seconds_since_start or 0
+        return retry_after is not None and elapsed + retry_after > self.max_elapsed
+
+
+class RetryStats:
+    """Thread-safe count of retries per endpoint.
+
+    Attributes:
+        retries: Number of retries by endpoint name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries: Dict[str, int] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.retries.values())
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+
+    def __repr__(self) -> str:
+        return f"RetryStats(retries={self.retries})"
+
+
+def retrying(
+    policy: RetryPolicy, retry_attempts: int, stats: RetryStats, endpoint: str
+):
+    """Tenacity decorator retrying calls to `endpoint` according to `policy`, for both
+    regular and coroutine functions."""
+    return retry(
+        retry=retry_if_exception(policy.should_retry),
+        stop=policy.stop(retry_attempts),
+        wait=policy.wait,
+        before_sleep=lambda _: stats.record_retry(endpoint),
+    )
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait according to a `Retry-After` header, given either as seconds or
+    as an HTTP date."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
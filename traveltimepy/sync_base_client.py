@@ -1,18 +1,21 @@
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, Dict, TypeVar, Type, List, cast
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Optional,
+    Dict,
+    TypeVar,
+    Type,
+    List,
+    Callable,
+    Iterator,
+    Tuple,
+    Set,
+    cast,
+)
 
 import requests
 from pydantic import BaseModel, ValidationError
-from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from requests_ratelimiter import LimiterSession
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_none,
-    retry_if_exception_type,
-)
 
 try:
     from traveltimepy.proto import TimeFilterFastResponse_pb2  # type: ignore
@@ -23,25 +26,38 @@ except ImportError:
     PROTOBUF_AVAILABLE = False
     TimeFilterFastResponse_pb2 = None  # type: ignore
     GeohashFastResponse_pb2 = None  # type: ignore
+from traveltimepy import json_backend
 from traveltimepy.accept_type import AcceptType
-from traveltimepy.base_client import BaseClient, __version__
+from traveltimepy.base_client import BaseClient, P, __version__
+from traveltimepy.cache import ResponseCache
+from traveltimepy.connection_pool import ConnectionStats, CountingHTTPAdapter
 from traveltimepy.errors import (
     TravelTimeError,
     TravelTimeJsonError,
     TravelTimeServerError,
 )
+from traveltimepy.rate_limit import RateLimiter
 from traveltimepy.requests.request import TravelTimeRequest
+from traveltimepy.retry import RetryPolicy, parse_retry_after
 from traveltimepy.requests.time_filter_proto import (
     TimeFilterFastProtoRequest,
 )
+from traveltimepy.requests.time_filter_proto_matrix import (
+    TimeFilterFastProtoMatrixRequest,
+)
 from traveltimepy.requests.geohash_fast_proto import (
     GeohashFastProtoRequest,
 )
 from traveltimepy.responses.error import ResponseError
-from traveltimepy.responses.time_filter_proto import TimeFilterProtoResponse
 from traveltimepy.responses.geohash_fast_proto import GeohashFastProtoResponse
+from traveltimepy.responses.time_filter_proto import (
+    TimeFilterProtoColumnarResponse,
+    TimeFilterProtoMatrixResponse,
+)
 
 T = TypeVar("T", bound=BaseModel)
+A = TypeVar("A")
+R = TypeVar("R")
 
 
 class SyncBaseClient(BaseClient):
@@ -54,6 +70,33 @@ class SyncBaseClient(BaseClient):
         max_rpm: Maximum requests per minute for rate limiting (default: 60)
         use_ssl: Whether to use SSL for connections (default: True)
         split_large_requests: Split large requests into smaller requests for performance (default: True)
+        split_size: Maximum number of searches of each kind per split request (default: 10)
+        max_locations_per_part: Also balance split requests by the number of location IDs
+            their searches reference, keeping each below this count (default: None)
+        retry_policy: Backoff between retries, see RetryPolicy (default: exponential
+            backoff with jitter starting at 0.5 seconds, honoring Retry-After)
+        rate_limiter: Token bucket limiting the request rate, which can be shared with
+            other clients and processes (default: RateLimiter(per_minute=max_rpm))
+        proto_max_rpm: Maximum requests per minute to the proto time-filter endpoint,
+            limited separately from JSON endpoints. None for max_rpm, or to share
+            rate_limiter when one is given (default: None)
+        proto_rate_limiter: Token bucket for the proto time-filter endpoint, takes
+            precedence over proto_max_rpm (default: None)
+        geohash_proto_max_rpm: Maximum requests per minute to the proto geohash
+            endpoint. None to share the budget of the proto time-filter endpoint, which
+            is on the same host (default: None)
+        geohash_proto_rate_limiter: Token bucket for the proto geohash endpoint, takes
+            precedence over geohash_proto_max_rpm (default: None)
+        cache: Cache of JSON responses, looked up for every part of a split request
+            before sending it, e.g. InMemoryCache or SqliteCache (default: None)
+        search_cache: Cache of individual search results, looked up for every search
+            of time_filter_fast so that only uncached searches are sent (default: None)
+        max_concurrency: Maximum number of requests in flight at once, shared by all
+            endpoints and threads using this client (default: 10)
+        pool_connections: Number of hosts to keep connection pools for (default: 10)
+        pool_maxsize: Maximum number of connections kept open per host. Defaults to
+            max_concurrency so that every request in flight can reuse a connection.
+        keep_alive: Keep connections open for reuse by later requests (default: True)
         _host: API host (default: "api.traveltimeapp.com")
         _proto_host: Proto API host (default: "proto.api.traveltimeapp.com")
         _user_agent: User agent string for requests
@@ -68,6 +111,20 @@ class SyncBaseClient(BaseClient):
         max_rpm: int = 60,
         use_ssl: bool = True,
         split_large_requests: bool = True,
+        split_size: int = 10,
+        max_locations_per_part: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        proto_max_rpm: Optional[int] = None,
+        proto_rate_limiter: Optional[RateLimiter] = None,
+        geohash_proto_max_rpm: Optional[int] = None,
+        geohash_proto_rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        search_cache: Optional[ResponseCache] = None,
+        max_concurrency: int = 10,
+        pool_connections: int = 10,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: bool = True,
         _host: str = "api.traveltimeapp.com",
         _proto_host: str = "proto.api.traveltimeapp.com",
         _user_agent: str = f"Travel Time Python SDK {__version__}",
@@ -80,15 +137,45 @@ class SyncBaseClient(BaseClient):
             max_rpm=max_rpm,
             use_ssl=use_ssl,
             split_large_requests=split_large_requests,
+            split_size=split_size,
+            max_locations_per_part=max_locations_per_part,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            proto_max_rpm=proto_max_rpm,
+            proto_rate_limiter=proto_rate_limiter,
+            geohash_proto_max_rpm=geohash_proto_max_rpm,
+            geohash_proto_rate_limiter=geohash_proto_rate_limiter,
+            cache=cache,
+            search_cache=search_cache,
             _host=_host,
             _proto_host=_proto_host,
             _user_agent=_user_agent,
         )
 
-        self._session = self._create_rate_limited_session(max_rpm)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize or max_concurrency
+        self.keep_alive = keep_alive
+        self.connection_stats = ConnectionStats()
+        self._session = self._create_session()
+        # Long-lived pool for sending parts of split requests concurrently
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="traveltimepy"
+        )
+        # Futures submitted and not done yet, cancelled on close
+        self._futures: Set[Future] = set()
+        # Caps requests in flight across the executor and the callers' own threads
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
 
     def close(self):
-        """Close the requests session if it exists."""
+        """Close the requests session if it exists and shut down the request
+        executor."""
+        # Executor.shutdown only takes cancel_futures from Python 3.9
+        for future in list(self._futures):
+            future.cancel()
+        self._executor.shutdown(wait=True)
         if self._session:
             self._session.close()
 
@@ -98,23 +185,79 @@ class SyncBaseClient(BaseClient):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def _create_rate_limited_session(
-        self,
-        per_minute: float = 0,
-    ) -> LimiterSession:
-        session = LimiterSession(
-            per_minute=per_minute,
-            # Automatically handle rate limit responses
-            limit_statuses=[429],
-            per_host=True,
-        )
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
 
-        adapter = HTTPAdapter()
+        adapter = CountingHTTPAdapter(
+            self.connection_stats,
+            keep_alive=self.keep_alive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def _iter_concurrently(
+        self,
+        function: Callable[[A], R],
+        items: List[A],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[int, R]]:
+        """Apply `function` to every item on the shared executor, yielding `(index,
+        result)` pairs in completion order.
+
+        At most `max_in_flight` items (capped by `max_concurrency`) are submitted at a
+        time, the next one being submitted as soon as one completes. On the first error,
+        or when the iterator is closed early, items not yet started are cancelled.
+        """
+        limit = min(max_in_flight or self.max_concurrency, self.max_concurrency)
+        pending: Dict[Future, int] = {}
+        remaining = iter(enumerate(items))
+
+        def _submit_next() -> None:
+            next_item = next(remaining, None)
+            if next_item is not None:
+                index, item = next_item
+                future = self._executor.submit(function, item)
+                self._futures.add(future)
+                future.add_done_callback(self._futures.discard)
+                pending[future] = index
+
+        for _ in range(limit):
+            _submit_next()
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    _submit_next()
+                    yield index, future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _run_concurrently(
+        self,
+        function: Callable[[A], R],
+        items: List[A],
+        max_in_flight: Optional[int] = None,
+    ) -> List[R]:
+        """Apply `function` to every item on the shared executor and return the results
+        in item order.
+
+        A single item runs on the calling thread.
+        """
+        if len(items) == 1:
+            return [function(items[0])]
+
+        results: List[R] = cast(List[R], [None] * len(items))
+        for index, result in self._iter_concurrently(function, items, max_in_flight):
+            results[index] = result
+        return results
+
     def _make_request(
         self,
         method: str,
@@ -124,29 +267,52 @@ class SyncBaseClient(BaseClient):
         data: Optional[str] = None,
         params: Optional[Dict[str, str]] = None,
         auth: Optional[HTTPBasicAuth] = None,
+        cache_key: Optional[str] = None,
     ) -> T:
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
-        )
+        @self._retrying(self._endpoint_name(url))
         def _make_request_with_retry():
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                params=params,
-                auth=auth,
-                timeout=self.timeout,
-                verify=self.use_ssl,
-            )
-            return self._handle_response(response, response_class)
+            self.rate_limiter.acquire()
+            with self._request_slots:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    params=params,
+                    auth=auth,
+                    timeout=self.timeout,
+                    verify=self.use_ssl,
+                )
+            result = self._handle_response(response, response_class)
+            self._store_response(cache_key, response.content)
+            return result
 
         return _make_request_with_retry()
 
+    def _post_part(
+        self,
+        response_class: Type[T],
+        endpoint: str,
+        accept_type: AcceptType,
+        part: TravelTimeRequest,
+    ) -> T:
+        data = part.to_json()
+        cache_key = self._cache_key(endpoint, accept_type, data)
+        cached = self._cached_response(response_class, cache_key)
+        if cached is not None:
+            return cached
+
+        response = self._make_request(
+            method="POST",
+            url=self._build_url(endpoint),
+            headers=self._get_json_headers(accept_type),
+            response_class=response_class,
+            data=data,
+            cache_key=cache_key,
+        )
+        self._cache_search_results(part, response)
+        return response
+
     def _api_call_post(
         self,
         response_class: Type[T],
@@ -154,49 +320,47 @@ class SyncBaseClient(BaseClient):
         accept_type: AcceptType,
         request: TravelTimeRequest,
     ) -> T:
-        url = self._build_url(endpoint)
-        headers = self._get_json_headers(accept_type)
-
-        split_size = 10 if self.split_large_requests else 1
+        # Only searches without cached results are sent
+        uncached, cached = self._split_cached_searches(request)
+        if uncached is None:
+            return cast(T, cached)
 
         # Split requests and process concurrently
-        parts = request.split_searches(split_size)
+        parts = self._split_request(uncached)
 
-        if len(parts) == 1:
+        if len(parts) == 1 and cached is None:
             # Single request - no need for threading overhead
-            return self._make_request(
-                method="POST",
-                url=url,
-                headers=headers,
-                response_class=response_class,
-                data=parts[0].model_dump_json(),
-            )
-
-        # Multiple parts - send concurrently
-        responses = []
-        max_workers = min(len(parts), split_size)
+            return self._post_part(response_class, endpoint, accept_type, parts[0])
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(
-                    self._make_request,
-                    method="POST",
-                    url=url,
-                    headers=headers,
-                    response_class=response_class,
-                    data=part.model_dump_json(),
-                ): i
-                for i, part in enumerate(parts)
-            }
-
-            indexed_responses: List[T] = cast(List[T], [None] * len(parts))
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                indexed_responses[index] = future.result()
+        # Multiple parts - send concurrently on the shared executor
+        responses = self._run_concurrently(
+            lambda part: self._post_part(response_class, endpoint, accept_type, part),
+            parts,
+        )
 
-            responses = indexed_responses
+        return request.merge_as(
+            response_class, responses if cached is None else [cached, *responses]
+        )
 
-        return request.merge(responses)
+    def _api_call_post_iter(
+        self,
+        response_class: Type[T],
+        endpoint: str,
+        accept_type: AcceptType,
+        request: TravelTimeRequest,
+    ) -> Iterator[T]:
+        uncached, cached = self._split_cached_searches(request)
+        if cached is not None:
+            yield cached
+        if uncached is None:
+            return
+
+        # Each part is yielded as soon as it completes, without merging
+        for _, response in self._iter_concurrently(
+            lambda part: self._post_part(response_class, endpoint, accept_type, part),
+            self._split_request(uncached),
+        ):
+            yield response
 
     def _api_call_get(
         self,
@@ -216,23 +380,11 @@ class SyncBaseClient(BaseClient):
             params=params,
         )
 
-    def _api_call_proto(
-        self, req: TimeFilterFastProtoRequest
-    ) -> TimeFilterProtoResponse:
-        if not PROTOBUF_AVAILABLE:
-            raise ImportError(
-                "protobuf is required for proto API calls. "
-                "Install it with: pip install 'traveltimepy[proto]'"
-            )
-
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
-        )
-        def _make_proto_request():
+    def _make_proto_request(
+        self, req: TimeFilterFastProtoRequest, response_class: Type[P]
+    ) -> P:
+        @self._retrying("time-filter/fast/proto")
+        def _make_proto_request_with_retry():
             transportation_mode = self._get_transportation_mode(req.transportation)
 
             url = f"https://{self._proto_host}/api/v3/{req.country.value}/time-filter/fast/{transportation_mode}"
@@ -240,26 +392,67 @@ class SyncBaseClient(BaseClient):
             auth = HTTPBasicAuth(self.app_id, self.api_key)
             data = req.get_request().SerializeToString()
 
-            response = self._session.post(
-                url=url,
-                headers=headers,
-                data=data,
-                auth=auth,
-                timeout=self.timeout,
-                verify=self.use_ssl,
-            )
+            self.proto_rate_limiter.acquire()
+            with self._request_slots:
+                response = self._session.post(
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    auth=auth,
+                    timeout=self.timeout,
+                    verify=self.use_ssl,
+                )
 
             if response.status_code != 200:
                 self._handle_proto_error(response.status_code, response.headers)
             else:
                 response_body = TimeFilterFastResponse_pb2.TimeFilterFastResponse()  # type: ignore
                 response_body.ParseFromString(response.content)
-                return TimeFilterProtoResponse(
-                    travel_times=response_body.properties.travelTimes[:],
-                    distances=response_body.properties.distances[:],
-                )
+                return response_class.from_proto(response_body.properties)
+
+        return _make_proto_request_with_retry()
+
+    def _api_call_proto(
+        self,
+        req: TimeFilterFastProtoRequest,
+        response_class: Type[P],
+        shard_size: Optional[int] = None,
+    ) -> P:
+        if not PROTOBUF_AVAILABLE:
+            raise ImportError(
+                "protobuf is required for proto API calls. "
+                "Install it with: pip install 'traveltimepy[proto]'"
+            )
+
+        parts = req.split_destinations(shard_size) if shard_size is not None else [req]
+        if len(parts) == 1:
+            return self._make_proto_request(parts[0], response_class)
+
+        # Shards are sent concurrently and retried independently of each other
+        responses = self._run_concurrently(
+            lambda part: self._make_proto_request(part, response_class), parts
+        )
+        return response_class.merge(responses)
+
+    def _api_call_proto_matrix(
+        self, req: TimeFilterFastProtoMatrixRequest, max_concurrency: int
+    ) -> TimeFilterProtoMatrixResponse:
+        if not PROTOBUF_AVAILABLE:
+            raise ImportError(
+                "protobuf is required for proto API calls. "
+                "Install it with: pip install 'traveltimepy[proto]'"
+            )
 
-        return _make_proto_request()
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # One request per origin, at most `max_concurrency` of them in flight
+        responses = self._run_concurrently(
+            lambda row: self._make_proto_request(row, TimeFilterProtoColumnarResponse),
+            req.split_origins(),
+            max_in_flight=max_concurrency,
+        )
+        return req.merge(responses)
 
     def _api_call_geohash_proto(
         self, req: GeohashFastProtoRequest
@@ -270,13 +463,7 @@ class SyncBaseClient(BaseClient):
                 "Install it with: pip install 'traveltimepy[proto]'"
             )
 
-        @retry(
-            retry=retry_if_exception_type(TravelTimeServerError),
-            stop=stop_after_attempt(
-                self.retry_attempts + 1
-            ),  # First attempt is not a retry, that's why `+1`
-            wait=wait_none(),  # No wait between retries
-        )
+        @self._retrying("geohash/fast/proto")
         def _make_geohash_proto_request():
             transportation_mode = self._get_transportation_mode(req.transportation)
 
@@ -285,14 +472,16 @@ class SyncBaseClient(BaseClient):
             auth = HTTPBasicAuth(self.app_id, self.api_key)
             data = req.get_request().SerializeToString()
 
-            response = self._session.post(
-                url=url,
-                headers=headers,
-                data=data,
-                auth=auth,
-                timeout=self.timeout,
-                verify=self.use_ssl,
-            )
+            self.geohash_proto_rate_limiter.acquire()
+            with self._request_slots:
+                response = self._session.post(
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    auth=auth,
+                    timeout=self.timeout,
+                    verify=self.use_ssl,
+                )
 
             if response.status_code != 200:
                 self._handle_proto_error(response.status_code, response.headers)
@@ -311,21 +500,21 @@ class SyncBaseClient(BaseClient):
     def _handle_response(
         self, response: requests.Response, response_class: Type[T]
     ) -> T:
-        try:
-            json_data = response.json()
-        except requests.exceptions.JSONDecodeError:
-            json_data = {"error": "Invalid JSON response"}
-
         if response.status_code != 200:
             try:
-                error = ResponseError.model_validate_json(json.dumps(json_data))
+                json_data = json_backend.loads(response.content)
+            except json_backend.DecodeError:
+                json_data = {"error": "Invalid JSON response"}
+            try:
+                error = ResponseError.model_validate(json_data)
             except ValidationError:
                 raise TravelTimeError(
                     f"Server returned status code {response.status_code} "
                     f"with unexpected response: {json_data}"
                 )
+            retry_after = parse_retry_after(response.headers)
             if response.status_code >= 500:
-                raise TravelTimeServerError(error.description)
+                raise TravelTimeServerError(error.description, retry_after=retry_after)
             else:
                 raise TravelTimeJsonError(
                     status_code=response.status_code,
@@ -333,6 +522,8 @@ class SyncBaseClient(BaseClient):
                     description=error.description,
                     documentation_link=error.documentation_link,
                     additional_info=error.additional_info,
+                    retry_after=retry_after,
                 )
         else:
-            return response_class.model_validate(json_data)
+            # Validated straight from the body, without an intermediate dict tree
+            return response_class.model_validate_json(response.content)
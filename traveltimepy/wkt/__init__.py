@@ -1,7 +1,10 @@
 """Module with WKT wrapper for shapely."""
 
 from traveltimepy.wkt.parsing import (
+    load_wkt,
+    load_wkt_many,
     parse_wkt,
+    parse_wkt_many,
 )
 
 from traveltimepy.wkt.geometries import (
@@ -15,6 +18,17 @@ from traveltimepy.wkt.geometries import (
     GeometryType,
 )
 
+from traveltimepy.wkt.arrays import (
+    parse_wkt_arrays,
+    geometry_arrays,
+    WKTArray,
+    LineStringArray,
+    PolygonArray,
+    MultiPointArray,
+    MultiLineStringArray,
+    MultiPolygonArray,
+)
+
 __all__ = [
     "WKTObject",
     "PointModel",
@@ -24,5 +38,16 @@ __all__ = [
     "MultiLineStringModel",
     "MultiPolygonModel",
     "GeometryType",
+    "load_wkt",
+    "load_wkt_many",
     "parse_wkt",
+    "parse_wkt_many",
+    "parse_wkt_arrays",
+    "geometry_arrays",
+    "WKTArray",
+    "LineStringArray",
+    "PolygonArray",
+    "MultiPointArray",
+    "MultiLineStringArray",
+    "MultiPolygonArray",
 ]
@@ -0,0 +1,238 @@
+from typing import List, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from shapely.geometry import (
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
+from shapely.geometry.base import BaseGeometry
+
+from traveltimepy.requests.common import Coordinates
+from traveltimepy.wkt.geometries import (
+    GeometryType,
+    LineStringModel,
+    MultiLineStringModel,
+    MultiPointModel,
+    MultiPolygonModel,
+    PointModel,
+    PolygonModel,
+)
+from traveltimepy.wkt.helper import print_indented
+from traveltimepy.wkt.parsing import load_wkt
+
+CoordinateArray = npt.NDArray[np.float64]
+
+
+def _line_points(coordinates: CoordinateArray) -> List[PointModel]:
+    return [
+        PointModel(coordinates=Coordinates(lat=x, lng=y))
+        for x, y in coordinates.tolist()
+    ]
+
+
+class LineStringArray:
+    """Line string stored as one `(N, 2)` float64 array of its WKT `(x, y)` pairs.
+
+    Attributes:
+        coordinates: Vertices of the line string.
+    """
+
+    type = GeometryType.LINESTRING
+
+    def __init__(self, coordinates: CoordinateArray):
+        self.coordinates = coordinates
+        self._model: Optional[LineStringModel] = None
+
+    @property
+    def model(self) -> LineStringModel:
+        """The same line string as a `LineStringModel`, built on first access."""
+        if self._model is None:
+            self._model = LineStringModel(coordinates=_line_points(self.coordinates))
+        return self._model
+
+    def pretty_print(self, indent_level=0):
+        self.model.pretty_print(indent_level)
+
+
+class PolygonArray:
+    """Polygon storing each of its rings as one `(N, 2)` float64 array.
+
+    Attributes:
+        exterior: Vertices of the outer ring.
+        interiors: Vertices of every hole.
+    """
+
+    type = GeometryType.POLYGON
+
+    def __init__(self, exterior: CoordinateArray, interiors: List[CoordinateArray]):
+        self.exterior = exterior
+        self.interiors = interiors
+        self._model: Optional[PolygonModel] = None
+
+    @property
+    def model(self) -> PolygonModel:
+        """The same polygon as a `PolygonModel`, built on first access."""
+        if self._model is None:
+            self._model = PolygonModel(
+                exterior=LineStringModel(coordinates=_line_points(self.exterior)),
+                interiors=[
+                    LineStringModel(coordinates=_line_points(interior))
+                    for interior in self.interiors
+                ],
+            )
+        return self._model
+
+    def pretty_print(self, indent_level=0):
+        self.model.pretty_print(indent_level)
+
+
+class MultiPointArray:
+    """Points stored as one `(N, 2)` float64 array of their WKT `(x, y)` pairs.
+
+    Attributes:
+        coordinates: The points.
+    """
+
+    type = GeometryType.MULTIPOINT
+
+    def __init__(self, coordinates: CoordinateArray):
+        self.coordinates = coordinates
+        self._model: Optional[MultiPointModel] = None
+
+    @property
+    def model(self) -> MultiPointModel:
+        """The same points as a `MultiPointModel`, built on first access."""
+        if self._model is None:
+            self._model = MultiPointModel(
+                coordinates=[
+                    PointModel(coordinates=Coordinates(lat=y, lng=x))
+                    for x, y in self.coordinates.tolist()
+                ]
+            )
+        return self._model
+
+    def pretty_print(self, indent_level=0):
+        self.model.pretty_print(indent_level)
+
+
+class MultiLineStringArray:
+    """Line strings each stored as one `(N, 2)` float64 array.
+
+    Attributes:
+        coordinates: The line strings.
+    """
+
+    type = GeometryType.MULTILINESTRING
+
+    def __init__(self, coordinates: List[LineStringArray]):
+        self.coordinates = coordinates
+        self._model: Optional[MultiLineStringModel] = None
+
+    @property
+    def model(self) -> MultiLineStringModel:
+        """The same line strings as a `MultiLineStringModel`, built on first access."""
+        if self._model is None:
+            self._model = MultiLineStringModel(
+                coordinates=[line.model for line in self.coordinates]
+            )
+        return self._model
+
+    def pretty_print(self, indent_level=0):
+        self.model.pretty_print(indent_level)
+
+
+class MultiPolygonArray:
+    """Polygons storing each of their rings as one `(N, 2)` float64 array.
+
+    Attributes:
+        coordinates: The polygons.
+    """
+
+    type = GeometryType.MULTIPOLYGON
+
+    def __init__(self, coordinates: List[PolygonArray]):
+        self.coordinates = coordinates
+        self._model: Optional[MultiPolygonModel] = None
+
+    @property
+    def model(self) -> MultiPolygonModel:
+        """The same polygons as a `MultiPolygonModel`, built on first access."""
+        if self._model is None:
+            self._model = MultiPolygonModel(
+                coordinates=[polygon.model for polygon in self.coordinates]
+            )
+        return self._model
+
+    def pretty_print(self, indent_level=0):
+        print_indented("MULTIPOLYGON:", indent_level)
+        for polygon in self.coordinates:
+            polygon.pretty_print(indent_level + 1)
+
+
+WKTArray = Union[
+    PointModel,
+    LineStringArray,
+    PolygonArray,
+    MultiPointArray,
+    MultiLineStringArray,
+    MultiPolygonArray,
+]
+
+
+def _split_coordinates(geometries: np.ndarray) -> List[CoordinateArray]:
+    # Coordinates of all geometries are read at once, each array is a view of them
+    coordinates = shapely.get_coordinates(geometries)
+    counts = shapely.get_num_coordinates(geometries)
+    return np.split(coordinates, np.cumsum(counts)[:-1])
+
+
+def _polygon_arrays(polygons: np.ndarray) -> List[PolygonArray]:
+    rings, polygon_index = shapely.get_rings(polygons, return_index=True)
+    ring_arrays = _split_coordinates(rings)
+    ring_ends = np.cumsum(np.bincount(polygon_index, minlength=len(polygons)))
+
+    arrays = []
+    start = 0
+    for end in ring_ends.tolist():
+        arrays.append(PolygonArray(ring_arrays[start], ring_arrays[start + 1 : end]))
+        start = end
+    return arrays
+
+
+def parse_wkt_arrays(wkt_str: str) -> WKTArray:
+    """Parse a WKT string into array-backed geometries.
+
+    Every ring or line is a single `(N, 2)` float64 array, so memory grows by 16 bytes
+    per vertex instead of a pydantic model per vertex. Each geometry's `model` builds
+    the same model `parse_wkt` returns, on first access. Points have no coordinate
+    sequence to store and are returned as `PointModel`.
+    """
+    return geometry_arrays(load_wkt(wkt_str))
+
+
+def geometry_arrays(geometry: BaseGeometry) -> WKTArray:
+    """Same as `parse_wkt_arrays` for a geometry already loaded by `load_wkt`."""
+    if isinstance(geometry, Point):
+        return PointModel(coordinates=Coordinates(lat=geometry.y, lng=geometry.x))
+    if isinstance(geometry, LineString):
+        return LineStringArray(shapely.get_coordinates(geometry))
+    if isinstance(geometry, Polygon):
+        return _polygon_arrays(np.array([geometry]))[0]
+    if isinstance(geometry, MultiPoint):
+        return MultiPointArray(shapely.get_coordinates(geometry))
+    if isinstance(geometry, MultiLineString):
+        return MultiLineStringArray(
+            [
+                LineStringArray(coordinates)
+                for coordinates in _split_coordinates(shapely.get_parts(geometry))
+            ]
+        )
+    if isinstance(geometry, MultiPolygon):
+        return MultiPolygonArray(_polygon_arrays(shapely.get_parts(geometry)))
+    raise AssertionError(f"Unhandled geometry type: {type(geometry)}")
@@ -1,6 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import singledispatch
-from typing import Union
+from typing import List, Optional, Sequence, Union
 
+import numpy as np
+import shapely
 from shapely import wkt, GEOSException
 from shapely.geometry import (
     Point,
@@ -131,6 +135,66 @@ def _parse_multi_polygon(geometry: MultiPolygon) -> MultiPolygonModel:
     return MultiPolygonModel(coordinates=polygons)
 
 
+def load_wkt(wkt_str: str) -> BaseGeometry:
+    """Parse a WKT string into a shapely geometry of a supported type."""
+    try:
+        geometry = wkt.loads(wkt_str)
+    except GEOSException:
+        raise InvalidWKTStringError(wkt_str)
+
+    _check_empty(geometry)
+
+    if type(geometry) not in SUPPORTED_GEOMETRY_TYPES:
+        raise InvalidGeometryTypeError(geometry)
+
+    return geometry
+
+
+# Total WKT length from which `load_wkt_many` spreads parsing over threads by default
+PARALLEL_PARSE_MIN_CHARS = 8 * 1024 * 1024
+
+
+def _default_workers(wkt_strs: Sequence[str]) -> int:
+    if sum(len(wkt_str) for wkt_str in wkt_strs) < PARALLEL_PARSE_MIN_CHARS:
+        return 1
+    return min(os.cpu_count() or 1, 8)
+
+
+def load_wkt_many(
+    wkt_strs: Sequence[str], workers: Optional[int] = None
+) -> List[BaseGeometry]:
+    """Parse WKT strings into shapely geometries, checked as in `load_wkt`.
+
+    The strings are decoded by a single vectorized `shapely.from_wkt` call, which runs
+    in C without holding the GIL. With more than one worker the strings are split into
+    chunks decoded in parallel threads. By default threads are only used once the
+    strings reach `PARALLEL_PARSE_MIN_CHARS` characters in total.
+    """
+    strings = np.array(wkt_strs, dtype=object)
+    if workers is None:
+        workers = _default_workers(wkt_strs)
+
+    try:
+        if workers > 1 and len(strings) > 1:
+            with ThreadPoolExecutor(workers) as executor:
+                chunks = np.array_split(strings, min(workers, len(strings)))
+                geometries = np.concatenate(
+                    list(executor.map(shapely.from_wkt, chunks))
+                )
+        else:
+            geometries = shapely.from_wkt(strings)
+    except GEOSException:
+        # Parse one by one to raise the error of the first invalid string
+        return [load_wkt(wkt_str) for wkt_str in wkt_strs]
+
+    for geometry in geometries:
+        _check_empty(geometry)
+        if type(geometry) not in SUPPORTED_GEOMETRY_TYPES:
+            raise InvalidGeometryTypeError(geometry)
+
+    return list(geometries)
+
+
 def parse_wkt(
     wkt_str: str,
 ) -> Union[
@@ -141,14 +205,18 @@ def parse_wkt(
     MultiLineStringModel,
     MultiPolygonModel,
 ]:
-    try:
-        geometry = wkt.loads(wkt_str)
-    except GEOSException:
-        raise InvalidWKTStringError(wkt_str)
-
-    _check_empty(geometry)
+    return _parse_geometry(load_wkt(wkt_str))
 
-    if type(geometry) not in SUPPORTED_GEOMETRY_TYPES:
-        raise InvalidGeometryTypeError(geometry)
 
-    return _parse_geometry(geometry)
+def parse_wkt_many(wkt_strs: Sequence[str], workers: Optional[int] = None) -> List[
+    Union[
+        PointModel,
+        LineStringModel,
+        PolygonModel,
+        MultiPointModel,
+        MultiLineStringModel,
+        MultiPolygonModel,
+    ]
+]:
+    """Same as `parse_wkt` for many strings, decoded at once by `load_wkt_many`."""
+    return [_parse_geometry(geometry) for geometry in load_wkt_many(wkt_strs, workers)]